@@ -0,0 +1,117 @@
+"""
+Compare the memory, filter speed and disparity reshape speed of the
+employment data stored as object strings, as the workbook is read, with a
+categorical and downcast copy of every column, and with the fact and
+dimension tables ``prepare_dataset`` splits it into, at several data
+scales.
+
+Run with ``python benchmarks/bench_column_layout.py``.
+"""
+import argparse
+from common import scale_up, time_call
+from bench_filter_dataframe import filter_combinations, mask_filter
+from data_loader import load_employment_data
+from dataset_registry import PERCENTAGE_COLUMN, prepare_dataset
+from filter_index import build_filter_index, select_rows
+from reshape import spread_pivot
+
+# Keys the disparity reshape groups by while the coordinates are on every
+# row, and once they are in the region dimension
+WIDE_KEYS = ['Region', 'Year', 'Occupation Type', 'Latitude', 'Longitude']
+STAR_KEYS = ['Region', 'Year', 'Occupation Type']
+
+
+def layout_timings(df, combinations, keys, repeat, dimensions=None):
+    """
+    Measure the memory of a dataframe and the time to filter and reshape
+    it.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The employment dataframe in the layout to measure.
+    combinations : list of dict
+        The filter combinations to run.
+    keys : list of str
+        The columns the disparity reshape groups by.
+    repeat : int
+        Number of timed runs per measurement.
+    dimensions : dict, optional
+        The dimension tables of the layout, counted in its memory.
+
+    Returns
+    -------
+    dict
+        The memory in bytes and the seconds taken to build the filter
+        index, to run every combination through the index, to run every
+        combination as equality masks and to spread the genders into
+        columns.
+    """
+    index = build_filter_index(df)
+
+    def run_indexed():
+        for filters in combinations:
+            select_rows(df, index, **filters)
+
+    def run_mask():
+        for filters in combinations:
+            mask_filter(df, **filters)
+
+    return {
+        "bytes": int(df.memory_usage(deep=True).sum()) + sum(
+            int(dimension.memory_usage(deep=True).sum())
+            for dimension in (dimensions or {}).values()
+        ),
+        "index": time_call(build_filter_index, df, repeat=repeat),
+        "indexed": time_call(run_indexed, repeat=repeat),
+        "mask": time_call(run_mask, repeat=repeat),
+        "reshape": time_call(
+            spread_pivot, df, keys, "Gender", PERCENTAGE_COLUMN,
+            repeat=repeat
+        ),
+    }
+
+
+def main():
+    """
+    Measure every layout at each scale.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scales", type=int, nargs="+",
+                        default=[1, 100, 1000],
+                        help="scale factors for the synthetic dataset")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="number of timed runs per measurement")
+    args = parser.parse_args()
+
+    # The workbook as read, with a Python string per label and row
+    raw, _ = load_employment_data()
+    combinations = filter_combinations(raw)
+
+    print(f"{'scale':>6}{'rows':>9}{'layout':>13}{'memory (MB)':>13}"
+          f"{'index (s)':>11}{'indexed (s)':>13}{'mask (s)':>10}"
+          f"{'reshape (s)':>13}")
+    for scale in args.scales:
+        object_df = scale_up(raw, scale)
+        fact, dimensions = prepare_dataset(object_df)
+        # Every row carrying its dimension attributes, as categoricals
+        wide = fact
+        for key, dimension in dimensions.items():
+            wide = wide.join(dimension, on=key)
+        layouts = {
+            "object": (object_df, WIDE_KEYS, None),
+            "categorical": (wide, WIDE_KEYS, None),
+            "star": (fact, STAR_KEYS, dimensions),
+        }
+        for name, (df, keys, tables) in layouts.items():
+            result = layout_timings(
+                df, combinations, keys, args.repeat, tables
+            )
+            print(f"{scale:>6}{len(df):>9}{name:>13}"
+                  f"{result['bytes'] / 1e6:>13.2f}{result['index']:>11.4f}"
+                  f"{result['indexed']:>13.4f}{result['mask']:>10.4f}"
+                  f"{result['reshape']:>13.4f}")
+
+
+if __name__ == "__main__":
+    main()
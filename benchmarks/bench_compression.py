@@ -0,0 +1,99 @@
+"""
+Measure the bytes on the wire and the CPU cost of compressing the Dash
+layout, dependencies and chart callback responses at several gzip levels
+and brotli qualities.
+
+Run with ``python benchmarks/bench_compression.py``.
+"""
+import argparse
+import time
+import common  # noqa: F401
+from app import app
+from bench_dropdown_change import request_body
+from compression import compress
+
+# Encodings and settings to compare
+SETTINGS = [
+    ("gzip", {"gzip_level": 1}),
+    ("gzip", {"gzip_level": 6}),
+    ("gzip", {"gzip_level": 9}),
+    ("br", {"brotli_quality": 1}),
+    ("br", {"brotli_quality": 4}),
+    ("br", {"brotli_quality": 11}),
+]
+
+# Chart callbacks to measure, with the filters they are called with
+CHART_REQUESTS = {
+    "bar-chart": "region-dropdown.value",
+    "pie-chart": "region-dropdown.value",
+    "disparity-map": "year-dropdown.value",
+    "stacked-area-chart": "region-dropdown.value",
+}
+
+
+def collect_payloads():
+    """
+    Fetch the uncompressed layout, dependencies and full chart figures.
+
+    Returns
+    -------
+    dict
+        The response body of each request, keyed by a short label.
+    """
+    client = app.server.test_client()
+    identity = {"Accept-Encoding": "identity"}
+    payloads = {
+        "layout": client.get("/_dash-layout", headers=identity).data,
+        "dependencies": client.get(
+            "/_dash-dependencies", headers=identity
+        ).data,
+    }
+    dependencies = client.get("/_dash-dependencies").get_json()
+    state = {
+        "region-dropdown.value": "England",
+        "year-dropdown.value": "2021",
+        "occupation-type-slider.value": 3,
+    }
+    for chart_id, changed_prop in CHART_REQUESTS.items():
+        dependency = next(
+            d for d in dependencies
+            if d["output"].startswith(f"..{chart_id}.figure")
+        )
+        payloads[chart_id] = client.post(
+            "/_dash-update-component", headers=identity,
+            json=request_body(dependency, changed_prop, state)
+        ).data
+    return payloads
+
+
+def main():
+    """
+    Report the compressed size and compression CPU time of each payload.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=50,
+                        help="compressions to average the CPU time over")
+    args = parser.parse_args()
+
+    payloads = collect_payloads()
+    labels = [
+        f"{encoding} {next(iter(options.values()))}"
+        for encoding, options in SETTINGS
+    ]
+    print(f"{'payload':<20}{'raw':>8}"
+          + "".join(f"{label:>16}" for label in labels))
+    for name, data in payloads.items():
+        cells = []
+        for encoding, options in SETTINGS:
+            start = time.process_time()
+            for _ in range(args.repeat):
+                compressed = compress(data, encoding, **options)
+            cpu_ms = (time.process_time() - start) * 1000 / args.repeat
+            cells.append(f"{len(compressed):>8} {cpu_ms:>5.2f}ms")
+        print(f"{name:<20}{len(data):>8}"
+              + "".join(f"{cell:>16}" for cell in cells))
+    print("cells: compressed bytes and CPU time per request")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Compare the startup cost of parsing the employment workbook with loading
+the columnar cache built by ``data_loader.load_employment_data``.
+
+Run with ``python benchmarks/bench_data_loader.py``.
+"""
+import argparse
+import shutil
+import tempfile
+from pathlib import Path
+import pandas as pd
+from common import scale_up, time_call
+from config import DATA_PATH
+from data_loader import load_employment_data
+
+
+def benchmark_workbook(data_path, cache_dir, repeat):
+    """
+    Time the xlsx parse, the first (converting) load and the cached load of
+    one workbook.
+
+    Parameters
+    ----------
+    data_path : Path
+        The workbook to load.
+    cache_dir : Path
+        An empty directory to use as the cache.
+    repeat : int
+        Number of timed runs for the repeated measurements.
+
+    Returns
+    -------
+    dict
+        Timings in seconds for each load path.
+    """
+    xlsx_time = time_call(pd.read_excel, data_path, repeat=repeat)
+    # The first load parses the workbook and writes the cache file
+    convert_time = time_call(
+        load_employment_data, data_path, cache_dir, repeat=1
+    )
+    cached_time = time_call(
+        load_employment_data, data_path, cache_dir, repeat=repeat
+    )
+    return {
+        "xlsx": xlsx_time,
+        "first load": convert_time,
+        "cached": cached_time,
+    }
+
+
+def main():
+    """
+    Run the loader benchmark on the shipped workbook and a scaled-up copy.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scale", type=int, default=100,
+                        help="scale factor for the synthetic workbook")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="number of timed runs per measurement")
+    args = parser.parse_args()
+
+    work_dir = Path(tempfile.mkdtemp(prefix="bench-loader-"))
+    try:
+        # Write the scaled-up workbook next to its own cache directory
+        scaled_path = work_dir / "employment_scaled.xlsx"
+        scale_up(pd.read_excel(DATA_PATH), args.scale).to_excel(
+            scaled_path, index=False
+        )
+        workbooks = {
+            "shipped": DATA_PATH,
+            f"{args.scale}x synthetic": scaled_path,
+        }
+
+        print(f"{'dataset':<18}{'xlsx (s)':>12}{'first (s)':>12}"
+              f"{'cached (s)':>12}{'speed-up':>10}")
+        for label, path in workbooks.items():
+            timings = benchmark_workbook(
+                path, work_dir / f"cache-{path.stem}", args.repeat
+            )
+            print(f"{label:<18}{timings['xlsx']:>12.4f}"
+                  f"{timings['first load']:>12.4f}"
+                  f"{timings['cached']:>12.4f}"
+                  f"{timings['xlsx'] / timings['cached']:>9.1f}x")
+    finally:
+        shutil.rmtree(work_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+"""
+Measure the server work caused by changing a filter in the app: how many
+``/_dash-update-component`` requests the browser sends, the server CPU
+time spent answering them and the bytes returned.
+
+The browser's behaviour is replayed with Flask's test client: every
+server-side callback with the changed property as an input is requested
+once, as Dash's renderer would. Clientside callbacks cost no request and
+are counted separately.
+
+Run with ``python benchmarks/bench_dropdown_change.py``.
+"""
+import argparse
+import json
+import time
+import common  # noqa: F401
+from app import app
+from dataset_registry import get_dataset_version
+
+# Property values of a session with every filter selected
+SESSION_STATE = {
+    "region-dropdown.value": "England",
+    "year-dropdown.value": "2021",
+    "occupation-type-slider.value": 3,
+    "summary-stats.is_open": True,
+    "session-id.data": "benchmark-session",
+}
+
+# Graphs whose figures are patched once their layout is in the browser
+CHART_IDS = ("bar-chart", "pie-chart", "disparity-map", "stacked-area-chart")
+
+
+def split_outputs(output):
+    """
+    Split a dependency's output string into output specifications.
+
+    Parameters
+    ----------
+    output : str
+        The output string from ``/_dash-dependencies``, e.g.
+        "..a.children...b.style.." for several outputs.
+
+    Returns
+    -------
+    list of dict
+        The id and property of each output.
+    """
+    if output.startswith(".."):
+        outputs = output[2:-2].split("...")
+    else:
+        outputs = [output]
+    specs = []
+    for item in outputs:
+        component_id, prop = item.rsplit(".", 1)
+        specs.append({"id": component_id, "property": prop})
+    return specs
+
+
+def request_body(dependency, changed_prop, state):
+    """
+    Build the body the renderer sends to run a callback.
+
+    Parameters
+    ----------
+    dependency : dict
+        The callback's entry in ``/_dash-dependencies``.
+    changed_prop : str
+        The "id.property" that changed.
+    state : dict
+        Current property values, keyed by "id.property".
+
+    Returns
+    -------
+    dict
+        The JSON body for ``/_dash-update-component``.
+    """
+    def value_of(item):
+        if item["id"].startswith("{"):
+            # Pattern-matching inputs match no components in this session
+            return []
+        key = f"{item['id']}.{item['property']}"
+        return {"id": item["id"], "property": item["property"],
+                "value": state.get(key)}
+
+    outputs = split_outputs(dependency["output"])
+    return {
+        "output": dependency["output"],
+        "outputs": outputs if len(outputs) > 1 else outputs[0],
+        "inputs": [value_of(item) for item in dependency["inputs"]],
+        "state": [value_of(item) for item in dependency["state"]],
+        "changedPropIds": [changed_prop],
+    }
+
+
+def measure_change(client, dependencies, changed_prop, value):
+    """
+    Replay the callbacks triggered by one property change.
+
+    Parameters
+    ----------
+    client : FlaskClient
+        The test client of the app's server.
+    dependencies : list of dict
+        The app's callback dependencies.
+    changed_prop : str
+        The "id.property" that changed.
+    value : object
+        The new value of the property.
+
+    Returns
+    -------
+    dict
+        The number of server requests and clientside callbacks, the server
+        CPU time in milliseconds and the response bytes, with the CPU time
+        of each callback under "callbacks", keyed by its output.
+    """
+    state = dict(SESSION_STATE, **{changed_prop: value})
+    triggered = [
+        dependency for dependency in dependencies
+        if any(f"{item['id']}.{item['property']}" == changed_prop
+               for item in dependency["inputs"])
+    ]
+    server_side = [d for d in triggered if not d.get("clientside_function")]
+
+    callbacks = {}
+    response_bytes = 0
+    for dependency in server_side:
+        cpu_start = time.process_time()
+        response = client.post(
+            "/_dash-update-component",
+            json=request_body(dependency, changed_prop, state)
+        )
+        callbacks[dependency["output"]] = (
+            (time.process_time() - cpu_start) * 1000
+        )
+        response_bytes += len(response.data)
+
+    return {
+        "requests": len(server_side),
+        "clientside": len(triggered) - len(server_side),
+        "cpu_ms": sum(callbacks.values()),
+        "bytes": response_bytes,
+        "callbacks": callbacks,
+    }
+
+
+def average_runs(runs):
+    """
+    Average the measurements of repeated changes.
+
+    Parameters
+    ----------
+    runs : list of dict
+        The results of ``measure_change``.
+
+    Returns
+    -------
+    dict
+        The mean of each measurement and of each callback's CPU time.
+    """
+    result = {
+        key: sum(run[key] for run in runs) / len(runs)
+        for key in ("requests", "clientside", "cpu_ms", "bytes")
+    }
+    result["callbacks"] = {
+        output: sum(run["callbacks"][output] for run in runs) / len(runs)
+        for output in runs[0]["callbacks"]
+    }
+    return result
+
+
+def main():
+    """
+    Report the server work for each filter change, after warming up.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=20,
+                        help="number of changes to average over")
+    parser.add_argument("--by-callback", action="store_true",
+                        help="also print the CPU time of each callback")
+    parser.add_argument("--json", action="store_true",
+                        help="print the results as JSON")
+    args = parser.parse_args()
+
+    client = app.server.test_client()
+    dependencies = client.get("/_dash-dependencies").get_json()
+    # The browser already holds the layout of every chart's figure
+    for chart_id in CHART_IDS:
+        SESSION_STATE[f"{chart_id}-layout.data"] = get_dataset_version()
+    changes = {
+        "region-dropdown.value": ["Wales", "Scotland"],
+        "year-dropdown.value": ["2022", "2023"],
+        "occupation-type-slider.value": [4, 5],
+    }
+
+    results = {}
+    for changed_prop, values in changes.items():
+        # Warm the caches, then average over alternating values
+        measure_change(client, dependencies, changed_prop, values[0])
+        runs = [
+            measure_change(client, dependencies, changed_prop,
+                           values[i % len(values)])
+            for i in range(args.repeat)
+        ]
+        results[changed_prop] = average_runs(runs)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{'change':<32}{'requests':>10}{'clientside':>12}"
+          f"{'CPU (ms)':>10}{'bytes':>10}")
+    for changed_prop, result in results.items():
+        print(f"{changed_prop:<32}{result['requests']:>10.0f}"
+              f"{result['clientside']:>12.0f}{result['cpu_ms']:>10.2f}"
+              f"{result['bytes']:>10.0f}")
+        if args.by_callback:
+            for output, cpu_ms in result["callbacks"].items():
+                print(f"    {output[:64]:<64}{cpu_ms:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Measure chart callback throughput with and without the figure cache, with
+several simulated users picking random selections at once.
+
+Run with ``python benchmarks/bench_figure_cache.py``.
+"""
+import argparse
+import random
+import threading
+import time
+import common  # noqa: F401
+import figure_cache
+from app import app
+from bench_dropdown_change import CHART_IDS, request_body, split_outputs
+from dataset_registry import get_dataset, get_dataset_version
+from figure_cache import clear_figure_cache, figure_cache_stats
+
+# Figure outputs of the four chart callbacks, each of which also outputs
+# the layout store of its chart
+CHART_OUTPUTS = tuple(f"{chart_id}.figure" for chart_id in CHART_IDS)
+
+
+def run_users(client_factory, dependencies, users, requests_per_user, seed):
+    """
+    Send random chart requests from several threads at once.
+
+    Parameters
+    ----------
+    client_factory : callable
+        Returns a new test client for each user.
+    dependencies : list of dict
+        The chart callbacks' dependencies.
+    users : int
+        Number of concurrent users.
+    requests_per_user : int
+        Number of chart requests each user sends.
+    seed : int
+        Seed of the random selections.
+
+    Returns
+    -------
+    float
+        The wall-clock time in seconds to answer every request.
+    """
+    dataset = get_dataset()
+    regions = list(dataset["Region"].unique())
+    years = [str(year) for year in dataset["Year"].unique()]
+    occupations = list(range(1, 10))
+    # The browser already holds the layout of every chart's figure, so the
+    # callbacks answer with the data of the selection
+    layouts = {
+        f"{chart_id}-layout.data": get_dataset_version()
+        for chart_id in CHART_IDS
+    }
+
+    def user(number):
+        client = client_factory()
+        rng = random.Random(seed + number)
+        for _ in range(requests_per_user):
+            state = dict(layouts, **{
+                "region-dropdown.value": rng.choice(regions),
+                "year-dropdown.value": rng.choice(years),
+                "occupation-type-slider.value": rng.choice(occupations),
+            })
+            dependency = rng.choice(dependencies)
+            changed_prop = (
+                f"{dependency['inputs'][0]['id']}."
+                f"{dependency['inputs'][0]['property']}"
+            )
+            client.post(
+                "/_dash-update-component",
+                json=request_body(dependency, changed_prop, state)
+            )
+
+    threads = [
+        threading.Thread(target=user, args=(number,))
+        for number in range(users)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def main():
+    """
+    Report chart requests per second with the cache disabled and enabled.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, nargs="+", default=[1, 8],
+                        help="numbers of concurrent users to simulate")
+    parser.add_argument("--requests", type=int, default=50,
+                        help="chart requests sent by each user")
+    args = parser.parse_args()
+
+    client = app.server.test_client()
+    dependencies = [
+        dependency
+        for dependency in client.get("/_dash-dependencies").get_json()
+        if any(f"{output['id']}.{output['property']}" in CHART_OUTPUTS
+               for output in split_outputs(dependency["output"]))
+    ]
+    cache_size = figure_cache.FIGURE_CACHE_SIZE
+
+    print(f"{'users':>6}{'uncached (req/s)':>18}{'cached (req/s)':>16}"
+          f"{'hits':>8}{'misses':>8}")
+    for users in args.users:
+        total = users * args.requests
+        figure_cache.FIGURE_CACHE_SIZE = 0
+        clear_figure_cache()
+        uncached = run_users(app.server.test_client, dependencies,
+                             users, args.requests, seed=users)
+        figure_cache.FIGURE_CACHE_SIZE = cache_size
+        clear_figure_cache()
+        cached = run_users(app.server.test_client, dependencies,
+                           users, args.requests, seed=users)
+        stats = figure_cache_stats()
+        print(f"{users:>6}{total / uncached:>18.1f}{total / cached:>16.1f}"
+              f"{stats['hits']:>8}{stats['misses']:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Compare the original copy-then-mask filtering with the indexed filter
+engine behind ``filter_dataframe``, across every filter combination.
+
+Run with ``python benchmarks/bench_filter_dataframe.py``.
+"""
+import argparse
+import itertools
+from common import scale_up, time_call
+from dataset_registry import get_dataset
+from filter_index import build_filter_index, select_rows
+
+
+def mask_filter(df, region=None, year=None,
+                occupation_prefix=None, gender=None):
+    """
+    Filter the dataframe the way ``filter_dataframe`` originally did, by
+    copying it and applying a boolean mask per filter.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The dataframe to filter.
+    region : str, optional
+        The region to filter by.
+    year : int, optional
+        The year to filter by.
+    occupation_prefix : str, optional
+        The occupation prefix to filter by.
+    gender : str, optional
+        The gender to filter by.
+
+    Returns
+    -------
+    pd.DataFrame
+        The filtered dataframe.
+    """
+    filtered_df = df.copy()
+    if region:
+        filtered_df = filtered_df[filtered_df['Region'] == region]
+    if year:
+        filtered_df = filtered_df[filtered_df['Year'] == int(year)]
+    if occupation_prefix:
+        filtered_df = filtered_df[
+            filtered_df['Occupation Type'].str.startswith(occupation_prefix)
+        ]
+    if gender:
+        filtered_df = filtered_df[filtered_df['Gender'] == gender]
+    return filtered_df
+
+
+def filter_combinations(df):
+    """
+    List every combination of filters the app can request, with each
+    filter either unset or set to one of the dataset's values.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The employment dataframe.
+
+    Returns
+    -------
+    list of dict
+        Keyword arguments for the filter functions.
+    """
+    regions = [None] + sorted(df["Region"].unique())
+    years = [None] + sorted(df["Year"].unique())
+    prefixes = [None] + [f"{code}:" for code in range(1, 10)]
+    genders = [None, "Male", "Female"]
+    return [
+        dict(region=region, year=year, occupation_prefix=prefix,
+             gender=gender)
+        for region, year, prefix, gender in itertools.product(
+            regions, years, prefixes, genders
+        )
+    ]
+
+
+def main():
+    """
+    Time both filter paths over all filter combinations at several scales.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 100],
+                        help="scale factors for the synthetic dataset")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="number of timed runs per measurement")
+    args = parser.parse_args()
+
+    print(f"{'scale':>6}{'rows':>10}{'combos':>8}{'index build (s)':>17}"
+          f"{'mask (s)':>11}{'indexed (s)':>13}{'speed-up':>10}")
+    for scale in args.scales:
+        df = scale_up(get_dataset(), scale)
+        # Only filter on the original regions so the combinations are the
+        # same at every scale
+        combinations = filter_combinations(get_dataset())
+        build_time = time_call(build_filter_index, df, repeat=args.repeat)
+        index = build_filter_index(df)
+
+        def run_mask():
+            for filters in combinations:
+                mask_filter(df, **filters)
+
+        def run_indexed():
+            for filters in combinations:
+                select_rows(df, index, **filters)
+
+        mask_time = time_call(run_mask, repeat=args.repeat)
+        indexed_time = time_call(run_indexed, repeat=args.repeat)
+        print(f"{scale:>6}{len(df):>10}{len(combinations):>8}"
+              f"{build_time:>17.4f}{mask_time:>11.4f}{indexed_time:>13.4f}"
+              f"{mask_time / indexed_time:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Compare pivot_table with the NumPy reshape behind ``prepare_disparity_df``
+at several data scales.
+
+Run with ``python benchmarks/bench_prepare_disparity_df.py``.
+"""
+import argparse
+from common import scale_up, time_call
+from dataset_registry import get_dataset, PERCENTAGE_COLUMN
+from reshape import spread_pivot
+
+INDEX_COLUMNS = ['Region', 'Year', 'Occupation Type']
+
+
+def pivot(df):
+    """
+    Spread the genders into columns with pivot_table.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The employment dataframe.
+
+    Returns
+    -------
+    pd.DataFrame
+        The reshaped dataframe.
+    """
+    return df.pivot_table(
+        index=INDEX_COLUMNS,
+        columns='Gender',
+        values=PERCENTAGE_COLUMN,
+        fill_value=0,
+        observed=True
+    ).reset_index()
+
+
+def spread(df):
+    """
+    Spread the genders into columns with the NumPy reshape.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The employment dataframe.
+
+    Returns
+    -------
+    pd.DataFrame
+        The reshaped dataframe.
+    """
+    return spread_pivot(df, INDEX_COLUMNS, 'Gender', PERCENTAGE_COLUMN)
+
+
+def main():
+    """
+    Time both reshapes at each scale.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scales", type=int, nargs="+",
+                        default=[1, 100, 10000],
+                        help="scale factors for the synthetic dataset")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="number of timed runs per measurement")
+    args = parser.parse_args()
+
+    print(f"{'scale':>6}{'rows':>10}{'pivot_table (s)':>17}"
+          f"{'reshape (s)':>13}{'speed-up':>10}")
+    for scale in args.scales:
+        df = scale_up(get_dataset(), scale)
+        pivot_time = time_call(pivot, df, repeat=args.repeat)
+        spread_time = time_call(spread, df, repeat=args.repeat)
+        print(f"{scale:>6}{len(df):>10}{pivot_time:>17.4f}"
+              f"{spread_time:>13.4f}{pivot_time / spread_time:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
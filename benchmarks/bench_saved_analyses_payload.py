@@ -0,0 +1,127 @@
+"""
+Measure the bytes a save exchanges with the server once a session has
+10, 100 or 1000 saved analyses.
+
+The save request carries only the filters and the session id, and the
+response appends one menu item with a ``Patch``. For comparison, the
+"list-based" column adds up what sending the saved analyses and the menu
+children as State, and returning both whole, would cost.
+
+Run with ``python benchmarks/bench_saved_analyses_payload.py``.
+"""
+import argparse
+import tempfile
+from pathlib import Path
+from plotly.io.json import to_json_plotly
+import common  # noqa: F401
+from app import app
+from bench_dropdown_change import request_body
+from callbacks import saved_analysis_menu_item
+from saved_analyses import init_saved_analyses, list_analyses, save_analysis
+
+# Session saving the analyses and the filters it saves
+SESSION_ID = "benchmark-session"
+SAVE_STATE = {
+    "analysis-name-input.value": "",
+    "region-dropdown.value": "England",
+    "year-dropdown.value": "2021",
+    "occupation-type-slider.value": 3,
+    "session-id.data": SESSION_ID,
+    "save-filters-button.n_clicks": 1,
+}
+
+
+def list_based_bytes(session_id):
+    """
+    Count the bytes a save would exchange if the saved analyses and menu
+    children were sent as State and returned whole.
+
+    Parameters
+    ----------
+    session_id : str
+        The session whose saved analyses are counted.
+
+    Returns
+    -------
+    int
+        The size of the list and menu in the request plus the response.
+    """
+    analyses = list_analyses(session_id, limit=None)
+    menu = to_json_plotly(
+        [saved_analysis_menu_item(analysis) for analysis in analyses]
+    )
+    data = to_json_plotly(analyses)
+    # Both are sent as State and both come back in the response
+    return 2 * (len(menu) + len(data))
+
+
+def measure_save(client, dependency, count):
+    """
+    Save one more analysis after ``count - 1`` earlier ones.
+
+    Parameters
+    ----------
+    client : FlaskClient
+        The test client of the app's server.
+    dependency : dict
+        The save callback's entry in ``/_dash-dependencies``.
+    count : int
+        The number of analyses the session has after the save.
+
+    Returns
+    -------
+    tuple
+        The request bytes, response bytes and list-based bytes.
+    """
+    for number in range(count - 1):
+        save_analysis(SESSION_ID, f"Saved {number}", "Wales", "2022", 2)
+
+    # The menu lists every earlier analysis, so the new one is appended
+    state = dict(SAVE_STATE, **{"saved-analyses-listed.data": count - 1})
+    body = to_json_plotly(request_body(
+        dependency, "save-filters-button.n_clicks", state
+    ))
+    response = client.post(
+        "/_dash-update-component", data=body,
+        headers={"Content-Type": "application/json",
+                 "Accept-Encoding": "identity"}
+    )
+    assert response.status_code == 200, response.data
+    return len(body), len(response.data), list_based_bytes(SESSION_ID)
+
+
+def main():
+    """
+    Report the bytes of a save for each number of saved analyses.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--counts", type=int, nargs="+",
+                        default=[10, 100, 1000],
+                        help="numbers of saved analyses to measure")
+    args = parser.parse_args()
+
+    client = app.server.test_client()
+    dependency = next(
+        d for d in client.get("/_dash-dependencies").get_json()
+        if "save-alert.is_open" in d["output"]
+    )
+
+    print(f"{'analyses':>10}{'request':>10}{'response':>10}"
+          f"{'list-based':>12}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for count in args.counts:
+            # Start every count from an empty database
+            init_saved_analyses(
+                f"sqlite:///{Path(tmp_dir) / f'saved-{count}.db'}"
+            )
+            request, response, list_based = measure_save(
+                client, dependency, count
+            )
+            print(f"{count:>10}{request:>10}{response:>10}"
+                  f"{list_based:>12}")
+    print("bytes per save; list-based adds the lists sent as State and "
+          "returned whole")
+
+
+if __name__ == "__main__":
+    main()
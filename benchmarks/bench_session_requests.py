@@ -0,0 +1,147 @@
+"""
+Count the callbacks a typical browser session triggers and how many of
+them reach the server, using the app's callback graph.
+
+Each step of the session changes one property; every callback with a
+changed property as an input fires once, and its outputs count as changed
+in turn, as in Dash's renderer. Clientside callbacks run in the browser,
+so each one is a ``/_dash-update-component`` request the session avoids.
+
+Run with ``python benchmarks/bench_session_requests.py``.
+"""
+import argparse
+import json
+import common  # noqa: F401
+from app import app
+from bench_dropdown_change import split_outputs
+
+# A typical session: pick filters, browse occupations, read the summary,
+# check the data source, save the analysis and start again
+SESSION = [
+    "region-dropdown.value",
+    "year-dropdown.value",
+    "occupation-type-slider.value",
+    "occupation-type-slider.value",
+    "occupation-type-slider.value",
+    "display-summary-button.n_clicks",
+    "data-attribution-button.n_clicks",
+    "data-attribution-button.n_clicks",
+    "save-filters-button.n_clicks",
+    "year-dropdown.value",
+    "clear-button.n_clicks",
+]
+
+
+def input_ids(dependency):
+    """
+    List the "id.property" names of a callback's inputs.
+
+    Parameters
+    ----------
+    dependency : dict
+        The callback's entry in ``/_dash-dependencies``.
+
+    Returns
+    -------
+    set of str
+        The callback's inputs.
+    """
+    return {f"{item['id']}.{item['property']}"
+            for item in dependency["inputs"]}
+
+
+def fire(dependencies, changed):
+    """
+    Find the callbacks triggered by a set of changed properties, following
+    the chain of callbacks whose outputs are other callbacks' inputs.
+
+    Parameters
+    ----------
+    dependencies : list of dict
+        The app's callback dependencies.
+    changed : set of str
+        The "id.property" names that changed.
+
+    Returns
+    -------
+    list of dict
+        The triggered callbacks, each listed once.
+    """
+    fired = []
+    pending = set(changed)
+    while pending:
+        triggered = [
+            dependency for dependency in dependencies
+            if dependency not in fired and input_ids(dependency) & pending
+        ]
+        fired.extend(triggered)
+        pending = {
+            f"{output['id']}.{output['property']}"
+            for dependency in triggered
+            for output in split_outputs(dependency["output"])
+        }
+    return fired
+
+
+def count_session(dependencies):
+    """
+    Count the server and clientside callbacks of the page load and of each
+    step of the session.
+
+    Parameters
+    ----------
+    dependencies : list of dict
+        The app's callback dependencies.
+
+    Returns
+    -------
+    list of dict
+        The step, its number of server requests and its number of
+        clientside callbacks, starting with the page load.
+    """
+    def split(fired):
+        clientside = sum(1 for d in fired if d.get("clientside_function"))
+        return len(fired) - clientside, clientside
+
+    # On page load every callback without prevent_initial_call fires
+    initial = [d for d in dependencies if not d.get("prevent_initial_call")]
+    server, clientside = split(initial)
+    steps = [{"step": "page load", "server": server,
+              "clientside": clientside}]
+    for changed_prop in SESSION:
+        server, clientside = split(fire(dependencies, {changed_prop}))
+        steps.append({"step": changed_prop, "server": server,
+                      "clientside": clientside})
+    return steps
+
+
+def main():
+    """
+    Report the server requests of a typical session and those avoided by
+    clientside callbacks.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--json", action="store_true",
+                        help="print the results as JSON")
+    args = parser.parse_args()
+
+    client = app.server.test_client()
+    dependencies = client.get("/_dash-dependencies").get_json()
+    steps = count_session(dependencies)
+
+    if args.json:
+        print(json.dumps(steps, indent=2))
+        return
+    print(f"{'step':<36}{'server':>8}{'clientside':>12}")
+    for step in steps:
+        print(f"{step['step']:<36}{step['server']:>8}"
+              f"{step['clientside']:>12}")
+    server = sum(step["server"] for step in steps)
+    clientside = sum(step["clientside"] for step in steps)
+    print(f"{'total':<36}{server:>8}{clientside:>12}")
+    print(f"server requests avoided: {clientside} of {server + clientside} "
+          f"({100 * clientside / (server + clientside):.0f}%)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+"""
+Time the data functions and chart builders at the shipped data size and
+at synthetic scales, and write the results as JSON.
+
+Every scale installs a scaled-up copy of the dataset in the registry, so
+``filter_dataframe`` and the precomputed views run on it just as the app
+would. Save the JSON of two commits and compare them with ``--compare``
+to spot regressions.
+
+Run with ``python benchmarks/bench_suite.py --output results.json``.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import pandas as pd
+from common import scale_up, time_call
+from bench_filter_dataframe import filter_combinations
+from data_loader import load_employment_data
+from dataset_registry import get_dataset, set_dataset
+from filter_data_functions import (
+    filter_dataframe,
+    find_highest_dis_by_gender,
+    find_overall_highest_disparity,
+    get_disparity_cube,
+    get_filter_index,
+    prepare_disparity_df,
+    prepare_year_pivot_df,
+    slice_disparity_cube,
+)
+from charts import (
+    create_area_chart,
+    create_bar_chart,
+    create_disparity_map,
+    create_pie_chart,
+)
+
+# Filters the chart builders are timed with
+REGION = "England"
+YEAR = 2021
+OCCUPATION = 3
+
+# Slowdown of a benchmark, compared with the baseline, reported as a
+# regression by --compare
+REGRESSION_RATIO = 1.2
+
+
+def bar_chart_input():
+    """
+    Prepare the bar chart's input the way its callback does.
+
+    Returns
+    -------
+    pd.DataFrame
+        The filtered rows, with the short occupation type derived at load.
+    """
+    return filter_dataframe(region=REGION, year=YEAR)
+
+
+def suite_benchmarks(df, combinations):
+    """
+    List the benchmarks to run on the installed dataset.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The installed employment dataframe.
+    combinations : list of dict
+        The filter combinations to run ``filter_dataframe`` with.
+
+    Returns
+    -------
+    list of tuple
+        The name, number of calls and function timed by each benchmark.
+    """
+    disparity_df = prepare_disparity_df(df)
+    bar_df = bar_chart_input()
+    pie_df = slice_disparity_cube(region=REGION, year=YEAR)
+    map_df = slice_disparity_cube(year=YEAR, occupation_code=OCCUPATION)
+    area_df = slice_disparity_cube(region=REGION)
+
+    def filter_every_combination():
+        for filters in combinations:
+            filter_dataframe(**filters)
+
+    return [
+        ("filter_dataframe", len(combinations), filter_every_combination),
+        ("prepare_disparity_df", 1, lambda: prepare_disparity_df(df)),
+        ("prepare_year_pivot_df", 1,
+         lambda: prepare_year_pivot_df(disparity_df)),
+        ("find_highest_dis_by_gender", 1,
+         lambda: find_highest_dis_by_gender(df, "Male")),
+        ("find_overall_highest_disparity", 1,
+         lambda: find_overall_highest_disparity(df)),
+        ("create_bar_chart", 1,
+         lambda: create_bar_chart(bar_df, REGION, YEAR)),
+        ("create_pie_chart", 1,
+         lambda: create_pie_chart(pie_df, REGION, YEAR)),
+        ("create_disparity_map", 1,
+         lambda: create_disparity_map(map_df, YEAR)),
+        ("create_area_chart", 1,
+         lambda: create_area_chart(area_df, REGION)),
+    ]
+
+
+def run_suite(scales, repeat):
+    """
+    Run every benchmark at every scale.
+
+    Parameters
+    ----------
+    scales : list of int
+        Scale factors for the synthetic dataset.
+    repeat : int
+        Number of timed runs per measurement; the fastest is kept.
+
+    Returns
+    -------
+    list of dict
+        The benchmark name, scale, rows, calls and best time in seconds.
+    """
+    # Scale the workbook's rows, which carry the dimension attributes
+    shipped, digest = load_employment_data()
+    # Filter on the shipped regions so every scale runs the same filters
+    combinations = filter_combinations(shipped)
+    results = []
+    try:
+        for scale in scales:
+            set_dataset(scale_up(shipped, scale))
+            df = get_dataset()
+            # Build the indexes and precomputed tables outside the timings
+            get_filter_index()
+            get_disparity_cube()
+            for name, calls, func in suite_benchmarks(df, combinations):
+                results.append({
+                    "benchmark": name,
+                    "scale": scale,
+                    "rows": len(df),
+                    "calls": calls,
+                    "seconds": time_call(func, repeat=repeat),
+                })
+                print(f"{name:<32}{scale:>6}{results[-1]['seconds']:>12.5f}",
+                      file=sys.stderr)
+    finally:
+        # Put the shipped dataset back for anything run afterwards
+        set_dataset(shipped, digest=digest)
+    return results
+
+
+def git_commit():
+    """
+    Return the commit the benchmarks ran on.
+
+    Git is run in the benchmarks directory, so the commit is found wherever
+    the suite is started from.
+
+    Returns
+    -------
+    str or None
+        The commit hash, or None outside a git checkout.
+    """
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+            check=True, cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(baseline, results):
+    """
+    Compare results with a baseline run and list the regressions.
+
+    Parameters
+    ----------
+    baseline : dict
+        The JSON written by an earlier run.
+    results : dict
+        The JSON of this run.
+
+    Returns
+    -------
+    list of str
+        A line per benchmark and scale that slowed down by more than
+        ``REGRESSION_RATIO``.
+    """
+    before = {
+        (result["benchmark"], result["scale"]): result["seconds"]
+        for result in baseline["results"]
+    }
+    regressions = []
+    for result in results["results"]:
+        key = (result["benchmark"], result["scale"])
+        if key in before and before[key] > 0:
+            ratio = result["seconds"] / before[key]
+            if ratio > REGRESSION_RATIO:
+                regressions.append(
+                    f"{key[0]} at {key[1]}x: {before[key]:.5f}s -> "
+                    f"{result['seconds']:.5f}s ({ratio:.2f}x)"
+                )
+    return regressions
+
+
+def main():
+    """
+    Run the suite and write its results as JSON.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scales", type=int, nargs="+",
+                        default=[1, 10, 100, 1000],
+                        help="scale factors for the synthetic dataset")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="number of timed runs per measurement")
+    parser.add_argument("--output",
+                        help="file to write the JSON to (default: stdout)")
+    parser.add_argument("--compare",
+                        help="JSON of an earlier run to check against")
+    args = parser.parse_args()
+
+    results = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "repeat": args.repeat,
+        "results": run_suite(args.scales, args.repeat),
+    }
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare) as file:
+            regressions = compare(json.load(file), results)
+        for line in regressions:
+            print(f"regression: {line}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
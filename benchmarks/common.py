@@ -0,0 +1,71 @@
+import sys
+import time
+from pathlib import Path
+import pandas as pd
+
+# Make the app modules importable the same way pytest does (pythonpath=src)
+SRC_DIR = Path(__file__).parent.parent / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+
+def scale_up(df, factor):
+    """
+    Build a synthetic dataset by repeating the shipped data under renamed
+    regions, so every region/year/occupation/gender row stays unique.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The shipped employment dataframe.
+    factor : int
+        How many copies of the data to produce.
+
+    Returns
+    -------
+    pd.DataFrame
+        The scaled-up dataframe with ``factor`` times as many rows.
+    """
+    copies = []
+    for i in range(factor):
+        copy = df.copy()
+        if i:
+            # Rename the regions of every copy after the first
+            copy["Region"] = copy["Region"].astype(str) + f" {i}"
+            if "Code" in copy:
+                copy["Code"] = copy["Code"].astype(str) + f"-{i}"
+        copies.append(copy)
+    scaled = pd.concat(copies, ignore_index=True)
+
+    # Keep the renamed labels as categoricals if the dataset stores them so
+    for column in df.select_dtypes("category").columns:
+        scaled[column] = scaled[column].astype("category")
+    return scaled
+
+
+def time_call(func, *args, repeat=5, **kwargs):
+    """
+    Time a function call and return the best of several runs.
+
+    Parameters
+    ----------
+    func : callable
+        The function to time.
+    *args
+        Positional arguments for the function.
+    repeat : int, optional
+        How many times to run the function, by default 5.
+    **kwargs
+        Keyword arguments for the function.
+
+    Returns
+    -------
+    float
+        The fastest run time in seconds.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args, **kwargs)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
@@ -0,0 +1,214 @@
+"""
+Generate a synthetic employment dataset with the schema of the shipped
+workbook, at any number of regions, years and occupation codes.
+
+Each region gets a code and a location within Great Britain and Northern
+Ireland, and its percentages add up to 100 in every year, as in the
+shipped data. The dataset can be written to xlsx, CSV, Feather or Parquet,
+chosen by each output file's suffix, e.g. for 35,000 LSOA-sized regions:
+
+``python benchmarks/generate_dataset.py --regions 35000
+--output data/synthetic.csv data/synthetic.parquet``
+
+Point the app at a generated workbook with ``EMPLOYMENT_DATA_PATH``.
+"""
+import argparse
+import time
+from pathlib import Path
+import numpy as np
+import pandas as pd
+import common  # noqa: F401
+from dataset_registry import PERCENTAGE_COLUMN, SCHEMA
+
+# Occupation types of the shipped data, by occupation code
+OCCUPATION_TYPES = {
+    1: "1: managers, directors and senior officials",
+    2: "2: professional occupations",
+    3: "3: associate prof & tech occupations",
+    4: "4: administrative and secretarial occupations",
+    5: "5: skilled trades occupations",
+    6: "6: caring, leisure and other service occupations",
+    7: "7: sales and customer service occupations",
+    8: "8: process, plant and machine operatives",
+    9: "9: elementary occupations",
+}
+
+GENDERS = ("Male", "Female")
+
+# Bounding box the region locations are drawn from
+LATITUDE_RANGE = (50.0, 58.6)
+LONGITUDE_RANGE = (-7.5, 1.7)
+
+# Largest number of data rows an xlsx worksheet holds
+XLSX_MAX_ROWS = 1_048_575
+
+
+def occupation_types(count):
+    """
+    Name the occupation types for the first ``count`` occupation codes.
+
+    Parameters
+    ----------
+    count : int
+        The number of occupation codes.
+
+    Returns
+    -------
+    list of str
+        The shipped occupation types for codes 1 to 9, followed by
+        "<code>: occupation <code>" for any further codes.
+    """
+    return [
+        OCCUPATION_TYPES.get(code, f"{code}: occupation {code}")
+        for code in range(1, count + 1)
+    ]
+
+
+def generate_employment_data(regions=4, years=(2021, 2022, 2023),
+                             occupations=9, seed=0):
+    """
+    Generate a synthetic employment dataframe.
+
+    Every combination of region, year, occupation and gender gets one row,
+    built with vectorised NumPy operations so tens of millions of rows
+    stay practical.
+
+    Parameters
+    ----------
+    regions : int, optional
+        The number of regions, by default 4.
+    years : sequence of int, optional
+        The years, by default 2021 to 2023.
+    occupations : int, optional
+        The number of occupation codes, by default 9.
+    seed : int, optional
+        Seed of the random generator, by default 0.
+
+    Returns
+    -------
+    pd.DataFrame
+        The employment dataframe, with the columns and types of
+        ``dataset_registry.SCHEMA``.
+    """
+    rng = np.random.default_rng(seed)
+    years = np.asarray(years, dtype=np.int64)
+    n_groups = regions * len(years)
+    n_cells = occupations * len(GENDERS)
+
+    # Draw each region-year's shares of employment and scale them to 100
+    shares = rng.gamma(4.0, size=(n_groups, n_cells))
+    percentages = np.round(
+        shares / shares.sum(axis=1, keepdims=True) * 100, 2
+    ).reshape(-1)
+
+    # Name and place each region
+    width = len(str(regions))
+    region_names = np.array(
+        [f"Region {number:0{width}d}" for number in range(1, regions + 1)],
+        dtype=object
+    )
+    region_codes = np.array(
+        [f"X{number:08d}" for number in range(1, regions + 1)],
+        dtype=object
+    )
+    latitudes = rng.uniform(*LATITUDE_RANGE, size=regions)
+    longitudes = rng.uniform(*LONGITUDE_RANGE, size=regions)
+
+    # Lay the rows out as region, year, occupation and gender, with the
+    # gender varying fastest
+    region_rows = np.repeat(np.arange(regions), len(years) * n_cells)
+    year_rows = np.tile(np.repeat(years, n_cells), regions)
+    occupation_rows = np.tile(
+        np.repeat(np.array(occupation_types(occupations), dtype=object),
+                  len(GENDERS)),
+        n_groups
+    )
+    gender_rows = np.tile(np.array(GENDERS, dtype=object),
+                          n_groups * occupations)
+
+    df = pd.DataFrame({
+        "Code": region_codes[region_rows],
+        "Region": region_names[region_rows],
+        "Year": year_rows,
+        "Gender": gender_rows,
+        "Occupation Type": occupation_rows,
+        PERCENTAGE_COLUMN: percentages,
+        "Margin of Error (%)": np.round(
+            rng.uniform(0, 0.08, size=len(region_rows)), 2
+        ),
+        "Latitude": latitudes[region_rows],
+        "Longitude": longitudes[region_rows],
+    })
+    return df.astype(SCHEMA)
+
+
+def write_dataset(df, path):
+    """
+    Write the dataset in the format given by the file's suffix.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The employment dataframe.
+    path : Path
+        The output file, ending in .xlsx, .csv, .feather or .parquet.
+
+    Raises
+    ------
+    ValueError
+        If the suffix is not supported, or the dataset has more rows than
+        an xlsx worksheet holds.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    suffix = path.suffix.lower()
+    if suffix == ".xlsx":
+        if len(df) > XLSX_MAX_ROWS:
+            raise ValueError(
+                f"{len(df)} rows do not fit in an xlsx worksheet "
+                f"(at most {XLSX_MAX_ROWS}); write CSV or Parquet instead"
+            )
+        df.to_excel(path, index=False)
+    elif suffix == ".csv":
+        df.to_csv(path, index=False)
+    elif suffix == ".feather":
+        df.to_feather(path)
+    elif suffix == ".parquet":
+        df.to_parquet(path, index=False)
+    else:
+        raise ValueError(f"Unsupported dataset format: {path.suffix}")
+
+
+def main():
+    """
+    Generate a dataset and write it to each output file.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--regions", type=int, default=4,
+                        help="number of regions")
+    parser.add_argument("--years", type=int, nargs="+",
+                        default=[2021, 2022, 2023], help="years to include")
+    parser.add_argument("--occupations", type=int, default=9,
+                        help="number of occupation codes")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="seed of the random generator")
+    parser.add_argument("--output", type=Path, nargs="+", required=True,
+                        help="files to write (.xlsx, .csv, .feather or "
+                             ".parquet)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    df = generate_employment_data(
+        args.regions, args.years, args.occupations, args.seed
+    )
+    print(f"generated {len(df)} rows in "
+          f"{time.perf_counter() - start:.2f}s")
+    for path in args.output:
+        start = time.perf_counter()
+        write_dataset(df, path)
+        print(f"wrote {path} ({path.stat().st_size} bytes) in "
+              f"{time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
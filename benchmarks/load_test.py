@@ -0,0 +1,180 @@
+"""
+Load-test the production server at several thread counts and report the
+throughput and latency of dropdown changes.
+
+For each thread count a server is started with ``src/serve.py``, warmed,
+and then hit by concurrent clients that each replay the callbacks of
+random filter changes over HTTP, as browsers would.
+
+Run with ``python benchmarks/load_test.py --threads 1 4 8``.
+"""
+import argparse
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+import requests
+import common  # noqa: F401
+from bench_dropdown_change import CHART_IDS, SESSION_STATE, request_body
+
+SERVE_SCRIPT = Path(__file__).parent.parent / "src" / "serve.py"
+
+# Values offered for each filter, as the browser sends them
+FILTER_VALUES = {
+    "region-dropdown.value": ["England", "Wales", "Scotland",
+                              "Northern Ireland"],
+    "year-dropdown.value": ["2021", "2022", "2023"],
+    "occupation-type-slider.value": list(range(1, 10)),
+}
+
+
+def free_port():
+    """
+    Find a free local TCP port.
+
+    Returns
+    -------
+    int
+        The port number.
+    """
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(threads, port, timeout=120):
+    """
+    Start the production server and wait until it accepts requests.
+
+    Parameters
+    ----------
+    threads : int
+        Number of waitress threads.
+    port : int
+        Port to serve on.
+    timeout : float, optional
+        Seconds to wait for the server, by default 120.
+
+    Returns
+    -------
+    subprocess.Popen
+        The server process.
+    """
+    process = subprocess.Popen(
+        [sys.executable, str(SERVE_SCRIPT), "--port", str(port),
+         "--threads", str(threads)],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            requests.get(f"http://127.0.0.1:{port}/_dash-layout", timeout=1)
+            return process
+        except requests.ConnectionError:
+            time.sleep(0.2)
+    process.kill()
+    raise RuntimeError("the server did not start in time")
+
+
+def run_clients(url, dependencies, clients, duration, layout_version):
+    """
+    Send random filter changes from concurrent clients for a fixed time.
+
+    Parameters
+    ----------
+    url : str
+        The server's base URL.
+    dependencies : list of dict
+        The app's callback dependencies.
+    clients : int
+        Number of concurrent clients.
+    duration : float
+        Seconds to keep sending requests.
+    layout_version : int
+        The dataset version of the chart layouts the clients hold.
+
+    Returns
+    -------
+    list of float
+        The latency of every request, in seconds.
+    """
+    latencies = []
+    errors = []
+    deadline = time.monotonic() + duration
+
+    def client(number):
+        rng = random.Random(number)
+        session = requests.Session()
+        state = dict(SESSION_STATE, **{
+            f"{chart_id}-layout.data": layout_version
+            for chart_id in CHART_IDS
+        })
+        while time.monotonic() < deadline:
+            # Change one filter and replay the server callbacks it triggers
+            changed_prop = rng.choice(list(FILTER_VALUES))
+            state[changed_prop] = rng.choice(FILTER_VALUES[changed_prop])
+            for dependency in dependencies:
+                inputs = {f"{item['id']}.{item['property']}"
+                          for item in dependency["inputs"]}
+                if (changed_prop not in inputs
+                        or dependency.get("clientside_function")):
+                    continue
+                start = time.perf_counter()
+                response = session.post(
+                    f"{url}/_dash-update-component",
+                    json=request_body(dependency, changed_prop, state)
+                )
+                latencies.append(time.perf_counter() - start)
+                if response.status_code not in (200, 204):
+                    errors.append(response.status_code)
+
+    threads = [threading.Thread(target=client, args=(number,))
+               for number in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise RuntimeError(f"{len(errors)} requests failed: {errors[:5]}")
+    return latencies
+
+
+def main():
+    """
+    Report requests per second and latency percentiles per thread count.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--threads", type=int, nargs="+",
+                        default=[1, 2, 4, 8],
+                        help="waitress thread counts to test")
+    parser.add_argument("--clients", type=int, default=16,
+                        help="number of concurrent clients")
+    parser.add_argument("--duration", type=float, default=10,
+                        help="seconds of load per thread count")
+    args = parser.parse_args()
+
+    print(f"{'threads':>8}{'req/s':>10}{'p50 (ms)':>10}{'p95 (ms)':>10}")
+    for threads in args.threads:
+        port = free_port()
+        process = start_server(threads, port)
+        try:
+            url = f"http://127.0.0.1:{port}"
+            dependencies = requests.get(f"{url}/_dash-dependencies").json()
+            # A fresh server process loads the dataset as version 1
+            latencies = run_clients(url, dependencies, args.clients,
+                                    args.duration, layout_version=1)
+        finally:
+            process.terminate()
+            process.wait()
+        latencies.sort()
+        print(f"{threads:>8}{len(latencies) / args.duration:>10.1f}"
+              f"{statistics.median(latencies) * 1000:>10.1f}"
+              f"{latencies[int(len(latencies) * 0.95)] * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
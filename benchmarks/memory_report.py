@@ -0,0 +1,26 @@
+"""
+Import the full app and report how much memory the shared employment
+dataset uses and how many full copies of it exist in the process.
+
+Run with ``python benchmarks/memory_report.py``.
+"""
+import json
+import common  # noqa: F401
+import app  # noqa: F401
+from dataset_registry import memory_report
+
+
+def main():
+    """
+    Print the dataset registry's memory report as JSON.
+    """
+    report = memory_report()
+    print(json.dumps(report, indent=2))
+    if report["full_copies"] != 1:
+        raise SystemExit(
+            f"Expected one copy of the dataset, found {report['full_copies']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
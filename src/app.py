@@ -1,45 +1,63 @@
 from dash import Dash
-import dash_bootstrap_components as dbc
 from layout import app_layout
 from callbacks import register_callbacks
+from callback_metrics import enable_metrics
+from compression import enable_compression
+from config import (
+    ASSET_MODE,
+    COMPRESSION_ENABLED,
+    DATASET_WATCH_INTERVAL,
+    METRICS_ENABLED,
+)
+from dataset_watcher import start_dataset_watcher
+from vendor_assets import (
+    VENDORED_NAME_PATTERN,
+    page_assets,
+    serve_vendored_files,
+)
 
 # Define meta tags for the viewport
 meta_tags = [
     {"name": "viewport", "content": "width=device-width, initial-scale=1"},
 ]
 
-# Define external stylesheets, using Bootstrap styling from
-# dash_bootstrap_components (dbc)
-external_stylesheets = [
-    dbc.themes.BOOTSTRAP,
-    dbc.icons.BOOTSTRAP,
-    'https://cdnjs.cloudflare.com/ajax/libs/animate.css/4.1.1/animate.min.css'
-]
-
-# Define external scripts, including html2canvas for capturing screenshots
-external_scripts = [
-    {
-        'src': (
-            'https://cdnjs.cloudflare.com/ajax/libs/html2canvas/1.4.0/'
-            'html2canvas.min.js'
-        )
-    }
-]
+# Define the external stylesheets (Bootstrap, Bootstrap icons and
+# animate.css) and scripts (html2canvas for capturing screenshots), loaded
+# from their CDNs or from local copies depending on the asset mode
+external_stylesheets, external_scripts = page_assets(ASSET_MODE)
 
 # Create and configure the Dash app
 app = Dash(
     __name__,
     external_stylesheets=external_stylesheets,
     external_scripts=external_scripts,
-    meta_tags=meta_tags
+    meta_tags=meta_tags,
+    # Vendored copies are only loaded through the lists above
+    assets_ignore=VENDORED_NAME_PATTERN
 )
 
+# Serve the vendored copies with long-lived cache headers
+if ASSET_MODE == "vendored":
+    serve_vendored_files(app)
+
+# Compress the layout, dependencies and callback responses
+if COMPRESSION_ENABLED:
+    enable_compression(app)
+
 # Set the layout of the app
 app.layout = app_layout
 
 # Register all callbacks
 register_callbacks(app)
 
+# Time every callback and serve the measurements on /metrics if enabled
+if METRICS_ENABLED:
+    enable_metrics(app)
+
+# Reload the workbook in the background whenever it changes if enabled
+if DATASET_WATCH_INTERVAL > 0:
+    start_dataset_watcher()
+
 # Run the app in debug mode if this script is executed directly
 if __name__ == '__main__':
     app.run(debug=True)
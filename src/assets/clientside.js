@@ -0,0 +1,87 @@
+/*
+ * Clientside versions of the callbacks that only rearrange input values.
+ * They run in the browser, so these interactions need no request to the
+ * server. tests/conftest.py runs them with Node.js, so the tests check the
+ * code the browser runs.
+ */
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    ui: {
+        toggle_data_attribution: function(n_clicks, is_open) {
+            // Toggle the display when the button has been clicked
+            return n_clicks ? !is_open : is_open;
+        },
+
+        clear_analysis_name: function(n_clicks) {
+            // Clear the input field once the save button has been clicked
+            return n_clicks ? "" : window.dash_clientside.no_update;
+        },
+
+        ensure_session_id: function(session_id) {
+            // Assign the browser a random id the first time it visits
+            if (session_id) {
+                throw window.dash_clientside.PreventUpdate;
+            }
+            if (window.crypto && window.crypto.randomUUID) {
+                return window.crypto.randomUUID().replace(/-/g, "");
+            }
+            const bytes = new Uint8Array(16);
+            window.crypto.getRandomValues(bytes);
+            return Array.from(
+                bytes, byte => byte.toString(16).padStart(2, "0")
+            ).join("");
+        },
+
+        show_summary_button: function(
+            selected_region, selected_year, selected_occupation
+        ) {
+            // Show the summary button only when every filter is selected
+            if (!selected_region || !selected_year || !selected_occupation) {
+                return {"display": "none", "width": "100%"};
+            }
+            return {"display": "block", "width": "100%"};
+        },
+
+        show_chart: function(...selections) {
+            // Show the chart once all of its filters are selected, and the
+            // placeholder image until then
+            if (selections.every(Boolean)) {
+                return [{"display": "none"}, {"display": "block"}];
+            }
+            return [{"display": "block"}, {"display": "none"}];
+        },
+
+        update_tooltip: function(value, descriptions) {
+            // Describe the selected occupation type below the slider
+            if (!(value in descriptions)) {
+                throw window.dash_clientside.PreventUpdate;
+            }
+            return {
+                "placement": "bottom",
+                "always_visible": true,
+                "template": descriptions[value]
+            };
+        },
+
+        update_selected_filters_for_gender_stats: function(
+            selected_region, selected_year
+        ) {
+            if (!selected_region || !selected_year) {
+                throw window.dash_clientside.PreventUpdate;
+            }
+            return [selected_region, selected_year];
+        },
+
+        update_selected_filters_for_occ_stats: function(
+            selected_region, selected_year, selected_occupation, descriptions
+        ) {
+            if (!selected_region || !selected_year || !selected_occupation) {
+                throw window.dash_clientside.PreventUpdate;
+            }
+            return [
+                selected_region,
+                selected_year,
+                descriptions[selected_occupation]
+            ];
+        }
+    }
+});
@@ -0,0 +1,239 @@
+import bisect
+import functools
+import threading
+import time
+from dash.exceptions import PreventUpdate
+from flask import Response
+from dataset_registry import get_dataset_version
+from figure_cache import figure_cache_stats
+
+# Upper bounds of the latency histogram buckets, in seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+# Upper bounds of the response size histogram buckets, in bytes
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576)
+
+# Measurements of each callback, keyed by callback name
+_metrics = {}
+_lock = threading.Lock()
+
+
+def _new_metrics():
+    """
+    Create the empty measurements of one callback.
+
+    Returns
+    -------
+    dict
+        Bucket counts and sums of the latency and response size
+        histograms, and the exception and PreventUpdate counts.
+    """
+    return {
+        "latency_buckets": [0] * (len(LATENCY_BUCKETS) + 1),
+        "latency_sum": 0.0,
+        "size_buckets": [0] * (len(SIZE_BUCKETS) + 1),
+        "size_sum": 0,
+        "exceptions": 0,
+        "prevented": 0,
+    }
+
+
+def _record(name, latency, size=None, outcome=None):
+    """
+    Record one call of a callback.
+
+    Parameters
+    ----------
+    name : str
+        The callback's name.
+    latency : float
+        The time the call took, in seconds.
+    size : int, optional
+        The size of the response in bytes, if the call returned one.
+    outcome : str, optional
+        "exceptions" or "prevented" if the call did not return normally.
+    """
+    with _lock:
+        metrics = _metrics.setdefault(name, _new_metrics())
+        # Count the call in the first bucket holding its latency; the
+        # cumulative counts are summed when the metrics are rendered
+        metrics["latency_buckets"][
+            bisect.bisect_left(LATENCY_BUCKETS, latency)
+        ] += 1
+        metrics["latency_sum"] += latency
+        if size is not None:
+            metrics["size_buckets"][
+                bisect.bisect_left(SIZE_BUCKETS, size)
+            ] += 1
+            metrics["size_sum"] += size
+        if outcome:
+            metrics[outcome] += 1
+
+
+def instrument(name, func):
+    """
+    Wrap a Dash callback so every call is timed and counted.
+
+    Parameters
+    ----------
+    name : str
+        The name to report the callback under.
+    func : callable
+        The callback as stored in the app's callback map, which returns
+        the serialized response.
+
+    Returns
+    -------
+    callable
+        The instrumented callback.
+    """
+    @functools.wraps(func)
+    def timed(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            response = func(*args, **kwargs)
+        except PreventUpdate:
+            _record(name, time.perf_counter() - start, outcome="prevented")
+            raise
+        except Exception:
+            _record(name, time.perf_counter() - start, outcome="exceptions")
+            raise
+        _record(name, time.perf_counter() - start, size=len(response))
+        return response
+    return timed
+
+
+def _histogram_lines(metric, name, buckets, counts, total):
+    """
+    Render one callback's histogram in the Prometheus text format.
+
+    Parameters
+    ----------
+    metric : str
+        The metric name.
+    name : str
+        The callback name.
+    buckets : tuple
+        The upper bounds of the buckets.
+    counts : list of int
+        The number of calls in each bucket, the last being above the
+        highest bound.
+    total : float
+        The sum of the observed values.
+
+    Returns
+    -------
+    list of str
+        The bucket, sum and count lines.
+    """
+    lines = []
+    cumulative = 0
+    for bound, count in zip(buckets + ("+Inf",), counts):
+        cumulative += count
+        lines.append(
+            f'{metric}_bucket{{callback="{name}",le="{bound}"}} {cumulative}'
+        )
+    lines.append(f'{metric}_sum{{callback="{name}"}} {total}')
+    lines.append(f'{metric}_count{{callback="{name}"}} {cumulative}')
+    return lines
+
+
+def render_metrics():
+    """
+    Render the callback measurements and figure cache counters in the
+    Prometheus text exposition format.
+
+    Returns
+    -------
+    str
+        The metrics page.
+    """
+    with _lock:
+        snapshot = {
+            name: {
+                key: list(value) if isinstance(value, list) else value
+                for key, value in metrics.items()
+            }
+            for name, metrics in sorted(_metrics.items())
+        }
+
+    lines = [
+        "# HELP dash_callback_duration_seconds Time spent in each callback.",
+        "# TYPE dash_callback_duration_seconds histogram",
+    ]
+    for name, metrics in snapshot.items():
+        lines += _histogram_lines(
+            "dash_callback_duration_seconds", name, LATENCY_BUCKETS,
+            metrics["latency_buckets"], metrics["latency_sum"]
+        )
+    lines += [
+        "# HELP dash_callback_response_bytes Size of each callback's "
+        "serialized response.",
+        "# TYPE dash_callback_response_bytes histogram",
+    ]
+    for name, metrics in snapshot.items():
+        lines += _histogram_lines(
+            "dash_callback_response_bytes", name, SIZE_BUCKETS,
+            metrics["size_buckets"], metrics["size_sum"]
+        )
+    for key, metric, description in (
+        ("exceptions", "dash_callback_exceptions_total",
+         "Calls that raised an exception."),
+        ("prevented", "dash_callback_prevented_total",
+         "Calls that raised PreventUpdate."),
+    ):
+        lines += [f"# HELP {metric} {description}",
+                  f"# TYPE {metric} counter"]
+        lines += [f'{metric}{{callback="{name}"}} {metrics[key]}'
+                  for name, metrics in snapshot.items()]
+
+    # Report the figure cache alongside the callbacks it serves
+    stats = figure_cache_stats()
+    for key in ("hits", "misses", "evictions", "expirations",
+                "invalidations"):
+        lines += [f"# TYPE figure_cache_{key}_total counter",
+                  f"figure_cache_{key}_total {stats[key]}"]
+    lines += ["# TYPE figure_cache_size gauge",
+              f"figure_cache_size {stats['size']}"]
+
+    # Report the dataset version, which changes when the dataset is
+    # reloaded
+    lines += ["# TYPE dataset_version gauge",
+              f"dataset_version {get_dataset_version()}"]
+    return "\n".join(lines) + "\n"
+
+
+def enable_metrics(app):
+    """
+    Instrument every server-side callback registered on the app and serve
+    the measurements on the ``/metrics`` route of its Flask server.
+
+    Call after the callbacks are registered. Callbacks are only wrapped
+    when this is called, so a disabled app pays no overhead.
+
+    Parameters
+    ----------
+    app : Dash
+        The Dash app instance.
+    """
+    for output, callback in app.callback_map.items():
+        if "callback" not in callback:
+            # Clientside callbacks run in the browser and cannot be timed
+            continue
+        name = getattr(callback["callback"], "__name__", output)
+        callback["callback"] = instrument(name, callback["callback"])
+
+    app.server.add_url_rule(
+        "/metrics", "metrics",
+        lambda: Response(
+            render_metrics(), mimetype="text/plain; version=0.0.4"
+        )
+    )
+
+
+def reset_metrics():
+    """
+    Forget every recorded callback measurement.
+    """
+    with _lock:
+        _metrics.clear()
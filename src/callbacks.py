@@ -1,68 +1,118 @@
-from dash import Output, Input, State, callback_context, html, dcc, no_update
+from dash import (
+    ClientsideFunction,
+    Output,
+    Patch,
+    Input,
+    State,
+    callback_context,
+    no_update,
+)
 from dash.dependencies import ALL
 from dash.exceptions import PreventUpdate
-from components import full_descriptions
+from components import get_metric_style
+from config import SAVED_ANALYSES_PAGE_SIZE
 import dash_bootstrap_components as dbc
+from figure_cache import cached_figure
+from saved_analyses import (
+    DuplicateAnalysisName,
+    count_analyses,
+    get_analysis,
+    list_analyses,
+    save_analysis,
+)
+from dataset_registry import (
+    dataset_snapshot,
+    get_dataset_version,
+    get_dimension,
+)
 from charts import (
     create_bar_chart,
     create_pie_chart,
     create_disparity_map,
     create_area_chart
 )
-from filter_data_functions import filter_dataframe, prepare_disparity_df
+from filter_data_functions import (
+    filter_dataframe,
+    slice_disparity_cube,
+    format_year_disparity,
+    get_headline_stats,
+)
 import json
 
 
-def toggle_data_attribution(n_clicks, is_open):
+def saved_analysis_menu_item(analysis):
     """
-    Toggle the display of data attribution based on the button click.
+    Create the menu item that loads a saved analysis.
 
     Parameters
     ----------
-    n_clicks : int
-        Number of times the button has been clicked.
-    is_open : bool
-        Current state of the data attribution display.
+    analysis : dict
+        The saved analysis, as returned by the saved analyses repository.
 
     Returns
     -------
-    bool
-        New state of the data attribution display.
+    dbc.DropdownMenuItem
+        A menu item identified by the analysis's database id.
     """
-    if n_clicks:
-        # Toggle the state of the data attribution display when the button
-        # is clicked
-        return not is_open
-    # Return the current state if the button has not been clicked
-    return is_open
+    return dbc.DropdownMenuItem(
+        analysis["name"],
+        id={"type": "saved-analysis", "index": analysis["id"]},
+        n_clicks=0
+    )
 
 
-def clear_analysis_name(n_clicks):
+def more_analyses_menu_item():
     """
-    Clear the analysis name input field when the save button is clicked.
+    Create the menu item that lists the next page of saved analyses.
+
+    Returns
+    -------
+    dbc.DropdownMenuItem
+        A menu item that keeps the menu open when clicked.
+    """
+    return dbc.DropdownMenuItem(
+        "More...",
+        id={"type": "more-saved-analyses", "index": 0},
+        n_clicks=0,
+        toggle=False
+    )
+
+
+def saved_analyses_page(session_id, offset):
+    """
+    Create the menu items of the page of saved analyses starting at an
+    offset, followed by the "More..." item if the session has more.
 
     Parameters
     ----------
-    n_clicks : int
-        Number of times the save button has been clicked.
+    session_id : str
+        Id of the browser session.
+    offset : int
+        The number of analyses already listed in the menu.
 
     Returns
     -------
-    str or no_update
-        An empty string to clear the input field or no_update if no clicks.
+    tuple
+        The menu items and the number of analyses listed including them.
     """
-    if n_clicks:
-        # Return an empty string to clear the input field if the save button
-        # has been clicked
-        return ""
-    # Return no_update if the save button has not been clicked
-    return no_update
+    analyses = list_analyses(session_id, offset, SAVED_ANALYSES_PAGE_SIZE)
+    listed = offset + len(analyses)
+    menu_items = [saved_analysis_menu_item(analysis) for analysis in analyses]
+    if count_analyses(session_id) > listed:
+        menu_items.append(more_analyses_menu_item())
+    return menu_items, listed
 
 
 def save_filters(n_clicks, custom_analysis_name, region, year, occupation,
-                 current_data, current_menu_items):
+                 session_id, listed=0):
     """
-    Save the current filters as a new analysis.
+    Save the current filters as a new analysis of the session.
+
+    The analysis is stored in the saved analyses database and its menu item
+    is appended to the menu with a ``Patch``, so neither the saved analyses
+    nor the existing menu items are sent to or from the server. While the
+    menu ends with the "More..." item, the new analysis is left for the last
+    page instead.
 
     Parameters
     ----------
@@ -72,107 +122,152 @@ def save_filters(n_clicks, custom_analysis_name, region, year, occupation,
         Custom name for the analysis.
     region : str
         Selected region.
-    year : int
+    year : str
         Selected year.
-    occupation : str
+    occupation : int
         Selected occupation.
-    current_data : list
-        List of current saved analyses.
-    current_menu_items : list
-        List of current menu items.
+    session_id : str
+        Id of the browser session saving the analysis.
+    listed : int, optional
+        The number of analyses listed in the menu.
 
     Returns
     -------
     tuple
-        Updated menu items, updated data, alert status, and alert message.
+        Patch appending the new menu item, alert status, alert message and
+        the number of analyses listed in the menu.
     """
-    if not n_clicks:
-        # Prevent update if the save button has not been clicked
+    if not n_clicks or not session_id:
+        # Prevent update if the save button has not been clicked or the
+        # session has no id yet
         raise PreventUpdate
 
     if not region or not year:
         # Show alert if region or year is not selected
         return (
-            no_update,
             no_update,
             True,
-            "Please select a region and year before saving an analysis."
+            "Please select a region and year before saving an analysis.",
+            no_update
         )
 
     # Ensure the input has a valid name
     analysis_name = (
         custom_analysis_name.strip() if custom_analysis_name else
-        f"Analysis {len(current_data) + 1}: {region}, {year}"
+        f"Analysis {count_analyses(session_id) + 1}: {region}, {year}"
     )
 
-    # Check if the analysis name already exists
-    if any(analysis["name"] == analysis_name for analysis in current_data):
+    try:
+        # The unique index on the session and name rejects duplicates
+        new_analysis = save_analysis(
+            session_id, analysis_name, region, year, occupation
+        )
+    except DuplicateAnalysisName:
         # Show alert if the analysis name already exists
         return (
-            no_update,
             no_update,
             True,
             f"An analysis named '{analysis_name}' already exists. "
-            "Please choose a different name."
+            "Please choose a different name.",
+            no_update
         )
 
-    # Append new analysis
-    new_analysis = {
-        "name": analysis_name,
-        "region": region,
-        "year": year,
-        "occupation": occupation
-    }
-
-    # Update the list of saved analyses
-    updated_data = (
-        current_data + [new_analysis] if current_data else [new_analysis]
-    )
+    if count_analyses(session_id) > (listed or 0) + 1:
+        # The menu has more pages to list before the new analysis
+        return no_update, False, no_update, no_update
 
-    # Create a new menu item for the saved analysis
-    new_menu_item = dbc.DropdownMenuItem(
-        analysis_name,
-        id={"type": "saved-analysis", "index": len(updated_data) - 1},
-        n_clicks=0
-    )
+    # Append a menu item for the saved analysis to the menu in the browser
+    menu_items = Patch()
+    menu_items.append(saved_analysis_menu_item(new_analysis))
+
+    # Return the menu update, alert status and number of analyses listed
+    return menu_items, False, no_update, (listed or 0) + 1
 
-    # Update the menu items with the new analysis
-    updated_menu_items = (
-        current_menu_items + [new_menu_item]
-        if current_menu_items
-        else [new_menu_item]
-    )
 
-    # Return the updated menu items, data, and alert status
-    return updated_menu_items, updated_data, False, no_update
+def load_saved_analyses(session_id):
+    """
+    List the first page of analyses saved by the session as menu items.
 
+    Parameters
+    ----------
+    session_id : str
+        Id of the browser session.
 
-def update_tooltip(value):
+    Returns
+    -------
+    tuple
+        A menu item for each of the first page of saved analyses, followed
+        by the "More..." item if the session has more, and the number of
+        analyses listed.
     """
-    Update the tooltip for the occupation type slider.
+    if not session_id:
+        # Wait until the browser has assigned the session an id
+        raise PreventUpdate
+    return saved_analyses_page(session_id, 0)
+
+
+def load_more_saved_analyses(n_clicks, session_id, listed):
+    """
+    Replace the "More..." item of the menu with the next page of saved
+    analyses.
 
     Parameters
     ----------
-    value : int
-        Value of the occupation type slider.
+    n_clicks : list
+        Clicks on the "More..." item, empty if the menu has none.
+    session_id : str
+        Id of the browser session.
+    listed : int
+        The number of analyses listed in the menu, which is also the
+        position of the "More..." item.
 
     Returns
     -------
-    dict
-        Tooltip configuration.
+    tuple
+        Patch replacing the "More..." item with the next page and the number
+        of analyses listed.
     """
-    # Return the tooltip configuration with the description of the selected
-    # occupation type
-    return {
-        "placement": "bottom",  # Position the tooltip at the bottom
-        "always_visible": True,  # Ensure the tooltip is always visible
-        "template": f"{full_descriptions[value]}"  # Use the full description
-    }
+    if not any(n_clicks) or not session_id:
+        # The item was only added to the menu
+        raise PreventUpdate
+    page_items, listed_after = saved_analyses_page(session_id, listed)
+
+    # Send only the next page, not the items already in the menu
+    menu_items = Patch()
+    del menu_items[listed]
+    menu_items.extend(page_items)
+    return menu_items, listed_after
 
 
-def show_summary_button(selected_region, selected_year, selected_occupation):
+def load_saved_analysis(session_id, analysis_id, n_clicks):
     """
-    Show or hide the summary button based on the selected filters.
+    Look up the filters of a saved analysis whose menu item was clicked.
+
+    Parameters
+    ----------
+    session_id : str
+        Id of the browser session.
+    analysis_id : int
+        Database id of the saved analysis.
+    n_clicks : int
+        Number of times the menu item has been clicked.
+
+    Returns
+    -------
+    dict or None
+        The saved analysis, or None if the menu item was only added to the
+        menu or the analysis does not belong to the session.
+    """
+    if not n_clicks:
+        # Menu items are created with no clicks when the menu is filled
+        return None
+    return get_analysis(session_id, analysis_id)
+
+
+def bar_chart_figure(selected_region, selected_year):
+    """
+    Return the stacked bar chart figure for the selected region and year,
+    from the figure cache.
 
     Parameters
     ----------
@@ -180,26 +275,37 @@ def show_summary_button(selected_region, selected_year, selected_occupation):
         Selected region.
     selected_year : int
         Selected year.
-    selected_occupation : str
-        Selected occupation.
 
     Returns
     -------
     dict
-        CSS style to show or hide the button.
+        The figure as a Plotly JSON dictionary.
     """
-    # Check if any of the filters (region, year, occupation) are not selected
-    if not selected_region or not selected_year or not selected_occupation:
-        # Hide the summary button if any filter is not selected
-        return {'display': 'none', "width": "100%"}
+    def build_bar_chart():
+        # Read the rows and the occupation dimension from one version of
+        # the dataset, in case it is replaced meanwhile
+        snapshot = dataset_snapshot()
+        # Filter the dataframe based on the selected region and year; the
+        # short occupation type was derived when the data was loaded
+        filtered_df = filter_dataframe(
+            region=selected_region, year=selected_year, snapshot=snapshot
+        )
+        # Create the bar chart figure
+        return create_bar_chart(
+            filtered_df, selected_region, selected_year,
+            occupations=get_dimension("Occupation Type", snapshot)
+        )
 
-    # Show the summary button if all filters are selected
-    return {'display': 'block', "width": "100%"}
+    # Serve the figure from the cache, building it on a miss
+    return cached_figure(
+        "bar", (selected_region, selected_year), build_bar_chart
+    )
 
 
-def update_selected_filters_for_gender_stats(selected_region, selected_year):
+def pie_chart_figure(selected_region, selected_year):
     """
-    Update the selected region and year for gender statistics.
+    Return the pie chart figure for the selected region and year, from the
+    figure cache.
 
     Parameters
     ----------
@@ -210,47 +316,124 @@ def update_selected_filters_for_gender_stats(selected_region, selected_year):
 
     Returns
     -------
-    tuple
-        Selected region and year.
+    dict
+        The figure as a Plotly JSON dictionary.
     """
-    if not selected_region or not selected_year:
-        raise PreventUpdate
+    def build_pie_chart():
+        # Slice the disparity table for the selected region and year
+        disparity_df = slice_disparity_cube(
+            region=selected_region, year=selected_year
+        )
+        # Create the pie chart figure
+        return create_pie_chart(disparity_df, selected_region, selected_year)
 
-    return selected_region, selected_year
+    # Serve the figure from the cache, building it on a miss
+    return cached_figure(
+        "pie", (selected_region, selected_year), build_pie_chart
+    )
 
 
-def update_selected_filters_for_occ_stats(
-    selected_region, selected_year, selected_occupation
-):
+def disparity_map_figure(selected_year, selected_occupation):
     """
-    Update the selected region, year, and occupation for occupation statistics.
+    Return the disparity map figure for the selected year and occupation
+    type, from the figure cache.
 
     Parameters
     ----------
-    selected_region : str
-        Selected region.
     selected_year : int
         Selected year.
-    selected_occupation : str
+    selected_occupation : int
         Selected occupation.
 
     Returns
     -------
-    tuple
-        Selected region, year, and occupation description.
+    dict
+        The figure as a Plotly JSON dictionary.
     """
-    # Prevent update if region, year, or occupation is not selected
-    if not selected_region or not selected_year or not selected_occupation:
-        raise PreventUpdate
+    def build_disparity_map():
+        # Read the slice and the region dimension from one version of the
+        # dataset, in case it is replaced meanwhile
+        snapshot = dataset_snapshot()
+        # Slice the disparity table for the selected year and occupation
+        # code, the slider's value
+        disparity_df = slice_disparity_cube(
+            year=selected_year, occupation_code=selected_occupation,
+            snapshot=snapshot
+        )
+        # Create the disparity map figure
+        return create_disparity_map(
+            disparity_df, selected_year,
+            regions=get_dimension("Region", snapshot)
+        )
 
-    # Return the selected region, year, and occupation description
-    return (
-        selected_region,
-        selected_year,
-        full_descriptions[selected_occupation]
+    # Serve the figure from the cache, building it on a miss
+    return cached_figure(
+        "map", (selected_year, selected_occupation), build_disparity_map
     )
 
 
+def area_chart_figure(selected_region):
+    """
+    Return the stacked area chart figure for the selected region, from the
+    figure cache.
+
+    Parameters
+    ----------
+    selected_region : str
+        Selected region.
+
+    Returns
+    -------
+    dict
+        The figure as a Plotly JSON dictionary.
+    """
+    def build_area_chart():
+        # Slice the disparity table for the selected region
+        disparity_df = slice_disparity_cube(region=selected_region)
+        # Create the area chart figure
+        return create_area_chart(disparity_df, selected_region)
+
+    # Serve the figure from the cache, building it on a miss
+    return cached_figure("area", (selected_region,), build_area_chart)
+
+
+def chart_update(figure, layout_version):
+    """
+    Return the update to send to a chart: the whole figure if the browser
+    does not yet hold its layout, and otherwise only its traces and title.
+
+    The layout of each chart depends only on the dataset, not on the
+    selected filters, so once the browser has it a selection change only
+    needs to replace the trace data and the title.
+
+    Parameters
+    ----------
+    figure : dict
+        The new figure as a Plotly JSON dictionary.
+    layout_version : int or None
+        The dataset version of the figure layout the browser holds.
+
+    Returns
+    -------
+    tuple
+        The figure or a Patch of its traces and title, and the dataset
+        version of the layout to record in the browser.
+    """
+    version = get_dataset_version()
+    if layout_version != version:
+        # Send the whole figure, including its layout, on first display or
+        # after the dataset changed
+        return figure, version
+
+    # Replace only the trace data and the title
+    patched_figure = Patch()
+    patched_figure["data"] = figure["data"]
+    patched_figure["layout"]["title"]["text"] = (
+        figure["layout"]["title"]["text"]
+    )
+    return patched_figure, no_update
+
+
 def update_highest_disparity_region(selected_occupation, selected_year):
     """
     Update the highest disparity region based on the selected occupation
@@ -272,17 +455,12 @@ def update_highest_disparity_region(selected_occupation, selected_year):
         # Prevent update if occupation or year is not selected
         raise PreventUpdate
 
-    # Prepare the occupation prefix for filtering
-    occupation_prefix = f"{selected_occupation}:"
-
-    # Filter the dataframe based on the selected year and occupation prefix
-    filtered_df = filter_dataframe(
-        year=selected_year, occupation_prefix=occupation_prefix
+    # Slice the disparity table for the selected year and occupation code,
+    # the slider's value
+    disparity_df = slice_disparity_cube(
+        year=selected_year, occupation_code=selected_occupation
     )
 
-    # Prepare the disparity dataframe
-    disparity_df = prepare_disparity_df(filtered_df)
-
     # Find the highest disparity percentage and its index
     highest_disparity_percentage = disparity_df['Disparity'].max()
     highest_disparity_perc_idx = disparity_df['Disparity'].idxmax()
@@ -295,12 +473,14 @@ def update_highest_disparity_region(selected_occupation, selected_year):
     return highest_disparity_region, f"{highest_disparity_percentage:.2f}%"
 
 
-def update_highest_disparity_occupation_for_selected_region(
-    selected_region, selected_year
-):
+def update_region_year_stats(selected_region, selected_year):
     """
-    Update the highest disparity occupation based on the selected region
-    and year.
+    Update the occupation statistics of the selected region and year: the
+    occupations with the highest disparity and the highest overall, male
+    and female employment.
+
+    All four statistics are read from one slice of the disparity table, so
+    a dropdown change costs a single request and a single query.
 
     Parameters
     ----------
@@ -312,162 +492,134 @@ def update_highest_disparity_occupation_for_selected_region(
     Returns
     -------
     tuple
-        Highest disparity occupation and percentage.
+        Highest disparity occupation and percentage, highest overall
+        employment occupation and percentage, highest male employment
+        occupation and percentage, and highest female employment occupation
+        and percentage.
     """
     if not selected_region or not selected_year:
         # Prevent update if region or year is not selected
         raise PreventUpdate
 
-    # Filter the dataframe based on the selected region and year
-    filtered_df = filter_dataframe(region=selected_region, year=selected_year)
-
-    # Prepare the disparity dataframe
-    disparity_df = prepare_disparity_df(filtered_df)
-
-    # Find the highest disparity percentage and its index
-    highest_disparity_percentage = disparity_df['Disparity'].max()
-    highest_disparity_perc_idx = disparity_df['Disparity'].idxmax()
+    # Slice the disparity table for the selected region and year once
+    disparity_df = slice_disparity_cube(
+        region=selected_region, year=selected_year
+    )
 
-    # Get the occupation with the highest disparity
-    highest_disparity_occupation = disparity_df['Occupation Type'][
-        highest_disparity_perc_idx]
+    # Find the occupation and percentage with the highest value of each
+    # statistic, the male and female columns holding each gender's share
+    # of employment
+    stats = ()
+    for column in ('Disparity', 'Total Employment', 'Male', 'Female'):
+        highest_idx = disparity_df[column].idxmax()
+        stats += (
+            disparity_df['Occupation Type'][highest_idx],
+            f"{disparity_df[column][highest_idx]:.2f}%"
+        )
 
-    # Return the highest disparity occupation and percentage
-    return highest_disparity_occupation, f"{highest_disparity_percentage:.2f}%"
+    # Return the occupation and percentage of each statistic
+    return stats
 
 
-def update_highest_male_employment_occupation(selected_region, selected_year):
+def format_change_percentage(extreme):
     """
-    Update the highest male employment occupation based on the selected region
-    and year.
+    Format a year-on-year change percentage for the statistics cards.
 
     Parameters
     ----------
-    selected_region : str
-        Selected region.
-    selected_year : int
-        Selected year.
+    extreme : dict
+        The change statistic, with its formatted "percentage" and numeric
+        "value".
 
     Returns
     -------
     tuple
-        Highest male employment occupation and percentage.
+        The icon class name, the percentage text and the percentage class
+        name.
     """
-    if not selected_region or not selected_year:
-        # Prevent update if region or year is not selected
-        raise PreventUpdate
-
-    # Filter the dataframe based on the selected region, year, and
-    # gender (Male)
-    male_df = filter_dataframe(
-        region=selected_region, year=selected_year, gender='Male'
+    # Colour and point the arrow according to the sign of the change
+    metric_style = get_metric_style(extreme["value"])
+    return (
+        f"bi {metric_style['icon']} me-2",
+        f"{extreme['percentage']}%",
+        f"h4 text-{metric_style['color']}"
     )
 
-    # Find the highest male employment percentage and its index
-    highest_male_employment_percentage = male_df[
-        'Percentage Employed (Relative to Total Employment in the Year)'
-    ].max()
-    highest_male_employ_perc_idx = male_df[
-        'Percentage Employed (Relative to Total Employment in the Year)'
-    ].idxmax()
-
-    # Get the occupation with the highest male employment
-    highest_male_employment_occupation = male_df['Occupation Type'][
-        highest_male_employ_perc_idx]
-
-    # Return the highest male employment occupation and percentage
-    return highest_male_employment_occupation, \
-        f"{highest_male_employment_percentage:.2f}%"
-
 
-def update_highest_female_employment_occupation(
-    selected_region, selected_year
-):
+def format_change_trend(extreme, rolling_years):
     """
-    Update the highest female employment occupation based on the selected
-    region and year.
+    Format the relative change and recent average of a year-on-year change
+    for the statistics cards.
 
     Parameters
     ----------
-    selected_region : str
-        Selected region.
-    selected_year : int
-        Selected year.
+    extreme : dict
+        The change statistic, with its "relative_change" and "rolling_mean"
+        when the dataset has more than one year.
+    rolling_years : list of int
+        The first and last years of the latest rolling window.
 
     Returns
     -------
     tuple
-        Highest female employment occupation and percentage.
+        The relative change text and the recent average text.
     """
-    if not selected_region or not selected_year:
-        # Prevent update if region or year is not selected
-        raise PreventUpdate
-
-    # Filter the dataframe based on the selected region, year, and
-    # gender (Female)
-    female_df = filter_dataframe(region=selected_region,
-                                 year=selected_year,
-                                 gender='Female')
-
-    # Find the highest female employment percentage and its index
-    highest_female_employment_percentage = female_df[
-        'Percentage Employed (Relative to Total Employment in the Year)'
-    ].max()
-    highest_female_employ_perc_idx = female_df[
-        'Percentage Employed (Relative to Total Employment in the Year)'
-    ].idxmax()
-
-    # Get the occupation with the highest female employment
-    highest_female_employment_occupation = female_df[
-        'Occupation Type'
-    ][highest_female_employ_perc_idx]
-
-    # Return the highest female employment occupation and percentage
-    return highest_female_employment_occupation, \
-        f"{highest_female_employment_percentage:.2f}%"
+    relative_change = extreme.get("relative_change")
+    rolling_mean = extreme.get("rolling_mean")
+    start, end = rolling_years
+    return (
+        # A series that starts at 0 has no relative change
+        "n/a" if relative_change is None
+        else f"{format_year_disparity(relative_change)}%",
+        "n/a" if rolling_mean is None
+        else f"{rolling_mean:.2f}% ({start}-{end})"
+    )
 
 
-def update_highest_overall_employment_occupation(
-    selected_region, selected_year
-):
+def update_headline_change_stats(is_open):
     """
-    Update the highest overall employment occupation based on the selected
-    region and year.
+    Fill in the greatest change in employment cards when the summary
+    statistics are first opened.
 
     Parameters
     ----------
-    selected_region : str
-        Selected region.
-    selected_year : int
-        Selected year.
+    is_open : bool
+        Whether the summary statistics are open.
 
     Returns
     -------
     tuple
-        Highest overall employment occupation and percentage.
+        The overall occupation, gender, region, icon class, percentage,
+        percentage class, relative change and recent average, followed by
+        the occupation, region, icon class, percentage, percentage class,
+        relative change and recent average for males and then for females,
+        and finally the start and end years of the change.
     """
-    if not selected_region or not selected_year:
-        # Prevent update if region or year is not selected
+    if not is_open:
+        # Prevent update while the summary statistics are closed
         raise PreventUpdate
 
-    # Filter the dataframe based on the selected region and year
-    filtered_df = filter_dataframe(region=selected_region, year=selected_year)
-
-    # Prepare the disparity dataframe
-    disparity_df = prepare_disparity_df(filtered_df)
+    # Get the headline statistics, computed once per dataset version
+    stats = get_headline_stats()
+    overall, male, female = stats["overall"], stats["male"], stats["female"]
+    rolling_years = stats["rolling_years"]
 
-    # Find the highest overall employment percentage and its index
-    highest_employment_percentage = disparity_df['Total Employment'].max()
-    highest_employ_perc_idx = disparity_df['Total Employment'].idxmax()
-
-    # Get the occupation with the highest overall employment
-    highest_employment_occupation = disparity_df['Occupation Type'][
-        highest_employ_perc_idx]
-
-    # Return the highest overall employment occupation and percentage
+    # Return the overall, male and female change statistics
     return (
-        highest_employment_occupation,
-        f"{highest_employment_percentage:.2f}%"
+        overall["occupation"],
+        overall["gender"],
+        overall["region"],
+        *format_change_percentage(overall),
+        *format_change_trend(overall, rolling_years),
+        male["occupation"],
+        male["region"],
+        *format_change_percentage(male),
+        *format_change_trend(male, rolling_years),
+        female["occupation"],
+        female["region"],
+        *format_change_percentage(female),
+        *format_change_trend(female, rolling_years),
+        *stats["years"],
     )
 
 
@@ -480,43 +632,74 @@ def register_callbacks(app):
     app : Dash
         The Dash app instance.
     """
+    # Callbacks that only rearrange input values run in the browser, using
+    # the functions in assets/clientside.js
+
     # Data attribution callback to toggle the data attribution display
-    @app.callback(
+    app.clientside_callback(
+        ClientsideFunction("ui", "toggle_data_attribution"),
         Output("data-attribution-canvas", "is_open"),
         Input("data-attribution-button", "n_clicks"),
         State("data-attribution-canvas", "is_open"),
         prevent_initial_call=True
     )
-    def wrapped_toggle_data_attribution(n_clicks, is_open):
-        return toggle_data_attribution(n_clicks, is_open)
 
     # Clear analysis name callback to clear the analysis name input field
-    @app.callback(
+    app.clientside_callback(
+        ClientsideFunction("ui", "clear_analysis_name"),
         Output("analysis-name-input", "value"),
         Input("save-filters-button", "n_clicks"),
     )
-    def wrapped_clear_analysis_name(n_clicks):
-        return clear_analysis_name(n_clicks)
 
-    # Save filters callback to save the current filters as a new analysis
+    # Assign the browser a session id, kept in local storage, that owns
+    # its saved analyses
+    app.clientside_callback(
+        ClientsideFunction("ui", "ensure_session_id"),
+        Output("session-id", "data"),
+        Input("session-id", "data"),
+    )
+
+    # Fill the saved analyses menu with the first page of the session's
+    # analyses
     @app.callback(
         Output("saved-analyses-menu", "children"),
-        Output("saved-analyses-store", "data"),
+        Output("saved-analyses-listed", "data"),
+        Input("session-id", "data"),
+    )
+    def wrapped_load_saved_analyses(session_id):
+        return load_saved_analyses(session_id)
+
+    # List the next page of saved analyses when "More..." is clicked
+    @app.callback(
+        Output("saved-analyses-menu", "children", allow_duplicate=True),
+        Output("saved-analyses-listed", "data", allow_duplicate=True),
+        Input({"type": "more-saved-analyses", "index": ALL}, "n_clicks"),
+        State("session-id", "data"),
+        State("saved-analyses-listed", "data"),
+        prevent_initial_call=True
+    )
+    def wrapped_load_more_saved_analyses(n_clicks, session_id, listed):
+        return load_more_saved_analyses(n_clicks, session_id, listed)
+
+    # Save filters callback to save the current filters as a new analysis
+    @app.callback(
+        Output("saved-analyses-menu", "children", allow_duplicate=True),
         Output("save-alert", "is_open"),
         Output("save-alert", "children"),
+        Output("saved-analyses-listed", "data", allow_duplicate=True),
         Input("save-filters-button", "n_clicks"),
         State("analysis-name-input", "value"),
         State("region-dropdown", "value"),
         State("year-dropdown", "value"),
         State("occupation-type-slider", "value"),
-        State("saved-analyses-store", "data"),
-        State("saved-analyses-menu", "children"),
+        State("session-id", "data"),
+        State("saved-analyses-listed", "data"),
         prevent_initial_call=True
     )
     def wrapped_save_filters(n_clicks, custom_analysis_name, region, year,
-                             occupation, current_data, current_menu_items):
+                             occupation, session_id, listed):
         return save_filters(n_clicks, custom_analysis_name, region, year,
-                            occupation, current_data, current_menu_items)
+                            occupation, session_id, listed)
 
     # Manage dropdowns callback to handle dropdown interactions
     @app.callback(
@@ -532,7 +715,7 @@ def register_callbacks(app):
             Input('display-summary-button', 'n_clicks')
         ],
         [
-            State("saved-analyses-store", "data"),
+            State("session-id", "data"),
             State('region-dropdown', 'value'),
             State('year-dropdown', 'value'),
             State('occupation-type-slider', 'value'),
@@ -541,8 +724,8 @@ def register_callbacks(app):
         prevent_initial_call=True,
     )
     def manage_dropdowns(saved_n_clicks, clear_n_clicks, summary_n_clicks,
-                         data, region_value, year_value, occupation_value,
-                         summary_status):
+                         session_id, region_value, year_value,
+                         occupation_value, summary_status):
         """
         Manage the dropdowns and summary button based on user interactions.
 
@@ -554,8 +737,8 @@ def register_callbacks(app):
             Number of times the clear button has been clicked.
         summary_n_clicks : int
             Number of times the summary button has been clicked.
-        data : list
-            List of saved analyses.
+        session_id : str
+            Id of the browser session owning the saved analyses.
         region_value : str
             Current region value.
         year_value : int
@@ -599,11 +782,14 @@ def register_callbacks(app):
             # saved analysis
             triggered_id = json.loads(triggered_id)
             if triggered_id.get("type") == "saved-analysis":
-                # Get the index of the saved analysis
-                analysis_index = triggered_id["index"]
-                if 0 <= analysis_index < len(data):
-                    # Return the saved analysis data if the index is valid
-                    analysis_data = data[analysis_index]
+                # Look up the saved analysis by its database id
+                analysis_data = load_saved_analysis(
+                    session_id,
+                    triggered_id["index"],
+                    ctx.triggered[0]["value"]
+                )
+                if analysis_data is not None:
+                    # Return the saved analysis data if it was found
                     return (
                         analysis_data["region"],
                         analysis_data["year"],
@@ -618,32 +804,46 @@ def register_callbacks(app):
         return region_value, year_value, occupation_value, summary_status
 
     # Show summary button callback to show or hide the summary button
-    @app.callback(
+    app.clientside_callback(
+        ClientsideFunction("ui", "show_summary_button"),
         Output('display-summary-button', 'style'),
         Input('region-dropdown', 'value'),
         Input('year-dropdown', 'value'),
         Input('occupation-type-slider', 'value')
     )
-    def wrapped_show_summary_button(selected_region, selected_year,
-                                    selected_occupation):
-        return show_summary_button(selected_region, selected_year,
-                                   selected_occupation)
 
     # Update the tooltip for the occupation type slider
-    @app.callback(
+    app.clientside_callback(
+        ClientsideFunction("ui", "update_tooltip"),
         Output('occupation-type-slider', 'tooltip'),
-        Input('occupation-type-slider', 'value')
+        Input('occupation-type-slider', 'value'),
+        State('occupation-descriptions', 'data')
     )
-    def wrapped_update_tooltip(value):
-        return update_tooltip(value)
+
+    # Show each chart once its filters are selected, and its placeholder
+    # image until then
+    for chart_id, chart_inputs in (
+        ("bar-chart", ("region-dropdown", "year-dropdown")),
+        ("pie-chart", ("region-dropdown", "year-dropdown")),
+        ("disparity-map", ("year-dropdown", "occupation-type-slider")),
+        ("stacked-area-chart", ("region-dropdown",)),
+    ):
+        app.clientside_callback(
+            ClientsideFunction("ui", "show_chart"),
+            Output(f"{chart_id}-placeholder", "style"),
+            Output(chart_id, "style"),
+            *[Input(component_id, "value") for component_id in chart_inputs]
+        )
 
     # Update bar chart
     @app.callback(
-        Output('bar-chart-card-content', 'children'),
+        Output("bar-chart", "figure"),
+        Output("bar-chart-layout", "data"),
         Input('region-dropdown', 'value'),
         Input('year-dropdown', 'value'),
+        State("bar-chart-layout", "data"),
     )
-    def update_bar_chart(selected_region, selected_year):
+    def update_bar_chart(selected_region, selected_year, layout_version):
         """
         Update the stacked bar chart based on the selected region and year.
 
@@ -653,44 +853,32 @@ def register_callbacks(app):
             Selected region.
         selected_year : int
             Selected year.
+        layout_version : int or None
+            The dataset version of the figure layout the browser holds.
 
         Returns
         -------
-        html.Div or dcc.Graph
-            Updated bar chart or placeholder image.
+        tuple
+            The figure or a patch of its traces and title, and the layout
+            version.
         """
         if not selected_region or not selected_year:
-            # Return a placeholder image if no region or year is selected
-            return html.Div([
-                html.I(className="custom-icon bi bi-lock"),
-                html.Img(
-                    src=app.get_asset_url('stacked_bar_chart.png'),
-                    className='custom-placeholder'
-                )
-            ])
-        else:
-            # Filter the dataframe based on the selected region and year
-            filtered_df = filter_dataframe(
-                region=selected_region, year=selected_year
-            )
-            # Extract the short occupation type for the bar chart
-            filtered_df['Short Occupation Type'] = filtered_df[
-                'Occupation Type'
-            ].str.split(':').str[0]
-            # Create the bar chart figure
-            bar_chart_figure = create_bar_chart(
-                filtered_df, selected_region, selected_year
-            )
-            # Return the bar chart as a dcc.Graph component
-            return dcc.Graph(id="bar-chart", figure=bar_chart_figure)
+            # Keep the chart as it is while the placeholder is shown
+            raise PreventUpdate
+
+        return chart_update(
+            bar_chart_figure(selected_region, selected_year), layout_version
+        )
 
     # Update pie chart
     @app.callback(
-        Output('pie-chart-card-content', 'children'),
+        Output("pie-chart", "figure"),
+        Output("pie-chart-layout", "data"),
         Input('region-dropdown', 'value'),
         Input('year-dropdown', 'value'),
+        State("pie-chart-layout", "data"),
     )
-    def update_pie_chart(selected_region, selected_year):
+    def update_pie_chart(selected_region, selected_year, layout_version):
         """
         Update the pie chart based on the selected region and year.
 
@@ -700,42 +888,32 @@ def register_callbacks(app):
             Selected region.
         selected_year : int
             Selected year.
+        layout_version : int or None
+            The dataset version of the figure layout the browser holds.
 
         Returns
         -------
-        html.Div or dcc.Graph
-            Updated pie chart or placeholder image.
+        tuple
+            The figure or a patch of its traces and title, and the layout
+            version.
         """
         if not selected_region or not selected_year:
-            # Return a placeholder image if no region or year is selected
-            return html.Div([
-                html.I(className="custom-icon bi bi-lock"),
-                html.Img(
-                    src=app.get_asset_url('pie_chart_placeholder.png'),
-                    className='custom-placeholder'
-                )
-            ])
-        else:
-            # Filter the dataframe based on the selected region and year
-            filtered_df = filter_dataframe(
-                region=selected_region, year=selected_year
-            )
-            # Prepare the disparity dataframe
-            disparity_df = prepare_disparity_df(filtered_df)
-            # Create the pie chart figure
-            pie_chart_figure = create_pie_chart(
-                disparity_df, selected_region, selected_year
-            )
-            # Return the pie chart as a dcc.Graph component
-            return dcc.Graph(id="pie-chart", figure=pie_chart_figure)
+            # Keep the chart as it is while the placeholder is shown
+            raise PreventUpdate
+
+        return chart_update(
+            pie_chart_figure(selected_region, selected_year), layout_version
+        )
 
     # Update disparity map
     @app.callback(
-        Output("disparity-map-card-content", "children"),
+        Output("disparity-map", "figure"),
+        Output("disparity-map-layout", "data"),
         Input("year-dropdown", "value"),
         Input("occupation-type-slider", "value"),
+        State("disparity-map-layout", "data"),
     )
-    def update_map(selected_year, selected_occupation):
+    def update_map(selected_year, selected_occupation, layout_version):
         """
         Update the disparity map based on the selected year and occupation
         type.
@@ -746,44 +924,32 @@ def register_callbacks(app):
             Selected year.
         selected_occupation : str
             Selected occupation.
+        layout_version : int or None
+            The dataset version of the figure layout the browser holds.
 
         Returns
         -------
-        html.Div or dcc.Graph
-            Updated disparity map or placeholder image.
+        tuple
+            The figure or a patch of its traces and title, and the layout
+            version.
         """
         if not selected_year or not selected_occupation:
-            # Return a placeholder image if no year or occupation is selected
-            return html.Div([
-                html.I(className="custom-icon bi bi-lock"),
-                html.Img(
-                    src=app.get_asset_url('disparity_map_placeholder.png'),
-                    className='custom-placeholder'
-                )
-            ])
-        else:
-            # Prepare the occupation prefix for filtering
-            occupation_prefix = f"{selected_occupation}:"
-            # Filter the dataframe based on the selected year and occupation
-            # prefix
-            filtered_df = filter_dataframe(
-                year=selected_year, occupation_prefix=occupation_prefix
-            )
-            # Prepare the disparity dataframe
-            disparity_df = prepare_disparity_df(filtered_df)
-            # Create the disparity map figure
-            disparity_map_figure = create_disparity_map(
-                disparity_df, selected_year
-            )
-            # Return the disparity map as a dcc.Graph component
-            return dcc.Graph(id="disparity-map", figure=disparity_map_figure)
+            # Keep the map as it is while the placeholder is shown
+            raise PreventUpdate
+
+        return chart_update(
+            disparity_map_figure(selected_year, selected_occupation),
+            layout_version
+        )
 
     # Update stacked area chart
     @app.callback(
-        Output("stacked-area-chart-card-content", 'children'),
+        Output("stacked-area-chart", "figure"),
+        Output("stacked-area-chart-layout", "data"),
         Input("region-dropdown", 'value'),
+        State("stacked-area-chart-layout", "data"),
     )
-    def update_area_chart(selected_region):
+    def update_area_chart(selected_region, layout_version):
         """
         Update the stacked area chart based on the selected region.
 
@@ -791,64 +957,43 @@ def register_callbacks(app):
         ----------
         selected_region : str
             Selected region.
+        layout_version : int or None
+            The dataset version of the figure layout the browser holds.
 
         Returns
         -------
-        html.Div or dcc.Graph
-            Updated area chart or placeholder image.
+        tuple
+            The figure or a patch of its traces and title, and the layout
+            version.
         """
         if not selected_region:
-            # Return a placeholder image if no region is selected
-            return html.Div([
-                html.I(className="custom-icon bi bi-lock"),
-                html.Img(
-                    src=app.get_asset_url(
-                        'stacked_area_chart_placeholder.png'
-                    ),
-                    className='custom-placeholder'
-                )
-            ])
-        else:
-            # Filter the dataframe based on the selected region
-            filtered_df = filter_dataframe(region=selected_region)
-            # Prepare the disparity dataframe
-            disparity_df = prepare_disparity_df(filtered_df)
-            # Create the area chart figure
-            area_chart_figure = create_area_chart(
-                disparity_df, selected_region
-            )
-            # Return the area chart as a dcc.Graph component
-            return dcc.Graph(id="stacked-area-chart", figure=area_chart_figure)
+            # Keep the chart as it is while the placeholder is shown
+            raise PreventUpdate
+
+        return chart_update(
+            area_chart_figure(selected_region), layout_version
+        )
 
     # Update selected region and year for gender occupation statistics card
-    @app.callback(
+    app.clientside_callback(
+        ClientsideFunction("ui", "update_selected_filters_for_gender_stats"),
         Output("gen-selected-region", "children"),
         Output("gen-selected-year", "children"),
         Input("region-dropdown", "value"),
         Input("year-dropdown", "value"),
     )
-    def wrapped_update_selected_filters_for_gender_stats(
-        selected_region, selected_year
-    ):
-        return update_selected_filters_for_gender_stats(
-            selected_region, selected_year
-        )
 
     # Update selected region and year for occupation type statistics card
-    @app.callback(
+    app.clientside_callback(
+        ClientsideFunction("ui", "update_selected_filters_for_occ_stats"),
         Output("occ-selected-region", "children"),
         Output("occ-selected-year", "children"),
         Output('selected-occupation-type', 'children'),
         Input("region-dropdown", "value"),
         Input("year-dropdown", "value"),
-        Input('occupation-type-slider', 'value')
+        Input('occupation-type-slider', 'value'),
+        State('occupation-descriptions', 'data')
     )
-    def wrapped_update_selected_filters_for_occ_stats(
-        selected_region, selected_year, selected_occupation
-    ):
-        return update_selected_filters_for_occ_stats(
-            selected_region, selected_year, selected_occupation
-        )
 
     # Update highest disparity region and percentage
     @app.callback(
@@ -864,59 +1009,50 @@ def register_callbacks(app):
             selected_occupation, selected_year
         )
 
-    # Update highest disparity occupation and percentage
+    # Update the occupation statistics of the selected region and year
     @app.callback(
         Output("highest-disparity-occupation", "children"),
         Output("highest-disparity-occupation-percentage", "children"),
-        Input("region-dropdown", "value"),
-        Input("year-dropdown", "value"),
-        allow_duplicate=True
-    )
-    def wrapped_update_highest_disparity_occupation_for_selected_region(
-        selected_region, selected_year
-    ):
-        return update_highest_disparity_occupation_for_selected_region(
-            selected_region, selected_year
-        )
-
-    # Update highest overall employment occupation and percentage
-    @app.callback(
         Output("highest-employment-occupation", "children"),
         Output("highest-employment-percentage", "children"),
-        Input("region-dropdown", "value"),
-        Input("year-dropdown", "value")
-    )
-    def wrapped_update_highest_overall_employment_occupation(
-        selected_region, selected_year
-    ):
-        return update_highest_overall_employment_occupation(
-            selected_region, selected_year
-        )
-
-    # Update highest male employment occupation and percentage
-    @app.callback(
         Output("highest-male-employment-occupation", "children"),
         Output("highest-male-employment-percentage", "children"),
+        Output("highest-female-employment-occupation", "children"),
+        Output("highest-female-employment-percentage", "children"),
         Input("region-dropdown", "value"),
         Input("year-dropdown", "value")
     )
-    def wrapped_update_highest_male_employment_occupation(
-        selected_region, selected_year
-    ):
-        return update_highest_male_employment_occupation(
-            selected_region, selected_year
-        )
+    def wrapped_update_region_year_stats(selected_region, selected_year):
+        return update_region_year_stats(selected_region, selected_year)
 
-    # Update highest female employment occupation and percentage
+    # Fill in the greatest change in employment cards on first open
     @app.callback(
-        Output("highest-female-employment-occupation", "children"),
-        Output("highest-female-employment-percentage", "children"),
-        Input("region-dropdown", "value"),
-        Input("year-dropdown", "value")
+        Output("highest-overall-change-occupation", "children"),
+        Output("highest-overall-change-gender", "children"),
+        Output("highest-overall-change-region", "children"),
+        Output("highest-overall-change-icon", "className"),
+        Output("highest-overall-change-percentage", "children"),
+        Output("highest-overall-change-percentage", "className"),
+        Output("highest-overall-change-relative", "children"),
+        Output("highest-overall-change-rolling", "children"),
+        Output("highest-male-change-occupation", "children"),
+        Output("highest-male-change-region", "children"),
+        Output("highest-male-change-icon", "className"),
+        Output("highest-male-change-percentage", "children"),
+        Output("highest-male-change-percentage", "className"),
+        Output("highest-male-change-relative", "children"),
+        Output("highest-male-change-rolling", "children"),
+        Output("highest-female-change-occupation", "children"),
+        Output("highest-female-change-region", "children"),
+        Output("highest-female-change-icon", "className"),
+        Output("highest-female-change-percentage", "children"),
+        Output("highest-female-change-percentage", "className"),
+        Output("highest-female-change-relative", "children"),
+        Output("highest-female-change-rolling", "children"),
+        Output("change-start-year", "children"),
+        Output("change-end-year", "children"),
+        Input("summary-stats", "is_open"),
+        prevent_initial_call=True
     )
-    def wrapped_update_highest_female_employment_occupation(
-        selected_region, selected_year
-    ):
-        return update_highest_female_employment_occupation(
-            selected_region, selected_year
-        )
+    def wrapped_update_headline_change_stats(is_open):
+        return update_headline_change_stats(is_open)
@@ -1,7 +1,30 @@
 import plotly.express as px
+from dataset_registry import get_dimension
 
 
-def create_bar_chart(filtered_df, selected_region, selected_year):
+def join_dimension(df, key, attributes, dimension=None):
+    """
+    Join attributes from a dimension table onto the rows of a fact table.
+
+    Parameters:
+    ----------
+    df (DataFrame): The rows to plot, with the dimension's key column.
+    key (str): The key column, e.g. "Region".
+    attributes (list): The dimension's columns to join.
+    dimension (DataFrame, optional): The dimension table, by default the
+        one of the loaded dataset.
+
+    Returns:
+    ----------
+    DataFrame: The rows with the attributes added as columns.
+    """
+    if dimension is None:
+        dimension = get_dimension(key)
+    return df.join(dimension[attributes], on=key)
+
+
+def create_bar_chart(filtered_df, selected_region, selected_year,
+                     occupations=None):
     """
     Create a stacked bar chart showing employment data by gender for a
     selected region and year.
@@ -12,12 +35,19 @@ def create_bar_chart(filtered_df, selected_region, selected_year):
         be plotted.
     selected_region (str): The selected region for the chart.
     selected_year (int): The selected year for the chart.
+    occupations (DataFrame, optional): The occupation dimension table, by
+        default the one of the loaded dataset.
 
     Returns:
     ----------
     fig (Figure): The Plotly figure object for the bar chart.
     """
     perc_emp = "Percentage Employed (Relative to Total Employment in the Year)"
+    # Label each bar by its occupation code
+    filtered_df = join_dimension(
+        filtered_df, "Occupation Type", ["Short Occupation Type"],
+        occupations
+    )
     # Create a stacked bar chart using Plotly Express
     fig = px.bar(
         filtered_df,
@@ -112,7 +142,7 @@ def create_pie_chart(disparity_df, selected_region, selected_year):
     return fig
 
 
-def create_disparity_map(disparity_df, selected_year):
+def create_disparity_map(disparity_df, selected_year, regions=None):
     """
     Create a geographic scatter plot showing employment disparity by region
     for a selected year.
@@ -122,11 +152,18 @@ def create_disparity_map(disparity_df, selected_year):
     disparity_df (DataFrame): The DataFrame containing the disparity data to
         be plotted.
     selected_year (int): The selected year for the chart.
+    regions (DataFrame, optional): The region dimension table, by default
+        the one of the loaded dataset.
 
     Returns:
     ----------
     fig (Figure): The Plotly figure object for the disparity map.
     """
+    # Place each region at its coordinates
+    disparity_df = join_dimension(
+        disparity_df, "Region", ["Latitude", "Longitude"], regions
+    )
+
     # Define colors for each region
     region_colors = {
         "England": "#5F001C",
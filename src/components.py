@@ -1,19 +1,5 @@
 from dash import dcc, html
 import dash_bootstrap_components as dbc
-import pandas as pd
-from pathlib import Path
-from filter_data_functions import (
-    highest_m_year_disparity_percentage,
-    highest_m_year_disparity_occupation,
-    highest_m_year_disparity_region,
-    highest_f_year_disparity_percentage,
-    highest_f_year_disparity_occupation,
-    highest_f_year_disparity_region,
-    highest_overall_disparity_percentage,
-    highest_overall_disparity_occupation,
-    highest_overall_disparity_region,
-    highest_overall_disparity_gender,
-)
 
 
 # Helper function to get metric style for statistics card
@@ -40,9 +26,80 @@ def get_metric_style(value):
     return {"color": "danger", "icon": "bi-arrow-down"}
 
 
-# Create dataframe
-data_path = Path(__file__).parent.parent / "data" / "employment_prepared.xlsx"
-df = pd.read_excel(data_path)
+# Helper function to build the content of a chart card
+def chart_card_content(chart_id, placeholder_image):
+    """
+    Build the content of a chart card: a placeholder image shown until the
+    chart's filters are selected, and a graph kept in the layout so later
+    selections only patch its figure.
+
+    Parameters
+    ----------
+    chart_id : str
+        The id of the graph. The placeholder, loading wrapper and layout
+        store are named after it.
+    placeholder_image : str
+        The file name of the placeholder image in the assets folder.
+
+    Returns
+    -------
+    list
+        The placeholder, the graph in its loading wrapper and the store
+        recording which figure layout the browser holds.
+    """
+    return [
+        html.Div(
+            [
+                html.I(className="custom-icon bi bi-lock"),
+                # The layout is built before the app exists, so the asset
+                # URL is relative to the page rather than app.get_asset_url
+                html.Img(
+                    src=f"assets/{placeholder_image}",
+                    className="custom-placeholder"
+                ),
+            ],
+            id=f"{chart_id}-placeholder",
+        ),
+        dcc.Loading(
+            dcc.Graph(id=chart_id, style={"display": "none"}),
+            id=f"{chart_id}-card-content",
+        ),
+        dcc.Store(id=f"{chart_id}-layout"),
+    ]
+
+
+def change_trend(group):
+    """
+    Create the lines of a greatest change card showing the relative change
+    of its series and the series' average over the latest years.
+
+    Parameters
+    ----------
+    group : str
+        The card's group: "overall", "male" or "female".
+
+    Returns
+    -------
+    list
+        The relative change and recent average lines.
+    """
+    return [
+        html.Div(
+            [
+                html.Span("Relative change: ", className="text-muted"),
+                html.Span(id=f"highest-{group}-change-relative"),
+            ],
+            className="small mt-2",
+        ),
+        html.Div(
+            [
+                html.Span("Recent average: ", className="text-muted"),
+                html.Span(id=f"highest-{group}-change-rolling"),
+            ],
+            className="small",
+        ),
+    ]
+
 
 # Navigation bar
 navigation_bar = dbc.NavbarSimple(
@@ -452,7 +509,11 @@ occ_stats_header = dbc.CardHeader(
 emp_change_header = html.H5(
     [
         html.I(className="bi bi-activity me-2"),
-        "Greatest % Change in Employment (2021-2023)",
+        "Greatest % Change in Employment (",
+        html.Span(id="change-start-year"),
+        "-",
+        html.Span(id="change-end-year"),
+        ")",
     ],
     className="custom-header-style",
 )
@@ -476,7 +537,10 @@ high_overall_disp_occ = html.Div(
             className="bi bi-briefcase me-2 text-muted"
         ),
         html.Span(
-            f"Occupation: {highest_overall_disparity_occupation}",
+            [
+                "Occupation: ",
+                html.Span(id="highest-overall-change-occupation"),
+            ],
             className="text-muted",
         ),
     ],
@@ -489,7 +553,7 @@ high_overall_disp_gender = html.Div(
             className="bi bi-gender-ambiguous me-2 text-muted"
         ),
         html.Span(
-            f"Gender: {highest_overall_disparity_gender}"
+            ["Gender: ", html.Span(id="highest-overall-change-gender")]
         ),
     ],
     className="d-flex align-items-center mb-2",
@@ -501,7 +565,7 @@ high_overall_disp_region = html.Div(
             className="bi bi-geo me-2 text-muted"
         ),
         html.Span(
-            f"Region: {highest_overall_disparity_region}"
+            ["Region: ", html.Span(id="highest-overall-change-region")]
         ),
     ],
     className="d-flex align-items-center",
@@ -509,17 +573,8 @@ high_overall_disp_region = html.Div(
 #    3.2.2.5 Highest overall disparity percentage
 high_overall_disp_perc = html.Div(
     [
-        html.I(
-            className=f"bi {
-                get_metric_style(float(highest_overall_disparity_percentage)
-                                 )['icon']} me-2"
-        ),
-        html.Span(
-            f"{highest_overall_disparity_percentage}%",
-            className=f"h4 text-{
-                get_metric_style(float(highest_overall_disparity_percentage)
-                                 )['color']}",
-        ),
+        html.I(id="highest-overall-change-icon"),
+        html.Span(id="highest-overall-change-percentage"),
     ],
     className="d-flex align-items-center mb-2",
 )
@@ -534,6 +589,7 @@ high_overall_change_card = dbc.Col(
                     high_overall_disp_gender,
                     high_overall_disp_region,
                     high_overall_disp_perc,
+                    *change_trend("overall"),
                 ],
                 className="border-start border-purple border-4 p-3",
             ),
@@ -564,7 +620,10 @@ high_m_year_disp_occ = html.Div(
             className="bi bi-briefcase me-2 text-muted"
         ),
         html.Span(
-            f"Occupation: {highest_m_year_disparity_occupation}",
+            [
+                "Occupation: ",
+                html.Span(id="highest-male-change-occupation"),
+            ],
             className="text-muted",
         ),
     ],
@@ -577,7 +636,7 @@ high_m_year_disp_region = html.Div(
             className="bi bi-geo me-2 text-muted"
         ),
         html.Span(
-            f"Region: {highest_m_year_disparity_region}",
+            ["Region: ", html.Span(id="highest-male-change-region")],
             className="text-muted",
         ),
     ],
@@ -586,19 +645,8 @@ high_m_year_disp_region = html.Div(
 #    3.2.3.4 Highest male change disparity percentage
 high_m_year_disp_perc = html.Div(
     [
-        html.I(
-            className=(
-                f"bi {get_metric_style(float(
-                    highest_m_year_disparity_percentage))['icon']} me-2"
-            )
-        ),
-        html.Span(
-            f"{highest_m_year_disparity_percentage}%",
-            className=(
-                f"h4 text-{get_metric_style(float(
-                    highest_m_year_disparity_percentage))['color']}"
-            ),
-        ),
+        html.I(id="highest-male-change-icon"),
+        html.Span(id="highest-male-change-percentage"),
     ],
     className="d-flex align-items-center",
 )
@@ -612,6 +660,7 @@ highest_male_change_card = dbc.Col(
                     high_m_year_disp_occ,
                     high_m_year_disp_region,
                     high_m_year_disp_perc,
+                    *change_trend("male"),
                 ],
                 className="custom-male-border",
             ),
@@ -643,7 +692,10 @@ high_f_year_disp_occ = html.Div(
             className="bi bi-briefcase me-2 text-muted"
         ),
         html.Span(
-            f"Occupation: {highest_f_year_disparity_occupation}",
+            [
+                "Occupation: ",
+                html.Span(id="highest-female-change-occupation"),
+            ],
             className="text-muted",
         ),
     ],
@@ -656,7 +708,7 @@ high_f_year_disp_region = html.Div(
             className="bi bi-geo me-2 text-muted"
         ),
         html.Span(
-            f"Region: {highest_f_year_disparity_region}",
+            ["Region: ", html.Span(id="highest-female-change-region")],
             className="text-muted",
         ),
     ],
@@ -665,17 +717,8 @@ high_f_year_disp_region = html.Div(
 #    3.2.4.4 Highest female change disparity percentage
 high_f_year_disp_perc = html.Div(
     [
-        html.I(
-            className=(
-                f"bi {get_metric_style(float(
-                    highest_f_year_disparity_percentage))['icon']} me-2"
-            )
-        ),
-        html.Span(
-            f"{highest_f_year_disparity_percentage}%",
-            className=f"h4 text-{get_metric_style(float(
-                highest_f_year_disparity_percentage))['color']}",
-        ),
+        html.I(id="highest-female-change-icon"),
+        html.Span(id="highest-female-change-percentage"),
     ],
     className="d-flex align-items-center",
 )
@@ -689,6 +732,7 @@ highest_female_change_card = dbc.Col(
                     high_f_year_disp_occ,
                     high_f_year_disp_region,
                     high_f_year_disp_perc,
+                    *change_trend("female"),
                 ],
                 className="custom-female-border",
             ),
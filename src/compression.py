@@ -0,0 +1,100 @@
+import gzip
+from flask import request
+from config import (
+    COMPRESSION_BROTLI_QUALITY,
+    COMPRESSION_GZIP_LEVEL,
+    COMPRESSION_MIN_SIZE,
+)
+
+try:
+    import brotli
+except ImportError:
+    # Without brotli, responses are only gzip compressed
+    brotli = None
+
+# Dash routes whose JSON responses are compressed, relative to the app's
+# routes prefix
+COMPRESSED_ROUTES = (
+    "_dash-layout",
+    "_dash-dependencies",
+    "_dash-update-component",
+)
+
+
+def compress(data, encoding, gzip_level=COMPRESSION_GZIP_LEVEL,
+             brotli_quality=COMPRESSION_BROTLI_QUALITY):
+    """
+    Compress a response body.
+
+    Parameters
+    ----------
+    data : bytes
+        The body to compress.
+    encoding : str
+        "br" or "gzip".
+    gzip_level : int, optional
+        The gzip compression level, from 1 (fastest) to 9 (smallest).
+    brotli_quality : int, optional
+        The brotli quality, from 0 (fastest) to 11 (smallest).
+
+    Returns
+    -------
+    bytes
+        The compressed body.
+    """
+    if encoding == "br":
+        return brotli.compress(data, quality=brotli_quality)
+    return gzip.compress(data, compresslevel=gzip_level, mtime=0)
+
+
+def choose_encoding(accept_encodings):
+    """
+    Choose the best encoding the client accepts, preferring brotli.
+
+    Parameters
+    ----------
+    accept_encodings : werkzeug.datastructures.Accept
+        The parsed Accept-Encoding header.
+
+    Returns
+    -------
+    str or None
+        "br", "gzip" or None if neither is accepted.
+    """
+    offered = ["br", "gzip"] if brotli else ["gzip"]
+    return accept_encodings.best_match(offered)
+
+
+def enable_compression(app, min_size=COMPRESSION_MIN_SIZE):
+    """
+    Compress the Dash layout, dependencies and callback responses of the
+    app's Flask server with the best encoding each client accepts.
+
+    Parameters
+    ----------
+    app : Dash
+        The Dash app instance.
+    min_size : int, optional
+        Responses smaller than this many bytes are sent uncompressed, as
+        compressing them saves too little to be worth the CPU time.
+    """
+    prefix = app.config.routes_pathname_prefix
+    paths = {f"{prefix}{route}" for route in COMPRESSED_ROUTES}
+
+    @app.server.after_request
+    def compress_response(response):
+        if (request.path not in paths
+                or response.status_code != 200
+                or response.direct_passthrough
+                or "Content-Encoding" in response.headers):
+            return response
+
+        response.vary.add("Accept-Encoding")
+        encoding = choose_encoding(request.accept_encodings)
+        data = response.get_data()
+        if encoding is None or len(data) < min_size:
+            return response
+
+        response.set_data(compress(data, encoding))
+        response.headers["Content-Encoding"] = encoding
+        return response
@@ -0,0 +1,81 @@
+import os
+from pathlib import Path
+
+# Root directory of the project
+BASE_DIR = Path(__file__).parent.parent
+
+# Path to the prepared employment workbook, overridable for deployments
+DATA_PATH = Path(
+    os.environ.get(
+        "EMPLOYMENT_DATA_PATH",
+        BASE_DIR / "data" / "employment_prepared.xlsx"
+    )
+)
+
+# Directory holding the columnar cache built from the workbook
+CACHE_DIR = Path(
+    os.environ.get("EMPLOYMENT_CACHE_DIR", BASE_DIR / "data" / ".cache")
+)
+
+# Whether to persist the headline statistics so later starts can skip them
+HEADLINE_SNAPSHOT_ENABLED = (
+    os.environ.get("HEADLINE_SNAPSHOT_ENABLED", "1") == "1"
+)
+
+# Number of chart figures kept in the in-process figure cache (0 disables it)
+FIGURE_CACHE_SIZE = int(os.environ.get("FIGURE_CACHE_SIZE", "256"))
+
+# Seconds a cached figure stays valid (0 keeps it until evicted)
+FIGURE_CACHE_TTL = float(os.environ.get("FIGURE_CACHE_TTL", "3600"))
+
+# Whether to time every callback and serve the measurements on /metrics
+METRICS_ENABLED = os.environ.get("METRICS_ENABLED", "0") == "1"
+
+# Address and waitress settings of the production server (src/serve.py)
+SERVER_HOST = os.environ.get("SERVER_HOST", "127.0.0.1")
+SERVER_PORT = int(os.environ.get("SERVER_PORT", "8050"))
+SERVER_THREADS = int(os.environ.get("SERVER_THREADS", "8"))
+SERVER_CONNECTION_LIMIT = int(
+    os.environ.get("SERVER_CONNECTION_LIMIT", "100")
+)
+SERVER_CHANNEL_TIMEOUT = int(os.environ.get("SERVER_CHANNEL_TIMEOUT", "120"))
+SERVER_BACKLOG = int(os.environ.get("SERVER_BACKLOG", "1024"))
+
+# Whether to build every data view and chart figure before serving
+WARM_CACHES = os.environ.get("WARM_CACHES", "1") == "1"
+
+# Where the browser loads Bootstrap, animate.css and html2canvas from:
+# "external" (their CDNs) or "vendored" (content-hashed local copies
+# fetched with ``python src/vendor_assets.py``)
+ASSET_MODE = os.environ.get("ASSET_MODE", "external")
+
+# Directory holding the vendored copies, served under /assets/vendor/
+VENDOR_DIR = BASE_DIR / "src" / "assets" / "vendor"
+
+# Whether to gzip or brotli compress the Dash layout, dependencies and
+# callback responses, and the settings used to do so
+COMPRESSION_ENABLED = os.environ.get("COMPRESSION_ENABLED", "1") == "1"
+COMPRESSION_MIN_SIZE = int(os.environ.get("COMPRESSION_MIN_SIZE", "500"))
+COMPRESSION_GZIP_LEVEL = int(os.environ.get("COMPRESSION_GZIP_LEVEL", "6"))
+COMPRESSION_BROTLI_QUALITY = int(
+    os.environ.get("COMPRESSION_BROTLI_QUALITY", "4")
+)
+
+# Database holding the analyses saved by each browser session
+SAVED_ANALYSES_DB_URL = os.environ.get(
+    "SAVED_ANALYSES_DB_URL",
+    f"sqlite:///{BASE_DIR / 'data' / 'saved_analyses.db'}"
+)
+
+# Number of saved analyses listed in the menu when a session is restored
+SAVED_ANALYSES_PAGE_SIZE = int(
+    os.environ.get("SAVED_ANALYSES_PAGE_SIZE", "50")
+)
+
+# Seconds between checks of the workbook for a new version to load without
+# restarting (0 disables the check)
+DATASET_WATCH_INTERVAL = float(os.environ.get("DATASET_WATCH_INTERVAL", "0"))
+
+# Number of consecutive years averaged in the rolling means of the year
+# deltas, shown as the recent average in the greatest change cards
+YEAR_ROLLING_WINDOW = int(os.environ.get("YEAR_ROLLING_WINDOW", "2"))
@@ -0,0 +1,238 @@
+import hashlib
+import io
+import json
+import os
+from pathlib import Path
+import pandas as pd
+from config import DATA_PATH, CACHE_DIR
+
+# Name of the manifest recording which cache file belongs to which workbook
+MANIFEST_NAME = "manifest.json"
+
+
+def file_digest(path):
+    """
+    Compute the SHA-256 digest of a file's contents.
+
+    Parameters
+    ----------
+    path : Path
+        The file to hash.
+
+    Returns
+    -------
+    str
+        The hexadecimal SHA-256 digest.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        # Hash the file in chunks so large workbooks are not read at once
+        for chunk in iter(lambda: file.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _read_manifest(cache_dir):
+    """
+    Read the cache manifest, returning an empty manifest if it is missing
+    or unreadable.
+
+    Parameters
+    ----------
+    cache_dir : Path
+        The cache directory.
+
+    Returns
+    -------
+    dict
+        The manifest, keyed by the resolved workbook path.
+    """
+    try:
+        with open(cache_dir / MANIFEST_NAME) as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+
+def write_atomically(path, write):
+    """
+    Write a file through a temporary sibling and rename it into place, so
+    concurrent workers never observe a partially written file.
+
+    Parameters
+    ----------
+    path : Path
+        The destination file.
+    write : callable
+        Function called with the temporary path to write the content.
+    """
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+def _recorded_digest(data_path, cache_dir):
+    """
+    Return the content digest recorded in the manifest for the workbook,
+    provided the file's mtime and size are unchanged since it was recorded.
+
+    Parameters
+    ----------
+    data_path : Path
+        The workbook to fingerprint.
+    cache_dir : Path
+        The cache directory holding the manifest.
+
+    Returns
+    -------
+    str or None
+        The recorded hexadecimal SHA-256 digest, or None if the workbook
+        was never recorded or has been touched since.
+    """
+    stat = data_path.stat()
+    entry = _read_manifest(cache_dir).get(str(data_path.resolve()))
+
+    # Trust the recorded digest only if the file has not been touched
+    if (entry and entry["mtime_ns"] == stat.st_mtime_ns
+            and entry["size"] == stat.st_size):
+        return entry["sha256"]
+    return None
+
+
+def _cache_path(data_path, cache_dir, digest):
+    """
+    Return the cache file holding a version of the workbook.
+
+    Parameters
+    ----------
+    data_path : Path
+        The workbook.
+    cache_dir : Path
+        The cache directory.
+    digest : str
+        The content digest of the version.
+
+    Returns
+    -------
+    Path
+        The Feather file named after the workbook and its digest.
+    """
+    return cache_dir / f"{data_path.stem}-{digest[:16]}.feather"
+
+
+def load_employment_data(data_path=DATA_PATH, cache_dir=CACHE_DIR):
+    """
+    Load the employment workbook, converting it once into a Feather file
+    that later process starts read instead of parsing the xlsx.
+
+    The cache file is named after the workbook's content hash and the
+    manifest records the workbook's mtime and size, so an edited workbook
+    is picked up automatically while an untouched one is never re-hashed.
+    If pyarrow is not installed or the cache directory is not writable,
+    the workbook is read directly.
+
+    Parameters
+    ----------
+    data_path : Path, optional
+        The workbook to load.
+    cache_dir : Path, optional
+        The directory in which the columnar cache is kept.
+
+    Returns
+    -------
+    pd.DataFrame
+        The employment dataframe.
+    str
+        The content digest of the workbook the dataframe was read from,
+        which also keys its cache file.
+    """
+    data_path = Path(data_path)
+    cache_dir = Path(cache_dir)
+
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        # Without pyarrow there is no columnar format to cache into
+        content = data_path.read_bytes()
+        return (
+            pd.read_excel(io.BytesIO(content)),
+            hashlib.sha256(content).hexdigest()
+        )
+
+    # Look for a cache file matching the recorded content of the workbook,
+    # otherwise hash the bytes that are parsed, so the digest always
+    # describes the data it is returned with
+    digest = _recorded_digest(data_path, cache_dir)
+    if digest is not None:
+        cache_file = _cache_path(data_path, cache_dir, digest)
+    if digest is None or not cache_file.exists():
+        content = data_path.read_bytes()
+        digest = hashlib.sha256(content).hexdigest()
+        cache_file = _cache_path(data_path, cache_dir, digest)
+    if cache_file.exists():
+        df = pd.read_feather(cache_file)
+    else:
+        df = pd.read_excel(io.BytesIO(content))
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            write_atomically(cache_file, df.to_feather)
+        except OSError:
+            # Serve the parsed workbook even if the cache cannot be written
+            return df, digest
+
+    try:
+        _update_manifest(data_path, cache_dir, cache_file, digest)
+    except OSError:
+        pass
+
+    # Return the loaded dataframe and the digest its cache file is keyed on
+    return df, digest
+
+
+def _update_manifest(data_path, cache_dir, cache_file, digest):
+    """
+    Record the workbook's fingerprint in the manifest and remove cache
+    files left behind by earlier versions of the same workbook.
+
+    Parameters
+    ----------
+    data_path : Path
+        The workbook that was loaded.
+    cache_dir : Path
+        The cache directory.
+    cache_file : Path
+        The cache file matching the workbook's current content.
+    digest : str
+        The workbook's content digest.
+    """
+    stat = data_path.stat()
+    key = str(data_path.resolve())
+    manifest = _read_manifest(cache_dir)
+    entry = {
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "sha256": digest,
+        "cache_file": cache_file.name,
+    }
+
+    # Skip the write when nothing changed, the common case on startup
+    if manifest.get(key) == entry:
+        return
+
+    previous = manifest.get(key)
+    manifest[key] = entry
+    write_atomically(
+        cache_dir / MANIFEST_NAME,
+        lambda path: path.write_text(json.dumps(manifest, indent=2))
+    )
+
+    # Remove the stale cache file unless another workbook still uses it
+    if previous and previous["cache_file"] != cache_file.name:
+        in_use = {item["cache_file"] for item in manifest.values()}
+        stale_file = cache_dir / previous["cache_file"]
+        if previous["cache_file"] not in in_use and stale_file.exists():
+            stale_file.unlink()
@@ -0,0 +1,523 @@
+import gc
+import hashlib
+import threading
+from collections import namedtuple
+import pandas as pd
+from data_loader import load_employment_data
+
+# Column holding the employment percentage for each row
+PERCENTAGE_COLUMN = (
+    "Percentage Employed (Relative to Total Employment in the Year)"
+)
+
+# Expected columns of the employment dataset and the types they are stored
+# with: labels repeated on every row are categoricals, and numbers not used
+# in calculations are downcast
+SCHEMA = {
+    "Code": "category",
+    "Region": "category",
+    "Year": "int16",
+    "Gender": "category",
+    "Occupation Type": "category",
+    PERCENTAGE_COLUMN: "float64",
+    "Margin of Error (%)": "float32",
+    "Latitude": "float64",
+    "Longitude": "float64",
+}
+
+# Columns derived from the occupation types at ingestion, so callbacks
+# never parse labels per request, and their types
+DERIVED_SCHEMA = {
+    # The numeric occupation code, matching the occupation slider's values
+    "Occupation Code": "int16",
+    # The occupation code as the label of the bar chart's axis, e.g. "3"
+    "Short Occupation Type": "category",
+}
+
+# Attributes of a region, occupation type or gender rather than of a row,
+# stored once per label in a dimension table instead of on every row
+DIMENSIONS = {
+    "Region": ["Code", "Latitude", "Longitude"],
+    "Occupation Type": list(DERIVED_SCHEMA),
+    "Gender": [],
+}
+
+# Columns of the fact table: the dimension keys, the year and the values
+FACT_COLUMNS = [
+    column for column in SCHEMA
+    if not any(column in attributes for attributes in DIMENSIONS.values())
+]
+
+# A version of the dataset: the fact dataframe, the digest of its source,
+# its version number and its dimension tables
+DatasetSnapshot = namedtuple(
+    "DatasetSnapshot", ["dataset", "digest", "version", "dimensions"]
+)
+
+# The single employment dataset shared by every module in the process,
+# replaced as a whole so readers always see a matching dataframe, digest
+# and version
+_snapshot = None
+_version = 0
+_lock = threading.RLock()
+
+# Functions called with the new version whenever the dataset is replaced
+_change_listeners = []
+
+# Builders for views derived from the dataset, and their built values
+# keyed by view name and dataset version
+_view_builders = {}
+_view_cache = {}
+
+# A lock per view name and dataset version, held while the view is built
+# so it is built once without holding up other views or a dataset swap
+_view_locks = {}
+
+
+def _freeze(df):
+    """
+    Rebuild the dataframe on read-only arrays so that callers cannot
+    modify the shared dataset in place.
+
+    Object (string) columns are left writable because several pandas
+    routines cannot read from read-only object buffers.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The dataframe to freeze.
+
+    Returns
+    -------
+    pd.DataFrame
+        A dataframe with the same columns and index, sharing their values,
+        with read-only numeric values and categorical codes.
+    """
+    columns = {}
+    for column, series in df.items():
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            # Freeze the integer codes behind the categories
+            codes = series.cat.codes.to_numpy()
+            codes.setflags(write=False)
+            values = pd.Categorical.from_codes(codes, dtype=series.dtype)
+        else:
+            values = series.to_numpy()
+            if values.dtype != object:
+                values.setflags(write=False)
+        columns[column] = values
+
+    # Keep one array per column, rather than copying them into blocks
+    return pd.DataFrame(columns, index=df.index, copy=False)
+
+
+def occupation_sort_key(occupation_type):
+    """
+    Sort occupation types by their numeric code, so "10: ..." follows
+    "9: ...".
+
+    Parameters
+    ----------
+    occupation_type : str
+        An occupation type, e.g. "3: associate prof & tech occupations".
+
+    Returns
+    -------
+    tuple
+        The numeric code (or infinity if there is none) and the type.
+    """
+    code = occupation_type.split(":")[0]
+    return (int(code) if code.isdigit() else float("inf"), occupation_type)
+
+
+def build_dimension(df, key):
+    """
+    Build the dimension table of a key column from the rows' attributes.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The typed employment dataframe, with the key as a categorical.
+    key : str
+        The key column, e.g. "Region".
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per category of the key, in category order and indexed by
+        its label, with the attributes listed in ``DIMENSIONS``.
+
+    Raises
+    ------
+    ValueError
+        If an attribute takes more than one value for the same label.
+    """
+    attributes = DIMENSIONS[key]
+    categories = df[key].cat.categories
+    # Index by the fact column's categories, so joins keep it categorical
+    labels = pd.CategoricalIndex(categories, categories=categories, name=key)
+    if not attributes:
+        return pd.DataFrame(index=labels)
+    grouped = df.groupby(key, observed=False)[attributes]
+    varying = [
+        column for column, count in grouped.nunique().max().items()
+        if count > 1
+    ]
+    if varying:
+        raise ValueError(f"{varying} must not vary within a {key}")
+    dimension = grouped.first()
+    dimension.index = labels
+    return dimension
+
+
+def prepare_dataset(df):
+    """
+    Check the dataframe has the expected columns, cast them to the schema's
+    types and split it into a fact table and dimension tables.
+
+    The fact table keeps a row per region, year, occupation type and
+    gender, holding the year, the values and a categorical per dimension
+    whose integer codes are the row positions in that dimension's table.
+    Categories are sorted, with occupation types in the order of their
+    codes, so every dataset with the same labels gets the same codes.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The raw employment dataframe.
+
+    Returns
+    -------
+    tuple
+        The fact dataframe and a dict of dimension dataframes keyed by the
+        fact column they describe.
+
+    Raises
+    ------
+    ValueError
+        If any expected column is missing, an occupation type does not
+        start with a numeric code, or a region's code or coordinates vary
+        between its rows.
+    """
+    missing = [column for column in SCHEMA if column not in df.columns]
+    if missing:
+        raise ValueError(f"Employment data is missing columns: {missing}")
+    df = df.astype({
+        column: dtype for column, dtype in SCHEMA.items()
+        if dtype != "category"
+    })
+
+    # Store each label once per category, in a fixed order
+    for column, dtype in SCHEMA.items():
+        if dtype == "category":
+            labels = df[column].astype(str)
+            key = occupation_sort_key if column == "Occupation Type" else None
+            df[column] = pd.Categorical(
+                labels, categories=sorted(labels.unique(), key=key)
+            )
+    dimensions = {
+        key: build_dimension(df, key) for key in DIMENSIONS
+        if key != "Occupation Type"
+    }
+
+    # Parse the occupation code of each category once, not of every row
+    occupations = df["Occupation Type"].cat.categories
+    codes = [code for code, _ in map(occupation_sort_key, occupations)]
+    if float("inf") in codes:
+        raise ValueError("Occupation types must start with a numeric code")
+    # Label each occupation by its code, one category per distinct code
+    short_types = [str(code) for code in codes]
+    dimensions["Occupation Type"] = pd.DataFrame({
+        "Occupation Code": pd.Series(
+            codes, dtype=DERIVED_SCHEMA["Occupation Code"]
+        ).to_numpy(),
+        "Short Occupation Type": pd.Categorical(
+            short_types, categories=sorted(set(short_types), key=int)
+        ),
+    }, index=pd.CategoricalIndex(
+        occupations, categories=occupations, name="Occupation Type"
+    ))
+
+    return df[FACT_COLUMNS], {key: dimensions[key] for key in DIMENSIONS}
+
+
+def dataset_snapshot():
+    """
+    Return the current version of the shared dataset, loading it on first
+    use.
+
+    Work that reads the dataset and its derived views more than once
+    should take one snapshot and use it throughout, so a dataset swapped
+    in meanwhile cannot mix two versions.
+
+    Returns
+    -------
+    DatasetSnapshot
+        The fact dataframe, its source digest, its version number and its
+        dimension tables.
+    """
+    global _snapshot, _version
+    if _snapshot is None:
+        with _lock:
+            # Check again in case another thread loaded it while waiting
+            if _snapshot is None:
+                workbook, digest = load_employment_data()
+                dataset, dimensions = prepare_dataset(workbook)
+                _version += 1
+                _snapshot = DatasetSnapshot(
+                    _freeze(dataset), digest, _version, dimensions
+                )
+    return _snapshot
+
+
+def get_dataset():
+    """
+    Return the shared employment fact dataframe, loading it on first use.
+
+    The returned dataframe is shared and read-only; filter or copy it
+    before making changes. Attributes of its regions and occupation types
+    are in the tables returned by ``get_dimension``.
+
+    Returns
+    -------
+    pd.DataFrame
+        The employment fact dataframe.
+    """
+    return dataset_snapshot().dataset
+
+
+def get_dimension(key, snapshot=None):
+    """
+    Return the dimension table of a fact column, e.g. the coordinates of
+    each region.
+
+    Parameters
+    ----------
+    key : str
+        The fact column the table describes: "Region", "Occupation Type"
+        or "Gender".
+    snapshot : DatasetSnapshot, optional
+        The version of the dataset, by default the current one.
+
+    Returns
+    -------
+    pd.DataFrame
+        The dimension table, indexed by label in category order.
+    """
+    if snapshot is None:
+        snapshot = dataset_snapshot()
+    return snapshot.dimensions[key]
+
+
+def set_dataset(df, digest=None):
+    """
+    Replace the shared employment dataframe, e.g. with a reloaded workbook
+    or a synthetic dataset for benchmarks.
+
+    The new dataframe is validated and prepared before the swap, which is
+    a single assignment: callbacks already running keep the snapshot they
+    started with. The version number changes, so caches keyed by it stop
+    serving results of the previous dataset, the views built from it are
+    dropped and the listeners registered with ``on_dataset_change`` are
+    called.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The new employment dataframe, with the columns of the workbook.
+    digest : str, optional
+        The content digest identifying the dataset, by default a SHA-256
+        digest of its rows.
+
+    Returns
+    -------
+    int
+        The new dataset version.
+
+    Raises
+    ------
+    ValueError
+        If any expected column is missing, or the dataframe cannot be
+        split into the fact and dimension tables.
+    """
+    global _snapshot, _version
+    dataset, dimensions = prepare_dataset(df)
+    dataset = _freeze(dataset)
+    if digest is None:
+        # Hash the rows, since the dataset has no source file to hash
+        row_hashes = pd.util.hash_pandas_object(dataset, index=False)
+        digest = hashlib.sha256(row_hashes.to_numpy().tobytes()).hexdigest()
+    with _lock:
+        _version += 1
+        version = _version
+        _snapshot = DatasetSnapshot(dataset, digest, version, dimensions)
+        # Release the views of earlier datasets
+        for key in [key for key in _view_cache if key[1] != version]:
+            del _view_cache[key]
+        for key in [key for key in _view_locks if key[1] != version]:
+            del _view_locks[key]
+        listeners = list(_change_listeners)
+    for listener in listeners:
+        listener(version)
+    return version
+
+
+def on_dataset_change(listener):
+    """
+    Register a function to call whenever the dataset is replaced, e.g. to
+    drop cached results of earlier versions.
+
+    Parameters
+    ----------
+    listener : callable
+        Function called with the new dataset version.
+
+    Returns
+    -------
+    callable
+        The listener, so this can be used as a decorator.
+    """
+    with _lock:
+        _change_listeners.append(listener)
+    return listener
+
+
+def get_dataset_version():
+    """
+    Return the version number of the loaded dataset.
+
+    Returns
+    -------
+    int
+        The dataset version, which changes whenever the dataset changes.
+    """
+    return dataset_snapshot().version
+
+
+def get_dataset_digest():
+    """
+    Return the content digest of the workbook the dataset was loaded from.
+
+    Unlike the version number, the digest is stable across processes, so
+    it can key results persisted to disk.
+
+    Returns
+    -------
+    str
+        The hexadecimal SHA-256 digest of the source workbook.
+    """
+    return dataset_snapshot().digest
+
+
+def derived_view(name):
+    """
+    Register a function that derives a view from the dataset.
+
+    The decorated function is called with a ``DatasetSnapshot`` and its
+    result is memoized until the dataset version changes. Calling the
+    decorated function returns the memoized view of the current dataset,
+    or of the snapshot passed to it. Views derived from other views should
+    request them for the same snapshot, so they never mix two versions.
+
+    Parameters
+    ----------
+    name : str
+        Unique name of the view.
+
+    Returns
+    -------
+    callable
+        The decorator.
+    """
+    def decorator(builder):
+        _view_builders[name] = builder
+
+        def accessor(snapshot=None):
+            return get_view(name, snapshot)
+        accessor.__name__ = builder.__name__
+        accessor.__doc__ = builder.__doc__
+        return accessor
+    return decorator
+
+
+def get_view(name, snapshot=None):
+    """
+    Return a derived view of the dataset, building it on first use.
+
+    Each view is built by one thread at a time, while other threads keep
+    building and reading other views and the dataset can still be
+    replaced.
+
+    Parameters
+    ----------
+    name : str
+        Name of the view, as registered with ``derived_view``.
+    snapshot : DatasetSnapshot, optional
+        The version of the dataset to derive the view from, by default the
+        current one.
+
+    Returns
+    -------
+    object
+        The derived view for the snapshot's dataset version.
+    """
+    if snapshot is None:
+        snapshot = dataset_snapshot()
+    key = (name, snapshot.version)
+    try:
+        return _view_cache[key]
+    except KeyError:
+        pass
+    with _lock:
+        view_lock = _view_locks.setdefault(key, threading.Lock())
+    with view_lock:
+        # Check again in case another thread built it while waiting
+        if key in _view_cache:
+            return _view_cache[key]
+        view = _view_builders[name](snapshot)
+        with _lock:
+            # Keep only views of the current dataset, not of a replaced one
+            if snapshot is _snapshot:
+                _view_cache[key] = view
+        return view
+
+
+def memory_report():
+    """
+    Report the memory used by the shared dataset and count how many full
+    copies of it are alive in the process.
+
+    A copy is any live dataframe with the dataset's columns and row count;
+    a healthy process has exactly one.
+
+    Returns
+    -------
+    dict
+        The dataset version, shape, memory usage in bytes of the fact
+        table overall and per column and of each dimension table, number
+        of full copies and the names of the views built so far.
+    """
+    dataset, _, version, dimensions = dataset_snapshot()
+    columns = list(dataset.columns)
+    column_bytes = dataset.memory_usage(deep=True, index=False)
+    full_copies = sum(
+        1 for obj in gc.get_objects()
+        if isinstance(obj, pd.DataFrame)
+        and len(obj) == len(dataset)
+        and list(obj.columns) == columns
+    )
+    return {
+        "version": version,
+        "rows": len(dataset),
+        "columns": len(columns),
+        "bytes": int(column_bytes.sum()),
+        "column_bytes": {
+            column: int(size) for column, size in column_bytes.items()
+        },
+        "dimension_bytes": {
+            key: int(dimension.memory_usage(deep=True).sum())
+            for key, dimension in dimensions.items()
+        },
+        "full_copies": full_copies,
+        "views": sorted(name for name, view_version in _view_cache
+                        if view_version == version),
+    }
@@ -0,0 +1,158 @@
+import logging
+import threading
+from pathlib import Path
+from config import CACHE_DIR, DATA_PATH, DATASET_WATCH_INTERVAL, WARM_CACHES
+from data_loader import load_employment_data
+from dataset_registry import get_dataset_digest, set_dataset
+from warmup import warm_caches
+
+logger = logging.getLogger(__name__)
+
+# The (mtime, size) of the workbook when it was last checked, the thread
+# checking it and the event that stops the thread
+_last_seen = {}
+_watcher = None
+_stop = threading.Event()
+_lock = threading.Lock()
+
+
+def _file_signature(data_path):
+    """
+    Return the modification time and size of the workbook.
+
+    Parameters
+    ----------
+    data_path : Path
+        The workbook.
+
+    Returns
+    -------
+    tuple or None
+        The mtime in nanoseconds and the size, or None if the file cannot
+        be read.
+    """
+    try:
+        stat = Path(data_path).stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def check_for_update(data_path=DATA_PATH, cache_dir=CACHE_DIR):
+    """
+    Load the workbook and swap it in if its content has changed since the
+    dataset was loaded.
+
+    The new version is loaded and validated before the swap, so the old
+    one keeps being served meanwhile, and keeps being served if the new
+    workbook cannot be read or lacks a column. A rejected workbook is not
+    retried until it changes again.
+
+    Parameters
+    ----------
+    data_path : Path, optional
+        The workbook to watch.
+    cache_dir : Path, optional
+        The directory in which the columnar cache is kept.
+
+    Returns
+    -------
+    int or None
+        The new dataset version, or None if nothing was swapped in.
+    """
+    key = str(Path(data_path).resolve())
+    signature = _file_signature(data_path)
+    # Skip the workbook while it is missing or untouched since the last
+    # check, the common case
+    if signature is None or _last_seen.get(key) == signature:
+        return None
+    _last_seen[key] = signature
+
+    try:
+        workbook, digest = load_employment_data(data_path, cache_dir)
+        if digest == get_dataset_digest():
+            # Touched but not changed, e.g. copied over with the same
+            # content, which the loader served from its cache
+            return None
+        version = set_dataset(workbook, digest=digest)
+    except Exception:
+        # Keep serving the loaded dataset, e.g. while the file is still
+        # being written
+        logger.exception("Could not reload %s", data_path)
+        return None
+
+    logger.info("Loaded %s as dataset version %d", data_path, version)
+    return version
+
+
+def _watch(interval, data_path, cache_dir, warm):
+    """
+    Check the workbook every ``interval`` seconds until stopped.
+
+    Parameters
+    ----------
+    interval : float
+        Seconds between checks.
+    data_path : Path
+        The workbook to watch.
+    cache_dir : Path
+        The directory in which the columnar cache is kept.
+    warm : bool
+        Whether to rebuild the caches after a new version is swapped in.
+    """
+    while not _stop.wait(interval):
+        if check_for_update(data_path, cache_dir) is not None and warm:
+            # Rebuild the views and figures here rather than in the first
+            # callbacks to need them
+            warm_caches()
+
+
+def start_dataset_watcher(interval=DATASET_WATCH_INTERVAL,
+                          data_path=DATA_PATH, cache_dir=CACHE_DIR,
+                          warm=WARM_CACHES):
+    """
+    Start a background thread that reloads the workbook when it changes.
+
+    Parameters
+    ----------
+    interval : float, optional
+        Seconds between checks.
+    data_path : Path, optional
+        The workbook to watch.
+    cache_dir : Path, optional
+        The directory in which the columnar cache is kept.
+    warm : bool, optional
+        Whether to rebuild the caches after a new version is swapped in.
+
+    Returns
+    -------
+    threading.Thread
+        The watcher thread, or the one already running.
+    """
+    global _watcher
+    with _lock:
+        if _watcher is not None and _watcher.is_alive():
+            return _watcher
+        # Remember the workbook as loaded, so only later changes count
+        _last_seen[str(Path(data_path).resolve())] = (
+            _file_signature(data_path)
+        )
+        _stop.clear()
+        _watcher = threading.Thread(
+            target=_watch, args=(interval, data_path, cache_dir, warm),
+            name="dataset-watcher", daemon=True
+        )
+        _watcher.start()
+        return _watcher
+
+
+def stop_dataset_watcher():
+    """
+    Stop the watcher thread, waiting for a reload in progress to finish.
+    """
+    global _watcher
+    with _lock:
+        _stop.set()
+        if _watcher is not None:
+            _watcher.join()
+        _watcher = None
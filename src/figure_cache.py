@@ -0,0 +1,118 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from config import FIGURE_CACHE_SIZE, FIGURE_CACHE_TTL
+from dataset_registry import get_dataset_version, on_dataset_change
+
+# Serialized figures keyed by chart, inputs and dataset version, with the
+# time each was stored, least recently used first
+_figures = OrderedDict()
+_lock = threading.Lock()
+_counters = {
+    "hits": 0, "misses": 0, "evictions": 0, "expirations": 0,
+    "invalidations": 0,
+}
+
+# Clock used for expiry, replaceable in tests
+_clock = time.monotonic
+
+
+def cached_figure(chart, inputs, build):
+    """
+    Return a chart figure from the cache, building and storing it on a miss.
+
+    Figures are stored as Plotly JSON, so a hit neither touches pandas nor
+    builds Plotly objects, and one cached figure can be served to any
+    number of sessions. Entries are keyed by the dataset version so a
+    reloaded dataset never serves stale figures, and are dropped as soon as
+    the dataset is replaced.
+
+    Parameters
+    ----------
+    chart : str
+        Name of the chart, e.g. "bar".
+    inputs : tuple
+        The callback inputs the figure was built from.
+    build : callable
+        Function called without arguments to build the figure on a miss.
+
+    Returns
+    -------
+    dict
+        The figure as a Plotly JSON dictionary.
+    """
+    key = (chart, inputs, get_dataset_version())
+    now = _clock()
+    with _lock:
+        entry = _figures.get(key)
+        if entry is not None:
+            serialized, stored_at = entry
+            if FIGURE_CACHE_TTL and now - stored_at > FIGURE_CACHE_TTL:
+                # Drop the expired figure and rebuild it below
+                del _figures[key]
+                _counters["expirations"] += 1
+            else:
+                _figures.move_to_end(key)
+                _counters["hits"] += 1
+                return json.loads(serialized)
+        _counters["misses"] += 1
+
+    # Build outside the lock so other charts are served meanwhile
+    serialized = build().to_json()
+
+    # Skip storing a figure whose dataset was replaced while it was built
+    if FIGURE_CACHE_SIZE > 0 and key[2] == get_dataset_version():
+        with _lock:
+            _figures[key] = (serialized, now)
+            _figures.move_to_end(key)
+            # Evict the least recently used figures beyond the size limit
+            while len(_figures) > FIGURE_CACHE_SIZE:
+                _figures.popitem(last=False)
+                _counters["evictions"] += 1
+    return json.loads(serialized)
+
+
+def figure_cache_stats():
+    """
+    Report the figure cache's counters and occupancy.
+
+    Returns
+    -------
+    dict
+        The number of hits, misses, evictions, expirations and figures
+        dropped because the dataset was replaced since the cache was last
+        cleared, the number of cached figures and the size limit.
+    """
+    with _lock:
+        return {
+            **_counters,
+            "size": len(_figures),
+            "max_size": FIGURE_CACHE_SIZE,
+        }
+
+
+def clear_figure_cache():
+    """
+    Remove every cached figure and reset the counters.
+    """
+    with _lock:
+        _figures.clear()
+        for name in _counters:
+            _counters[name] = 0
+
+
+@on_dataset_change
+def _drop_stale_figures(version):
+    """
+    Drop the figures built from datasets other than the given version.
+
+    Parameters
+    ----------
+    version : int
+        The version of the dataset that replaced them.
+    """
+    with _lock:
+        for key in [key for key in _figures if key[2] != version]:
+            del _figures[key]
+            _counters["invalidations"] += 1
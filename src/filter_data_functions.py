@@ -1,16 +1,52 @@
-import pandas as pd
-from pathlib import Path
+import json
+import numpy as np
+from config import (
+    CACHE_DIR,
+    HEADLINE_SNAPSHOT_ENABLED,
+    YEAR_ROLLING_WINDOW,
+)
+from data_loader import write_atomically
+from dataset_registry import dataset_snapshot, derived_view
+from filter_index import build_filter_index, select_rows
+from reshape import spread_pivot
+from year_deltas import (
+    compute_year_deltas,
+    panel_years,
+    rolling_year_mean,
+    year_panel,
+)
+
+# Version of the headline statistics snapshot layout, part of its file name
+HEADLINE_SNAPSHOT_FORMAT = "v4"
+
+
+@derived_view("filter-index")
+def get_filter_index(snapshot):
+    """
+    Return the row-position index of the dataset used by
+    ``filter_dataframe``. Call without arguments for the current dataset.
 
-# Create dataframe
-data_path = Path(__file__).parent.parent / 'data' / 'employment_prepared.xlsx'
-df = pd.read_excel(data_path)
+    Parameters
+    ----------
+    snapshot : DatasetSnapshot
+        The version of the dataset, supplied by the registry.
+
+    Returns
+    -------
+    dict
+        The index returned by ``build_filter_index``.
+    """
+    return build_filter_index(snapshot.dataset)
 
 
 def filter_dataframe(region=None, year=None,
-                     occupation_prefix=None, gender=None):
+                     occupation_prefix=None, gender=None,
+                     occupation_code=None, snapshot=None):
     """
-    Filter the dataframe based on the provided region, year, occupation prefix,
-    and gender.
+    Filter the dataframe based on the provided region, year, occupation prefix
+    or code, and gender.
+
+    Only the matching rows are copied out of the shared dataframe.
 
     Parameters
     ----------
@@ -22,38 +58,86 @@ def filter_dataframe(region=None, year=None,
         The occupation prefix to filter by.
     gender : str, optional
         The gender to filter by.
+    occupation_code : int, optional
+        The numeric occupation code to filter by, as the occupation slider
+        selects it.
+    snapshot : DatasetSnapshot, optional
+        The version of the dataset to filter, by default the current one.
 
     Returns
     -------
     pd.DataFrame
         The filtered dataframe.
     """
-    # Create a copy of the dataframe to avoid modifying the original
-    filtered_df = df.copy()
+    # Answer the filters from the index built once per dataset version,
+    # taking both from one snapshot in case the dataset is being replaced
+    if snapshot is None:
+        snapshot = dataset_snapshot()
+    return select_rows(
+        snapshot.dataset, get_filter_index(snapshot),
+        region=region, year=year,
+        occupation_prefix=occupation_prefix, gender=gender,
+        occupation_code=occupation_code
+    )
+
+
+@derived_view("disparity-cube")
+def get_disparity_cube(snapshot):
+    """
+    Return the disparity table of the whole dataset together with its
+    row-position index. Call without arguments for the current dataset.
+
+    Parameters
+    ----------
+    snapshot : DatasetSnapshot
+        The version of the dataset, supplied by the registry.
+
+    Returns
+    -------
+    tuple
+        The disparity dataframe for every region, year and occupation type,
+        and its index from ``build_filter_index``.
+    """
+    cube = prepare_disparity_df(snapshot.dataset)
+    return cube, build_filter_index(cube, columns=("Region", "Year"))
 
-    # Filter by region if specified
-    if region:
-        filtered_df = filtered_df[filtered_df['Region'] == region]
 
-    # Filter by year if specified
-    if year:
-        filtered_df = filtered_df[filtered_df['Year'] == int(year)]
+def slice_disparity_cube(region=None, year=None, occupation_prefix=None,
+                         occupation_code=None, snapshot=None):
+    """
+    Slice the precomputed disparity table for the provided region, year and
+    occupation prefix or code.
 
-    # Filter by occupation prefix if specified
-    if occupation_prefix:
-        filtered_df = filtered_df[
-            filtered_df['Occupation Type'].str.startswith(occupation_prefix)
-        ]
+    The result matches ``prepare_disparity_df(filter_dataframe(...))`` for
+    the same filters, without pivoting on each call.
 
-    # Filter by gender if specified
-    if gender:
-        filtered_df = filtered_df[filtered_df['Gender'] == gender]
+    Parameters
+    ----------
+    region : str, optional
+        The region to filter by.
+    year : int, optional
+        The year to filter by.
+    occupation_prefix : str, optional
+        The occupation prefix to filter by.
+    occupation_code : int, optional
+        The numeric occupation code to filter by.
+    snapshot : DatasetSnapshot, optional
+        The version of the dataset to slice, by default the current one.
 
-    # Return the filtered dataframe
-    return filtered_df
+    Returns
+    -------
+    pd.DataFrame
+        The disparity dataframe for the selected rows.
+    """
+    cube, cube_index = get_disparity_cube(snapshot)
+    return select_rows(
+        cube, cube_index,
+        region=region, year=year, occupation_prefix=occupation_prefix,
+        occupation_code=occupation_code
+    ).reset_index(drop=True)
 
 
-def prepare_year_pivot_df(disparity_df):
+def prepare_year_pivot_df(disparity_df, start_year=None, end_year=None):
     """
     Prepare a pivot table of the disparity dataframe by year.
 
@@ -61,29 +145,113 @@ def prepare_year_pivot_df(disparity_df):
     ----------
     disparity_df : pd.DataFrame
         The disparity dataframe.
+    start_year : int, optional
+        The year to measure the disparity from, by default the first year.
+    end_year : int, optional
+        The year to measure the disparity to, by default the last year.
 
     Returns
     -------
     pd.DataFrame
         The pivot table with year disparity.
     """
-    # Pivot the disparity dataframe to create a table with years as columns
-    year_pivot_df = disparity_df.pivot_table(
-        index=['Region', 'Occupation Type', 'Latitude', 'Longitude'],
-        columns='Year',
-        values='Total Employment',
-        fill_value=0
-    ).reset_index()
+    # Spread total employment into one column per year
+    year_pivot_df = year_panel(disparity_df)
 
-    # Calculate the disparity between the years 2023 and 2021
+    # Calculate the disparity between the end and start years
+    years = panel_years(year_pivot_df)
+    start_year = start_year or years[0]
+    end_year = end_year or years[-1]
     year_pivot_df['Year Disparity'] = (
-        year_pivot_df[2023] - year_pivot_df[2021]
+        year_pivot_df[end_year] - year_pivot_df[start_year]
     )
 
     # Return the pivot table with the year disparity
     return year_pivot_df
 
 
+@derived_view("year-deltas")
+def get_year_deltas(snapshot):
+    """
+    Return total employment by year, its change between every pair of
+    years and its rolling mean over ``YEAR_ROLLING_WINDOW`` years for the
+    whole dataset. Call without arguments for the current dataset.
+
+    Parameters
+    ----------
+    snapshot : DatasetSnapshot
+        The version of the dataset, supplied by the registry.
+
+    Returns
+    -------
+    dict
+        The year panel from ``year_panel`` under "panel", the changes from
+        ``compute_year_deltas`` under "deltas" and the rolling means from
+        ``rolling_year_mean`` under "rolling", with a window no longer than
+        the years in the dataset.
+    """
+    cube, _ = get_disparity_cube(snapshot)
+    panel = year_panel(cube)
+    window = min(YEAR_ROLLING_WINDOW, len(panel_years(panel)))
+    return {
+        "panel": panel,
+        "deltas": compute_year_deltas(panel),
+        "rolling": rolling_year_mean(panel, window),
+    }
+
+
+def year_disparity_table(start_year=None, end_year=None, snapshot=None):
+    """
+    Return the year disparity of every region and occupation for the whole
+    dataset, from the cached year deltas.
+
+    Parameters
+    ----------
+    start_year : int, optional
+        The year to measure the disparity from, by default the first year.
+    end_year : int, optional
+        The year to measure the disparity to, by default the last year.
+        It may come before the start year, giving the change backwards.
+    snapshot : DatasetSnapshot, optional
+        The version of the dataset, by default the current one.
+
+    Returns
+    -------
+    pd.DataFrame
+        The same table as ``prepare_year_pivot_df`` for the whole dataset.
+
+    Raises
+    ------
+    ValueError
+        If either year is not in the dataset.
+    """
+    year_deltas = get_year_deltas(snapshot)
+    panel, deltas = year_deltas["panel"], year_deltas["deltas"]
+    years = panel_years(panel)
+    start_year, end_year = start_year or years[0], end_year or years[-1]
+    for year in (start_year, end_year):
+        if year not in years:
+            raise ValueError(
+                f"Year {year} is not in the dataset, which has the years "
+                f"{', '.join(str(known) for known in years)}"
+            )
+    if start_year == end_year:
+        # Nothing changes within a year, e.g. in a single-year workbook
+        return panel.assign(**{'Year Disparity': 0.0})
+
+    # The deltas hold each pair with its earlier year first, so a
+    # backwards pair is the forward change negated
+    first, last = sorted((start_year, end_year))
+    sign = 1.0 if start_year < end_year else -1.0
+
+    # Read the change of every series between the two years from the
+    # cached deltas, which hold one row per series for each pair in order
+    pair = (deltas['Start Year'] == first) & (deltas['End Year'] == last)
+    return panel.assign(**{
+        'Year Disparity': sign * deltas.loc[pair, 'Change'].to_numpy()
+    })
+
+
 def prepare_disparity_df(filtered_df):
     """
     Prepare the disparity dataframe by pivoting and calculating total
@@ -101,13 +269,14 @@ def prepare_disparity_df(filtered_df):
     """
     perc_col = "Percentage Employed (Relative to Total Employment in the Year)"
 
-    # Pivot the filtered dataframe to create a table with genders as columns
-    disparity_df = filtered_df.pivot_table(
-        index=['Region', 'Year', 'Occupation Type', 'Latitude', 'Longitude'],
+    # Spread the genders into columns, as pivot_table with fill_value=0
+    # would, without its general-purpose overhead
+    disparity_df = spread_pivot(
+        filtered_df,
+        index=['Region', 'Year', 'Occupation Type'],
         columns='Gender',
-        values=perc_col,
-        fill_value=0
-    ).reset_index()
+        values=perc_col
+    )
 
     # Calculate the total employment by summing male and female employment
     disparity_df['Total Employment'] = (
@@ -123,102 +292,183 @@ def prepare_disparity_df(filtered_df):
     return disparity_df
 
 
-def find_highest_dis_by_gender(df, gender, region=None):
+def format_year_disparity(value):
     """
-    Find the highest year disparity percentage for a specific gender.
+    Format a year disparity percentage to two decimal places, keeping the
+    minus sign of negative values even when they round to zero.
 
     Parameters
     ----------
-    df : pd.DataFrame
-        The dataframe to search.
-    gender : str
-        The gender to filter by.
-    region : str, optional
-        The region to filter by.
+    value : float
+        The year disparity percentage.
 
     Returns
     -------
-    tuple
-        The highest year disparity percentage, occupation, and region.
+    str
+        The formatted percentage.
     """
-    # Filter the dataframe by region if specified
-    if region:
-        df = df[df['Region'] == region]
+    if value < 0:
+        return f"-{abs(value):.2f}"
+    return f"{abs(value):.2f}"
 
-    # Prepare the disparity dataframe
-    prepared_df = prepare_disparity_df(df)
 
-    # Prepare the year pivot dataframe
-    pivot_df = prepare_year_pivot_df(prepared_df)
+def find_year_disparity_extremes(disparity_df, year_pivot_df=None):
+    """
+    Find the highest absolute year disparity for both genders in a single
+    pass over a prepared disparity dataframe.
 
-    # Merge the prepared dataframe with the year pivot dataframe
-    merged_df = prepared_df.merge(
-        pivot_df[
-            ['Region', 'Occupation Type', 'Latitude',
-             'Longitude', 'Year Disparity']
-        ],
-        on=['Region', 'Occupation Type', 'Latitude', 'Longitude'],
-        how='left'
-    )
+    The year disparity is the change in total employment between two
+    years, so each row carries the same value for males and females and
+    one search serves both genders.
 
-    # Define the column name for the percentage value
-    perc_col = "Percentage Employed (Relative to Total Employment in the Year)"
+    Parameters
+    ----------
+    disparity_df : pd.DataFrame
+        The prepared disparity dataframe.
+    year_pivot_df : pd.DataFrame, optional
+        The year pivot table of ``disparity_df``, computed with
+        ``prepare_year_pivot_df`` if not given.
 
-    # Melt the merged dataframe to have gender as a variable
-    melted_df = merged_df.melt(
-        id_vars=['Region', 'Year', 'Occupation Type', 'Latitude', 'Longitude',
-                 'Total Employment', 'Disparity', 'Year Disparity'],
-        value_vars=['Male', 'Female'],
-        var_name='Gender',
-        value_name=perc_col
-    )
+    Returns
+    -------
+    dict
+        For "Male" and "Female", the highest year disparity as a formatted
+        "percentage" and a numeric "value", with its "occupation" and
+        "region".
+    """
+    # Look up the year disparity of each row's region and occupation
+    if year_pivot_df is None:
+        year_pivot_df = prepare_year_pivot_df(disparity_df)
+    keys = ['Region', 'Occupation Type']
+    year_disparity = disparity_df[keys].merge(
+        year_pivot_df[keys + ['Year Disparity']], on=keys, how='left'
+    )['Year Disparity'].to_numpy()
+
+    # Find the first row with the largest absolute year disparity
+    highest_idx = np.nanargmax(np.abs(year_disparity))
+    value = float(year_disparity[highest_idx])
+    extreme = {
+        "percentage": format_year_disparity(value),
+        "value": value,
+        "occupation": disparity_df['Occupation Type'].iat[highest_idx],
+        "region": disparity_df['Region'].iat[highest_idx],
+    }
+
+    # Return the same extreme for both genders
+    return {"Male": dict(extreme), "Female": dict(extreme)}
+
+
+def pick_overall_extreme(extremes):
+    """
+    Pick the overall highest year disparity from the per-gender extremes.
 
-    # Filter the melted dataframe by the specified gender
-    specific_gender_df = melted_df[melted_df["Gender"] == gender]
+    Parameters
+    ----------
+    extremes : dict
+        The per-gender extremes from ``find_year_disparity_extremes``.
+
+    Returns
+    -------
+    dict
+        The overall extreme, with a "gender" of "Male", "Female" or "Equal".
+    """
+    male, female = extremes["Male"], extremes["Female"]
+    if male["value"] > female["value"]:
+        return {**male, "gender": "Male"}
+    elif male["value"] == female["value"]:
+        return {**male, "gender": "Equal"}
+    else:
+        return {**female, "gender": "Female"}
 
-    # Find the highest absolute year disparity percentage
-    highest_absolute_year_disparity_perc = specific_gender_df[
-        'Year Disparity'].abs().max()
 
-    # Find the index of the highest year disparity percentage
-    highest_year_disparity_perc_idx = specific_gender_df[
-        'Year Disparity'].abs().idxmax()
+def _year_disparity_extremes(df, region, start_year, end_year):
+    """
+    Find the per-gender year disparity extremes of a dataframe, optionally
+    limited to a region.
 
-    # Determine the highest year disparity percentage with sign
-    if specific_gender_df['Year Disparity'][
-            highest_year_disparity_perc_idx] < 0:
-        highest_year_disparity_percentage = (
-            f"-{highest_absolute_year_disparity_perc:.2f}"
-        )
+    For the registered dataset the disparity table and the change of each
+    series are read from the views cached for its version. Any other
+    dataframe is pivoted on the call.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The dataframe to search.
+    region : str or None
+        The region to limit the search to.
+    start_year : int or None
+        The year to measure the disparity from.
+    end_year : int or None
+        The year to measure the disparity to.
+
+    Returns
+    -------
+    dict
+        The extremes from ``find_year_disparity_extremes``.
+    """
+    snapshot = dataset_snapshot()
+    if df is snapshot.dataset:
+        # Read the per-version views instead of pivoting the dataset again
+        disparity_df = slice_disparity_cube(region=region, snapshot=snapshot)
+        year_pivot_df = year_disparity_table(start_year, end_year, snapshot)
     else:
-        highest_year_disparity_percentage = (
-            f"{highest_absolute_year_disparity_perc:.2f}"
+        # Filter the dataframe by region if specified
+        if region:
+            df = df[df['Region'] == region]
+        disparity_df = prepare_disparity_df(df)
+        year_pivot_df = prepare_year_pivot_df(
+            disparity_df, start_year, end_year
         )
+    return find_year_disparity_extremes(disparity_df, year_pivot_df)
 
-    # Get the occupation type with the highest year disparity percentage
-    highest_year_disparity_occupation = specific_gender_df['Occupation Type'][
-        highest_year_disparity_perc_idx]
 
-    # Get the region with the highest year disparity percentage
-    highest_disparity_region = specific_gender_df[
-        'Region'][highest_year_disparity_perc_idx]
+def find_highest_dis_by_gender(df, gender, region=None,
+                               start_year=None, end_year=None):
+    """
+    Find the highest year disparity percentage for a specific gender.
 
-    # Return the highest year disparity percentage, occupation, and region
-    return (highest_year_disparity_percentage,
-            highest_year_disparity_occupation,
-            highest_disparity_region)
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The dataframe to search. The registered dataset is searched in its
+        cached disparity table and year deltas.
+    gender : str
+        The gender to filter by.
+    region : str, optional
+        The region to filter by.
+    start_year : int, optional
+        The year to measure the disparity from, by default the first year.
+    end_year : int, optional
+        The year to measure the disparity to, by default the last year.
+
+    Returns
+    -------
+    tuple
+        The highest year disparity percentage, occupation, and region.
+    """
+    # Find the extremes and return the one for the specified gender
+    extreme = _year_disparity_extremes(
+        df, region, start_year, end_year
+    )[gender]
+    return (extreme["percentage"], extreme["occupation"], extreme["region"])
 
 
-def find_overall_highest_disparity(df, region=None):
+def find_overall_highest_disparity(df, region=None,
+                                   start_year=None, end_year=None):
     """
     Find the overall highest disparity between genders.
 
     Parameters
     ----------
     df : pd.DataFrame
-        The dataframe to search.
+        The dataframe to search. The registered dataset is searched in its
+        cached disparity table and year deltas.
     region : str, optional
         The region to filter by.
+    start_year : int, optional
+        The year to measure the disparity from, by default the first year.
+    end_year : int, optional
+        The year to measure the disparity to, by default the last year.
 
     Returns
     -------
@@ -226,39 +476,180 @@ def find_overall_highest_disparity(df, region=None):
         The highest overall disparity percentage, occupation, region,
         and gender.
     """
-    # Find the highest disparity for males
-    highest_male_disparity = find_highest_dis_by_gender(df, "Male", region)
+    # Find both genders' extremes at once and pick the overall highest
+    overall = pick_overall_extreme(
+        _year_disparity_extremes(df, region, start_year, end_year)
+    )
+    return (overall["percentage"], overall["occupation"],
+            overall["region"], overall["gender"])
 
-    # Find the highest disparity for females
-    highest_female_disparity = find_highest_dis_by_gender(df, "Female", region)
 
-    # Extract the highest disparity percentages
-    highest_male_disparity_perc = highest_male_disparity[0]
-    highest_female_disparity_perc = highest_female_disparity[0]
+def series_trend(year_deltas, region, occupation, start_year, end_year):
+    """
+    Look up the percentage change of one region's occupation between two
+    years and its latest rolling mean, from the cached year deltas.
 
-    # Compare the highest disparities and return the overall highest
-    if float(highest_male_disparity_perc) > float(
-            highest_female_disparity_perc):
-        return highest_male_disparity + ("Male",)
-    elif float(highest_male_disparity_perc) == float(
-            highest_female_disparity_perc):
-        return highest_male_disparity + ("Equal",)
-    else:
-        return highest_female_disparity + ("Female",)
+    Parameters
+    ----------
+    year_deltas : dict
+        The cached year deltas from ``get_year_deltas``.
+    region : str
+        The region of the series.
+    occupation : str
+        The occupation type of the series.
+    start_year : int
+        The year to measure the change from, before ``end_year``.
+    end_year : int
+        The year to measure the change to.
+
+    Returns
+    -------
+    dict
+        The "relative_change" in percent, None where the start value is 0,
+        and the "rolling_mean" of the latest window of years.
+    """
+    deltas, rolling = year_deltas["deltas"], year_deltas["rolling"]
+    change = deltas.loc[
+        (deltas['Region'] == region)
+        & (deltas['Occupation Type'] == occupation)
+        & (deltas['Start Year'] == start_year)
+        & (deltas['End Year'] == end_year),
+        'Percentage Change'
+    ].iat[0]
+    series = (
+        (rolling['Region'] == region)
+        & (rolling['Occupation Type'] == occupation)
+    )
+    return {
+        "relative_change": None if np.isnan(change) else float(change),
+        "rolling_mean": float(rolling.loc[series].iloc[0, -1]),
+    }
 
 
-# Find the highest year disparity for males
-(highest_m_year_disparity_percentage,
- highest_m_year_disparity_occupation,
- highest_m_year_disparity_region) = find_highest_dis_by_gender(df, "Male")
+def _compute_headline_stats(snapshot):
+    """
+    Compute the dataset-wide headline disparity statistics.
 
-# Find the highest year disparity for females
-(highest_f_year_disparity_percentage,
- highest_f_year_disparity_occupation,
- highest_f_year_disparity_region) = find_highest_dis_by_gender(df, "Female")
+    Parameters
+    ----------
+    snapshot : DatasetSnapshot
+        The version of the dataset.
 
-# Find the overall highest disparity
-(highest_overall_disparity_percentage,
- highest_overall_disparity_occupation,
- highest_overall_disparity_region,
- highest_overall_disparity_gender) = find_overall_highest_disparity(df)
+    Returns
+    -------
+    dict
+        The highest year disparity for males, for females and overall, each
+        with its formatted percentage, numeric value, occupation and region
+        (and gender for overall) and its trend from ``series_trend``, the
+        "years" it is measured between and the "rolling_years" of the latest
+        rolling window.
+    """
+    # Search the precomputed tables instead of pivoting again
+    cube, _ = get_disparity_cube(snapshot)
+    extremes = find_year_disparity_extremes(
+        cube, year_disparity_table(snapshot=snapshot)
+    )
+    year_deltas = get_year_deltas(snapshot)
+    years = panel_years(year_deltas["panel"])
+    window = min(YEAR_ROLLING_WINDOW, len(years))
+
+    stats = {
+        "male": extremes["Male"],
+        "female": extremes["Female"],
+        "overall": pick_overall_extreme(extremes),
+    }
+    if len(years) > 1:
+        # Add the relative change and recent average of each series
+        for extreme in stats.values():
+            extreme.update(series_trend(
+                year_deltas, extreme["region"], extreme["occupation"],
+                years[0], years[-1]
+            ))
+    return {
+        **stats,
+        "years": [int(years[0]), int(years[-1])],
+        "rolling_years": [int(years[-window]), int(years[-1])],
+    }
+
+
+@derived_view("headline-stats")
+def get_headline_stats(snapshot):
+    """
+    Return the dataset-wide headline disparity statistics.
+
+    The statistics are computed on first access and memoized for the
+    dataset version. When snapshots are enabled they are also saved to the
+    cache directory, keyed by the workbook's digest, so later processes
+    read them instead of recomputing. Call without arguments for the
+    current dataset.
+
+    Parameters
+    ----------
+    snapshot : DatasetSnapshot
+        The version of the dataset, supplied by the registry.
+
+    Returns
+    -------
+    dict
+        The highest year disparity for males, for females and overall, each
+        with its formatted percentage, numeric value, occupation and region
+        (and gender for overall), and the "years" it is measured between.
+    """
+    if not HEADLINE_SNAPSHOT_ENABLED:
+        return _compute_headline_stats(snapshot)
+
+    # Reuse the statistics written by an earlier process for this workbook
+    stats_name = (
+        f"headline-stats-{HEADLINE_SNAPSHOT_FORMAT}-"
+        f"{snapshot.digest[:16]}.json"
+    )
+    stats_path = CACHE_DIR / stats_name
+    try:
+        return json.loads(stats_path.read_text())
+    except (OSError, ValueError):
+        pass
+
+    stats = _compute_headline_stats(snapshot)
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        write_atomically(
+            stats_path,
+            lambda path: path.write_text(json.dumps(stats, indent=2))
+        )
+    except OSError:
+        # The statistics are still served if the snapshot cannot be saved
+        pass
+    return stats
+
+
+# Module attributes that used to be computed at import, mapped to their
+# place in the headline statistics
+_HEADLINE_ATTRIBUTES = {
+    f"highest_{prefix}_disparity_{field}": (group, field)
+    for prefix, group in (
+        ("m_year", "male"), ("f_year", "female"), ("overall", "overall")
+    )
+    for field in ("percentage", "occupation", "region", "gender")
+    if field != "gender" or group == "overall"
+}
+
+
+def __getattr__(name):
+    """
+    Resolve the legacy ``highest_*`` module attributes lazily from the
+    headline statistics.
+
+    Parameters
+    ----------
+    name : str
+        The attribute name.
+
+    Returns
+    -------
+    str
+        The requested headline statistic.
+    """
+    if name in _HEADLINE_ATTRIBUTES:
+        group, field = _HEADLINE_ATTRIBUTES[name]
+        return get_headline_stats()[group][field]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,167 @@
+import numpy as np
+import pandas as pd
+
+# Columns indexed by their exact values
+INDEXED_COLUMNS = ("Region", "Year", "Gender")
+
+
+def occupation_codes(df):
+    """
+    Return the numeric occupation code (the number before the colon) of
+    each occupation type.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The employment dataframe.
+
+    Returns
+    -------
+    np.ndarray
+        The occupation code of each row, e.g. 3 for
+        "3: associate prof & tech occupations", parsed once per category
+        when the occupation types are categorical.
+    """
+    occupations = df["Occupation Type"]
+    if isinstance(occupations.dtype, pd.CategoricalDtype):
+        codes = occupations.cat.categories.str.split(":").str[0]
+        return codes.astype(int).to_numpy()[occupations.cat.codes]
+    return occupations.str.split(":").str[0].astype(int).to_numpy()
+
+
+def build_filter_index(df, columns=INDEXED_COLUMNS):
+    """
+    Build an index of the row positions holding each region, year, gender
+    and occupation code.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The employment dataframe, or any table with an 'Occupation Type'
+        column and the indexed columns.
+    columns : tuple of str, optional
+        The columns to index by value, by default region, year and gender.
+
+    Returns
+    -------
+    dict
+        For each indexed column, a mapping from value to the sorted array of
+        row positions with that value. Occupation codes are stored under
+        "Occupation Code".
+    """
+    index = {
+        column: df.groupby(column, sort=False, observed=True).indices
+        for column in columns
+    }
+    index["Occupation Code"] = df.groupby(
+        occupation_codes(df), sort=False
+    ).indices
+    return index
+
+
+def filter_positions(df, index, region=None, year=None,
+                     occupation_prefix=None, gender=None,
+                     occupation_code=None):
+    """
+    Find the row positions matching the provided filters by intersecting
+    the indexed positions of each filter.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The employment dataframe the index was built from.
+    index : dict
+        The index returned by ``build_filter_index``.
+    region : str, optional
+        The region to filter by.
+    year : int, optional
+        The year to filter by.
+    occupation_prefix : str, optional
+        The occupation prefix to filter by.
+    gender : str, optional
+        The gender to filter by.
+    occupation_code : int, optional
+        The numeric occupation code to filter by, e.g. 3 for
+        "3: associate prof & tech occupations".
+
+    Returns
+    -------
+    np.ndarray or None
+        The sorted matching row positions, or None if no filter was given.
+
+    Raises
+    ------
+    KeyError
+        If a filter is given for a column that was not indexed.
+    """
+    empty = np.array([], dtype=np.intp)
+    selections = []
+
+    # Look up the positions for each specified filter
+    if region:
+        selections.append(index["Region"].get(region, empty))
+    if year:
+        selections.append(index["Year"].get(int(year), empty))
+    if gender:
+        selections.append(index["Gender"].get(gender, empty))
+    if occupation_code:
+        selections.append(
+            index["Occupation Code"].get(int(occupation_code), empty)
+        )
+    if occupation_prefix:
+        code, separator, rest = occupation_prefix.partition(":")
+        if separator and not rest and code.isdigit():
+            # Prefixes of the form "3:" are answered from the index
+            selections.append(index["Occupation Code"].get(int(code), empty))
+        else:
+            # Any other prefix falls back to scanning the occupation types
+            selections.append(np.flatnonzero(
+                df["Occupation Type"].str.startswith(occupation_prefix)
+            ))
+
+    if not selections:
+        return None
+
+    # Intersect from the smallest selection so each step stays cheap
+    selections.sort(key=len)
+    positions = selections[0]
+    for selection in selections[1:]:
+        positions = np.intersect1d(positions, selection, assume_unique=True)
+    return positions
+
+
+def select_rows(df, index, region=None, year=None,
+                occupation_prefix=None, gender=None, occupation_code=None):
+    """
+    Select the rows matching the provided filters using the index.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The employment dataframe the index was built from.
+    index : dict
+        The index returned by ``build_filter_index``.
+    region : str, optional
+        The region to filter by.
+    year : int, optional
+        The year to filter by.
+    occupation_prefix : str, optional
+        The occupation prefix to filter by.
+    gender : str, optional
+        The gender to filter by.
+    occupation_code : int, optional
+        The numeric occupation code to filter by.
+
+    Returns
+    -------
+    pd.DataFrame
+        A new dataframe holding only the matching rows, with their original
+        index labels.
+    """
+    positions = filter_positions(
+        df, index, region, year, occupation_prefix, gender, occupation_code
+    )
+    if positions is None:
+        # Without filters every row matches, so return a full copy
+        return df.copy()
+    return df.take(positions)
@@ -13,6 +13,8 @@ from components import (
     analysis_name_input,
     data_attribution,
     summary_stats,
+    chart_card_content,
+    full_descriptions,
 )
 
 # Define the rows of the app
@@ -67,7 +69,7 @@ bar_pie_chart_row = dbc.Row(
         dbc.Col(
             dbc.Card(
                 dbc.CardBody(
-                    dcc.Loading(id="bar-chart-card-content"),
+                    chart_card_content("bar-chart", "stacked_bar_chart.png"),
                     id="bar-chart-card-body"
                 ),
                 className="chart-card top-chart-card",
@@ -79,7 +81,9 @@ bar_pie_chart_row = dbc.Row(
         dbc.Col(
             dbc.Card(
                 dbc.CardBody(
-                    dcc.Loading(id="pie-chart-card-content"),
+                    chart_card_content(
+                        "pie-chart", "pie_chart_placeholder.png"
+                    ),
                     id="pie-chart-card-body"
                 ),
                 className="chart-card top-chart-card",
@@ -99,7 +103,10 @@ disp_map_area_chart_row = dbc.Row(
                 [
                     dbc.CardBody(
                         [
-                            dcc.Loading(id="disparity-map-card-content"),
+                            *chart_card_content(
+                                "disparity-map",
+                                "disparity_map_placeholder.png"
+                            ),
                             occupation_type_slider,
                         ],
                         id="disparity-map-card-body",
@@ -114,7 +121,10 @@ disp_map_area_chart_row = dbc.Row(
         dbc.Col(
             dbc.Card(
                 dbc.CardBody(
-                    dcc.Loading(id="stacked-area-chart-card-content"),
+                    chart_card_content(
+                        "stacked-area-chart",
+                        "stacked_area_chart_placeholder.png"
+                    ),
                     id="stacked-area-chart-card-body",
                 ),
                 className="chart-card bottom-chart-card",
@@ -141,6 +151,12 @@ app_layout = dbc.Container(
         bar_pie_chart_row,
         disp_map_area_chart_row,
         summary_stats_row,
-        dcc.Store(id="saved-analyses-store", data=[]),
+        # Id of the browser session owning the saved analyses
+        dcc.Store(id="session-id", storage_type="local"),
+        # Number of saved analyses listed in the menu, which ends with
+        # "More..." while the session has more
+        dcc.Store(id="saved-analyses-listed", data=0),
+        # Occupation descriptions, sent once for the clientside callbacks
+        dcc.Store(id="occupation-descriptions", data=full_descriptions),
     ]
 )
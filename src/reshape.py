@@ -0,0 +1,142 @@
+import numpy as np
+import pandas as pd
+
+# Largest number of combined group codes handled with direct array lookups
+# rather than sorting
+_MAX_DIRECT_CODES = 1 << 24
+
+
+def _group_codes(df, columns):
+    """
+    Assign each row an integer code for its combination of values in the
+    given columns, numbered in the sorted order of those combinations.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The dataframe to group.
+    columns : list of str
+        The columns whose combined values define the groups.
+
+    Returns
+    -------
+    tuple
+        The code of each row (-1 for rows with a missing value in any of
+        the columns) and the number of groups.
+    """
+    codes = np.zeros(len(df), dtype=np.int64)
+    valid = np.ones(len(df), dtype=bool)
+    n_codes = 1
+    for column in columns:
+        # Sorted factorizing keeps the codes in the order of the values
+        column_codes, uniques = pd.factorize(df[column], sort=True)
+        valid &= column_codes >= 0
+        if n_codes * max(len(uniques), 1) > _MAX_DIRECT_CODES:
+            # Renumber densely before the combined codes grow too large
+            codes, n_codes = _dense_codes(codes, n_codes)
+        codes = codes * len(uniques) + np.maximum(column_codes, 0)
+        n_codes *= max(len(uniques), 1)
+
+    # Number the groups of the rows without missing values from 0
+    codes = np.where(valid, codes, -1)
+    return _dense_codes(codes, n_codes)
+
+
+def _dense_codes(codes, n_codes):
+    """
+    Renumber codes to 0, 1, 2, ... keeping their order, leaving -1 (a
+    missing value) unchanged.
+
+    Parameters
+    ----------
+    codes : np.ndarray
+        The codes, each between -1 and ``n_codes - 1``.
+    n_codes : int
+        The number of possible codes.
+
+    Returns
+    -------
+    tuple
+        The renumbered codes and the number of distinct codes.
+    """
+    present = codes >= 0
+    if n_codes <= _MAX_DIRECT_CODES:
+        # Mark the codes in use and number them by a running count
+        used = np.zeros(n_codes, dtype=bool)
+        used[codes[present]] = True
+        new_codes = np.cumsum(used) - 1
+        n_groups = int(used.sum())
+        return np.where(present, new_codes[codes], -1), n_groups
+    groups, group_codes = np.unique(codes[present], return_inverse=True)
+    dense = np.full(len(codes), -1, dtype=np.int64)
+    dense[present] = group_codes.reshape(-1)
+    return dense, len(groups)
+
+
+def spread_pivot(df, index, columns, values):
+    """
+    Spread the values of one column into a column per distinct value,
+    averaging duplicates and filling missing combinations with 0.
+
+    This gives the same result as
+    ``df.pivot_table(index=index, columns=columns, values=values,
+    fill_value=0).reset_index()`` for a float ``values`` column, but
+    scatters the values into a NumPy array through integer group codes
+    instead of going through ``pivot_table``.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The dataframe to reshape.
+    index : list of str
+        The columns identifying each output row.
+    columns : str
+        The column whose values become the output columns.
+    values : str
+        The column holding the values to spread.
+
+    Returns
+    -------
+    pd.DataFrame
+        The index columns followed by one column per distinct value of
+        ``columns``, sorted by the index columns.
+    """
+    row_codes, n_rows = _group_codes(df, index)
+    column_codes, column_labels = pd.factorize(df[columns], sort=True)
+    value_array = df[values].to_numpy(dtype=np.float64)
+
+    # Average only the rows with a complete key and a value, as pivot_table
+    # does
+    keep = (row_codes >= 0) & (column_codes >= 0) & ~np.isnan(value_array)
+    cells = row_codes[keep] * len(column_labels) + column_codes[keep]
+    n_cells = n_rows * len(column_labels)
+    sums = np.bincount(
+        cells, weights=value_array[keep], minlength=n_cells
+    ).astype(np.float64, copy=False)
+    counts = np.bincount(cells, minlength=n_cells)
+    sums = sums.reshape(n_rows, len(column_labels))
+    counts = counts.reshape(n_rows, len(column_labels))
+
+    # Drop rows and columns without any value, then fill the gaps with 0
+    row_mask = counts.any(axis=1)
+    column_mask = counts.any(axis=0)
+    sums = sums[row_mask][:, column_mask]
+    counts = counts[row_mask][:, column_mask]
+    means = np.divide(
+        sums, counts, out=np.zeros_like(sums), where=counts > 0
+    )
+
+    # Take the index values of each output row from its first input row
+    first_rows = np.full(n_rows, -1, dtype=np.int64)
+    positions = np.flatnonzero(keep)
+    first_rows[row_codes[positions[::-1]]] = positions[::-1]
+    result = df.take(first_rows[row_mask])[index].reset_index(drop=True)
+
+    # Add a column per distinct value, named after the spread column
+    spread = pd.DataFrame(
+        means,
+        columns=pd.Index(column_labels[column_mask], name=columns)
+    )
+    result = pd.concat([result, spread], axis=1)
+    result.columns.name = columns
+    return result
@@ -0,0 +1,227 @@
+import threading
+from datetime import datetime, timezone
+from sqlalchemy import (
+    DateTime,
+    Integer,
+    String,
+    UniqueConstraint,
+    create_engine,
+    func,
+    select,
+)
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import (
+    DeclarativeBase,
+    Mapped,
+    Session,
+    mapped_column,
+)
+from config import SAVED_ANALYSES_DB_URL, SAVED_ANALYSES_PAGE_SIZE
+
+
+class DuplicateAnalysisName(ValueError):
+    """
+    Raised when a session already has an analysis with the same name.
+    """
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class SavedAnalysis(Base):
+    """
+    A set of filters saved under a name by one browser session.
+    """
+    __tablename__ = "saved_analyses"
+    # Names are unique per session; the index also serves lookups by
+    # session
+    __table_args__ = (
+        UniqueConstraint("session_id", "name", name="uq_session_name"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    session_id: Mapped[str] = mapped_column(String(64))
+    name: Mapped[str] = mapped_column(String(200))
+    region: Mapped[str] = mapped_column(String(100))
+    year: Mapped[str] = mapped_column(String(4))
+    occupation: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=lambda: datetime.now(timezone.utc)
+    )
+
+    def to_dict(self):
+        """
+        Return the analysis as the dictionary the callbacks use.
+
+        Returns
+        -------
+        dict
+            The analysis's id, name, region, year and occupation.
+        """
+        return {
+            "id": self.id,
+            "name": self.name,
+            "region": self.region,
+            "year": self.year,
+            "occupation": self.occupation,
+        }
+
+
+# The engine of the saved analyses database, created on first use
+_engine = None
+_lock = threading.Lock()
+
+
+def init_saved_analyses(url=SAVED_ANALYSES_DB_URL):
+    """
+    Connect to the saved analyses database, creating its table if needed.
+
+    Parameters
+    ----------
+    url : str, optional
+        The SQLAlchemy database URL.
+
+    Returns
+    -------
+    Engine
+        The database engine.
+    """
+    global _engine
+    with _lock:
+        if _engine is not None:
+            _engine.dispose()
+        _engine = create_engine(url)
+        Base.metadata.create_all(_engine)
+    return _engine
+
+
+def get_engine():
+    """
+    Return the saved analyses database engine, connecting on first use.
+
+    Returns
+    -------
+    Engine
+        The database engine.
+    """
+    if _engine is None:
+        return init_saved_analyses()
+    return _engine
+
+
+def save_analysis(session_id, name, region, year, occupation):
+    """
+    Save a set of filters under a name for a session.
+
+    Parameters
+    ----------
+    session_id : str
+        The browser session saving the analysis.
+    name : str
+        The name of the analysis, unique within the session.
+    region : str
+        Selected region.
+    year : str
+        Selected year.
+    occupation : int
+        Selected occupation.
+
+    Returns
+    -------
+    dict
+        The saved analysis, with its id.
+
+    Raises
+    ------
+    DuplicateAnalysisName
+        If the session already has an analysis with this name.
+    """
+    analysis = SavedAnalysis(
+        session_id=session_id, name=name, region=region,
+        year=str(year), occupation=occupation
+    )
+    with Session(get_engine()) as session:
+        session.add(analysis)
+        try:
+            # The unique index rejects duplicates without scanning
+            session.commit()
+        except IntegrityError:
+            session.rollback()
+            raise DuplicateAnalysisName(name) from None
+        return analysis.to_dict()
+
+
+def count_analyses(session_id):
+    """
+    Count the analyses saved by a session.
+
+    Parameters
+    ----------
+    session_id : str
+        The browser session.
+
+    Returns
+    -------
+    int
+        The number of saved analyses.
+    """
+    with Session(get_engine()) as session:
+        return session.scalar(
+            select(func.count()).where(
+                SavedAnalysis.session_id == session_id
+            )
+        )
+
+
+def get_analysis(session_id, analysis_id):
+    """
+    Return one of a session's saved analyses.
+
+    Parameters
+    ----------
+    session_id : str
+        The browser session.
+    analysis_id : int
+        The id of the analysis.
+
+    Returns
+    -------
+    dict or None
+        The analysis, or None if the session has no analysis with this id.
+    """
+    with Session(get_engine()) as session:
+        analysis = session.get(SavedAnalysis, analysis_id)
+        if analysis is None or analysis.session_id != session_id:
+            # Sessions cannot read each other's analyses
+            return None
+        return analysis.to_dict()
+
+
+def list_analyses(session_id, offset=0, limit=SAVED_ANALYSES_PAGE_SIZE):
+    """
+    List a page of a session's saved analyses, oldest first.
+
+    Parameters
+    ----------
+    session_id : str
+        The browser session.
+    offset : int, optional
+        The number of analyses to skip.
+    limit : int, optional
+        The maximum number of analyses to return.
+
+    Returns
+    -------
+    list of dict
+        The analyses on the page.
+    """
+    with Session(get_engine()) as session:
+        analyses = session.scalars(
+            select(SavedAnalysis)
+            .where(SavedAnalysis.session_id == session_id)
+            .order_by(SavedAnalysis.id)
+            .offset(offset)
+            .limit(limit)
+        )
+        return [analysis.to_dict() for analysis in analyses]
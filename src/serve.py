@@ -0,0 +1,90 @@
+"""
+Serve the app with waitress, a multi-threaded production WSGI server.
+
+Run with ``python src/serve.py``; see ``--help`` for the options, whose
+defaults come from the SERVER_* settings in config.py.
+"""
+import argparse
+import logging
+from waitress import serve
+from app import app
+from config import (
+    SERVER_BACKLOG,
+    SERVER_CHANNEL_TIMEOUT,
+    SERVER_CONNECTION_LIMIT,
+    SERVER_HOST,
+    SERVER_PORT,
+    SERVER_THREADS,
+    WARM_CACHES,
+)
+from warmup import warm_caches
+
+
+def parse_args(argv=None):
+    """
+    Parse the command line options of the server.
+
+    Parameters
+    ----------
+    argv : list of str, optional
+        The arguments to parse, by default those of the process.
+
+    Returns
+    -------
+    argparse.Namespace
+        The server options.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default=SERVER_HOST,
+                        help="address to listen on")
+    parser.add_argument("--port", type=int, default=SERVER_PORT,
+                        help="port to listen on")
+    parser.add_argument("--threads", type=int, default=SERVER_THREADS,
+                        help="number of threads serving requests")
+    parser.add_argument("--connection-limit", type=int,
+                        default=SERVER_CONNECTION_LIMIT,
+                        help="maximum number of open connections")
+    parser.add_argument("--channel-timeout", type=int,
+                        default=SERVER_CHANNEL_TIMEOUT,
+                        help="seconds before an inactive connection closes")
+    parser.add_argument("--backlog", type=int, default=SERVER_BACKLOG,
+                        help="queue length of pending connections")
+    parser.add_argument("--no-warm", dest="warm", action="store_false",
+                        default=WARM_CACHES,
+                        help="skip building the caches before serving")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """
+    Warm the caches and serve the app until interrupted.
+
+    Parameters
+    ----------
+    argv : list of str, optional
+        The command line arguments, by default those of the process.
+    """
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+    logger = logging.getLogger("serve")
+
+    # Build the caches before accepting connections, so the first users
+    # are not kept waiting
+    if args.warm:
+        warmed = warm_caches()
+        logger.info("Built %d figures in %.1f s",
+                    warmed["figures"], warmed["seconds"])
+
+    serve(
+        app.server,
+        host=args.host,
+        port=args.port,
+        threads=args.threads,
+        connection_limit=args.connection_limit,
+        channel_timeout=args.channel_timeout,
+        backlog=args.backlog,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,296 @@
+"""
+Vendor the stylesheets and scripts the app loads from CDNs, so hosts
+without internet access can serve them locally.
+
+Run ``python src/vendor_assets.py`` on a machine with internet access to
+download them into ``src/assets/vendor`` with content-hashed names and
+precompressed variants, then set ``ASSET_MODE=vendored``.
+"""
+import gzip
+import hashlib
+import json
+import mimetypes
+import re
+from pathlib import Path
+from urllib.parse import urljoin, urlsplit
+import dash_bootstrap_components as dbc
+from flask import request, send_file
+from werkzeug.security import safe_join
+from config import VENDOR_DIR
+from data_loader import write_atomically
+
+# Stylesheets loaded from CDNs: Bootstrap styling from
+# dash_bootstrap_components (dbc) and animate.css
+EXTERNAL_STYLESHEETS = [
+    dbc.themes.BOOTSTRAP,
+    dbc.icons.BOOTSTRAP,
+    'https://cdnjs.cloudflare.com/ajax/libs/animate.css/4.1.1/animate.min.css'
+]
+
+# Scripts loaded from CDNs, including html2canvas for capturing screenshots
+EXTERNAL_SCRIPTS = [
+    {
+        'src': (
+            'https://cdnjs.cloudflare.com/ajax/libs/html2canvas/1.4.0/'
+            'html2canvas.min.js'
+        )
+    }
+]
+
+# Name of the manifest mapping each source URL to its vendored file
+MANIFEST_NAME = "manifest.json"
+
+# Vendored file names carry a content hash, e.g.
+# "bootstrap.min.0123456789abcdef.css"; Dash must not include them in
+# every page by itself, so they are excluded from its assets scan
+VENDORED_NAME_PATTERN = r"\.[0-9a-f]{16}\.(css|js)$"
+
+# Browsers may cache vendored files forever, as new content gets new names
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Relative url(...) references in stylesheets, e.g. to icon fonts
+_CSS_URL = re.compile(r"""url\((['"]?)(?!data:|https?:|/)([^'")]+)\1\)""")
+
+
+def _download(url):
+    """
+    Download a file.
+
+    Parameters
+    ----------
+    url : str
+        The URL to download.
+
+    Returns
+    -------
+    bytes
+        The file's content.
+    """
+    import requests
+    response = requests.get(url, timeout=30)
+    response.raise_for_status()
+    return response.content
+
+
+def vendor_file(content, name, vendor_dir=VENDOR_DIR):
+    """
+    Store a file under a name carrying its content hash, next to gzip and
+    (if the brotli package is installed) brotli compressed variants.
+
+    Parameters
+    ----------
+    content : bytes
+        The file's content.
+    name : str
+        The original file name, e.g. "bootstrap.min.css".
+    vendor_dir : Path, optional
+        The directory to store the file in.
+
+    Returns
+    -------
+    str
+        The hashed file name.
+    """
+    digest = hashlib.sha256(content).hexdigest()[:16]
+    path = Path(name)
+    hashed_name = f"{path.stem}.{digest}{path.suffix}"
+    target = Path(vendor_dir) / hashed_name
+
+    write_atomically(target, lambda tmp: tmp.write_bytes(content))
+    # A fixed mtime keeps the compressed bytes reproducible
+    gzipped = gzip.compress(content, compresslevel=9, mtime=0)
+    write_atomically(target.with_name(hashed_name + ".gz"),
+                     lambda tmp: tmp.write_bytes(gzipped))
+    try:
+        import brotli
+    except ImportError:
+        # Without brotli, browsers are served the gzip variant
+        return hashed_name
+    compressed = brotli.compress(content, quality=11)
+    write_atomically(target.with_name(hashed_name + ".br"),
+                     lambda tmp: tmp.write_bytes(compressed))
+    return hashed_name
+
+
+def fetch_vendor_assets(vendor_dir=VENDOR_DIR, download=_download):
+    """
+    Download every external stylesheet and script, with the files their
+    stylesheets reference, into the vendor directory and record them in
+    its manifest.
+
+    Parameters
+    ----------
+    vendor_dir : Path, optional
+        The directory to store the files in.
+    download : callable, optional
+        Function returning the content of a URL.
+
+    Returns
+    -------
+    dict
+        The manifest, mapping each source URL to its hashed file name.
+    """
+    vendor_dir = Path(vendor_dir)
+    vendor_dir.mkdir(parents=True, exist_ok=True)
+    manifest = {}
+
+    sources = EXTERNAL_STYLESHEETS + [
+        script["src"] for script in EXTERNAL_SCRIPTS
+    ]
+    for url in sources:
+        content = download(url)
+        if url.endswith(".css"):
+            content = _vendor_references(
+                content, url, vendor_dir, download
+            )
+        name = Path(urlsplit(url).path).name
+        manifest[url] = vendor_file(content, name, vendor_dir)
+
+    write_atomically(
+        vendor_dir / MANIFEST_NAME,
+        lambda path: path.write_text(json.dumps(manifest, indent=2))
+    )
+    return manifest
+
+
+def _vendor_references(css, css_url, vendor_dir, download):
+    """
+    Vendor the files a stylesheet references by relative URL and point
+    the references at their hashed names.
+
+    Parameters
+    ----------
+    css : bytes
+        The stylesheet.
+    css_url : str
+        The URL the stylesheet was downloaded from.
+    vendor_dir : Path
+        The directory to store the files in.
+    download : callable
+        Function returning the content of a URL.
+
+    Returns
+    -------
+    bytes
+        The stylesheet with rewritten references.
+    """
+    vendored = {}
+
+    def replace(match):
+        reference = match.group(2)
+        if reference not in vendored:
+            url = urljoin(css_url, reference)
+            name = Path(urlsplit(url).path).name
+            vendored[reference] = vendor_file(download(url), name, vendor_dir)
+        return f'url("{vendored[reference]}")'
+
+    return _CSS_URL.sub(replace, css.decode("utf-8")).encode("utf-8")
+
+
+def read_vendor_manifest(vendor_dir=VENDOR_DIR):
+    """
+    Read the manifest of the vendored files.
+
+    Parameters
+    ----------
+    vendor_dir : Path, optional
+        The directory holding the vendored files.
+
+    Returns
+    -------
+    dict
+        The manifest, mapping each source URL to its hashed file name.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the assets have not been vendored.
+    """
+    manifest_path = Path(vendor_dir) / MANIFEST_NAME
+    if not manifest_path.exists():
+        raise FileNotFoundError(
+            f"No vendored assets in {vendor_dir}; run "
+            "'python src/vendor_assets.py' where the CDNs are reachable"
+        )
+    return json.loads(manifest_path.read_text())
+
+
+def page_assets(mode, vendor_dir=VENDOR_DIR):
+    """
+    Return the stylesheets and scripts to load in the page.
+
+    Parameters
+    ----------
+    mode : str
+        "external" to load them from their CDNs or "vendored" to load the
+        local copies.
+    vendor_dir : Path, optional
+        The directory holding the vendored files.
+
+    Returns
+    -------
+    tuple
+        The ``external_stylesheets`` and ``external_scripts`` for Dash.
+
+    Raises
+    ------
+    ValueError
+        If the mode is not recognised.
+    """
+    if mode == "external":
+        return EXTERNAL_STYLESHEETS, EXTERNAL_SCRIPTS
+    if mode != "vendored":
+        raise ValueError(f"Unknown asset mode {mode!r}")
+
+    # Relative URLs, as the app's URL prefix is not known yet
+    manifest = read_vendor_manifest(vendor_dir)
+    stylesheets = [
+        f"assets/vendor/{manifest[url]}" for url in EXTERNAL_STYLESHEETS
+    ]
+    scripts = [
+        {"src": f"assets/vendor/{manifest[script['src']]}"}
+        for script in EXTERNAL_SCRIPTS
+    ]
+    return stylesheets, scripts
+
+
+def serve_vendored_files(app, vendor_dir=VENDOR_DIR):
+    """
+    Serve the vendored files with immutable cache headers, choosing the
+    brotli or gzip variant the browser accepts.
+
+    Parameters
+    ----------
+    app : Dash
+        The Dash app instance.
+    vendor_dir : Path, optional
+        The directory holding the vendored files.
+    """
+    prefix = f"{app.config.routes_pathname_prefix}assets/vendor/"
+
+    @app.server.before_request
+    def send_vendored_file():
+        if not request.path.startswith(prefix):
+            return None
+        path = safe_join(str(vendor_dir), request.path[len(prefix):])
+        if path is None or not Path(path).is_file():
+            # Leave unknown files to Dash, which answers 404
+            return None
+
+        mimetype = mimetypes.guess_type(path)[0]
+        for encoding, suffix in (("br", ".br"), ("gzip", ".gz")):
+            variant = Path(path + suffix)
+            if request.accept_encodings[encoding] and variant.is_file():
+                response = send_file(variant, mimetype=mimetype)
+                response.headers["Content-Encoding"] = encoding
+                break
+        else:
+            response = send_file(path, mimetype=mimetype)
+        response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+        response.vary.add("Accept-Encoding")
+        return response
+
+
+if __name__ == "__main__":
+    for source, vendored_name in fetch_vendor_assets().items():
+        print(f"{vendored_name}  <-  {source}")
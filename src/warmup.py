@@ -0,0 +1,57 @@
+import itertools
+import time
+from callbacks import (
+    area_chart_figure,
+    bar_chart_figure,
+    disparity_map_figure,
+    pie_chart_figure,
+)
+from components import occupation_marks, region_dropdown, year_dropdown
+from dataset_registry import dataset_snapshot
+from filter_data_functions import (
+    get_disparity_cube,
+    get_filter_index,
+    get_headline_stats,
+    get_year_deltas,
+)
+
+
+def warm_caches():
+    """
+    Load the dataset and build every derived view and chart figure, so the
+    first requests after startup are served from the caches.
+
+    The figures are built for every option offered by the dropdowns and
+    the slider, with the same values the browser sends.
+
+    Returns
+    -------
+    dict
+        The number of figures built and the time taken in seconds.
+    """
+    start = time.perf_counter()
+
+    # Load the data and the views derived from it, all of one version
+    snapshot = dataset_snapshot()
+    get_filter_index(snapshot)
+    get_disparity_cube(snapshot)
+    get_year_deltas(snapshot)
+    get_headline_stats(snapshot)
+
+    # Build each chart for every selection it can show
+    regions = region_dropdown.options
+    years = year_dropdown.options
+    occupations = list(occupation_marks)
+    figures = 0
+    for region, year in itertools.product(regions, years):
+        bar_chart_figure(region, year)
+        pie_chart_figure(region, year)
+        figures += 2
+    for year, occupation in itertools.product(years, occupations):
+        disparity_map_figure(year, occupation)
+        figures += 1
+    for region in regions:
+        area_chart_figure(region)
+        figures += 1
+
+    return {"figures": figures, "seconds": time.perf_counter() - start}
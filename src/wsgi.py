@@ -0,0 +1,15 @@
+"""
+WSGI entry point for production servers, e.g.
+``waitress-serve --host 0.0.0.0 --port 8050 --threads 8 wsgi:application``
+run from the ``src`` directory.
+"""
+from app import app
+from config import WARM_CACHES
+from warmup import warm_caches
+
+# Build the data views and figures before the server accepts connections
+if WARM_CACHES:
+    warm_caches()
+
+# The Flask server behind the Dash app
+application = app.server
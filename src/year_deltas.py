@@ -0,0 +1,146 @@
+import itertools
+import numpy as np
+import pandas as pd
+from reshape import spread_pivot
+
+# Columns identifying a series of values over the years
+YEAR_KEYS = ['Region', 'Occupation Type']
+
+
+def year_panel(disparity_df, value_column='Total Employment'):
+    """
+    Spread a value of the disparity dataframe into one column per year.
+
+    Parameters
+    ----------
+    disparity_df : pd.DataFrame
+        The prepared disparity dataframe.
+    value_column : str, optional
+        The column to spread, by default 'Total Employment'.
+
+    Returns
+    -------
+    pd.DataFrame
+        The key columns followed by one column per year, in year order,
+        with 0 where a year is missing.
+    """
+    return spread_pivot(
+        disparity_df, index=YEAR_KEYS, columns='Year', values=value_column
+    )
+
+
+def panel_years(panel):
+    """
+    List the year columns of a year panel.
+
+    Parameters
+    ----------
+    panel : pd.DataFrame
+        A panel from ``year_panel``.
+
+    Returns
+    -------
+    list of int
+        The years, in ascending order.
+    """
+    return [column for column in panel.columns if column not in YEAR_KEYS]
+
+
+def year_pairs(years, adjacent_only=False):
+    """
+    List the (start, end) pairs of years to compare.
+
+    Parameters
+    ----------
+    years : list of int
+        The years, in ascending order.
+    adjacent_only : bool, optional
+        Whether to list only consecutive years, by default False.
+
+    Returns
+    -------
+    list of tuple
+        The (start year, end year) pairs with the start before the end.
+    """
+    if adjacent_only:
+        return list(zip(years, years[1:]))
+    return list(itertools.combinations(years, 2))
+
+
+def compute_year_deltas(panel, pairs=None):
+    """
+    Compute the change and percentage change of every series between pairs
+    of years, as one vectorised difference along the year axis.
+
+    Parameters
+    ----------
+    panel : pd.DataFrame
+        A panel from ``year_panel``.
+    pairs : list of tuple, optional
+        The (start year, end year) pairs to compare, by default every pair
+        of years.
+
+    Returns
+    -------
+    pd.DataFrame
+        The key columns with 'Start Year', 'End Year', 'Change' and
+        'Percentage Change' for each series and pair. The percentage change
+        is NaN where the start value is 0.
+    """
+    years = panel_years(panel)
+    if pairs is None:
+        pairs = year_pairs(years)
+    values = panel[years].to_numpy(dtype=np.float64)
+
+    # Gather the start and end columns of every pair at once
+    position = {year: i for i, year in enumerate(years)}
+    starts = np.array([position[start] for start, _ in pairs], dtype=np.intp)
+    ends = np.array([position[end] for _, end in pairs], dtype=np.intp)
+    start_values = values[:, starts]
+    change = values[:, ends] - start_values
+    percentage_change = np.divide(
+        change * 100, start_values,
+        out=np.full_like(change, np.nan), where=start_values != 0
+    )
+
+    # Lay the results out with one row per series and pair
+    deltas = panel[YEAR_KEYS].loc[
+        panel.index.repeat(len(pairs))
+    ].reset_index(drop=True)
+    deltas['Start Year'] = np.tile([start for start, _ in pairs], len(panel))
+    deltas['End Year'] = np.tile([end for _, end in pairs], len(panel))
+    deltas['Change'] = change.reshape(-1)
+    deltas['Percentage Change'] = percentage_change.reshape(-1)
+    return deltas
+
+
+def rolling_year_mean(panel, window):
+    """
+    Compute the rolling mean of every series over a window of years.
+
+    Parameters
+    ----------
+    panel : pd.DataFrame
+        A panel from ``year_panel``.
+    window : int
+        The number of consecutive years in each window.
+
+    Returns
+    -------
+    pd.DataFrame
+        The key columns followed by one column per window, named after the
+        window's last year.
+    """
+    years = panel_years(panel)
+    values = panel[years].to_numpy(dtype=np.float64)
+
+    # Difference the running totals to sum each window in one step
+    totals = np.cumsum(
+        np.concatenate([np.zeros((len(values), 1)), values], axis=1), axis=1
+    )
+    means = (totals[:, window:] - totals[:, :-window]) / window
+
+    rolling = pd.DataFrame(means, columns=years[window - 1:])
+    return pd.concat(
+        [panel[YEAR_KEYS].reset_index(drop=True), rolling], axis=1
+    )
@@ -1,5 +1,10 @@
 import os
+import json
+import shutil
+import subprocess
 import pytest
+from dash import no_update
+from dash.exceptions import PreventUpdate
 from selenium.webdriver.chrome.options import Options
 from dash.testing.application_runners import import_app
 from selenium.webdriver.support.ui import WebDriverWait
@@ -130,3 +135,82 @@ def wait_for_clickable_element():
             EC.element_to_be_clickable(locator)
         )
     return _wait_for_clickable_element
+
+
+# Loads assets/clientside.js into a stand-in for the browser's window, calls
+# one of its functions and prints what it returned, or how Dash was told not
+# to update
+CLIENTSIDE_RUNNER = """
+const [script, name, args] = process.argv.slice(1);
+const no_update = {}, PreventUpdate = {};
+global.window = {
+    crypto: require("crypto").webcrypto,
+    dash_clientside: {no_update: no_update, PreventUpdate: PreventUpdate}
+};
+eval(require("fs").readFileSync(script, "utf8"));
+let output;
+try {
+    const value = window.dash_clientside.ui[name](...JSON.parse(args));
+    output = value === no_update ? {no_update: true} : {value: value};
+} catch (error) {
+    if (error !== PreventUpdate) {
+        throw error;
+    }
+    output = {prevent_update: true};
+}
+console.log(JSON.stringify(output));
+"""
+
+
+@pytest.fixture
+def run_clientside():
+    """
+    Run the clientside callbacks of assets/clientside.js with Node.js.
+
+    Returns
+    -------
+    function
+        A function that calls a clientside callback.
+    """
+    node = shutil.which("node")
+    if node is None:
+        pytest.skip("Node.js is needed to run the clientside callbacks")
+    script = os.path.join(
+        os.path.dirname(__file__), os.pardir, "src", "assets", "clientside.js"
+    )
+
+    def _run_clientside(name, *args):
+        """
+        Call a clientside callback as the browser would.
+
+        Parameters
+        ----------
+        name : str
+            The name of the function in the ``ui`` namespace.
+        *args
+            The callback's input and state values, which are sent to the
+            browser as JSON.
+
+        Returns
+        -------
+        object
+            The value returned by the callback, or no_update.
+
+        Raises
+        ------
+        PreventUpdate
+            If the callback prevents the update.
+        """
+        result = subprocess.run(
+            [node, "-e", CLIENTSIDE_RUNNER, script, name, json.dumps(args)],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+        output = json.loads(result.stdout)
+        if output.get("prevent_update"):
+            raise PreventUpdate
+        if output.get("no_update"):
+            return no_update
+        return output["value"]
+    return _run_clientside
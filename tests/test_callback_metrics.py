@@ -0,0 +1,50 @@
+from dash import Dash, Input, Output, dcc, html
+from dash.exceptions import PreventUpdate
+from callback_metrics import enable_metrics, reset_metrics
+
+
+def test_metrics_endpoint():
+    """
+    GIVEN an app with metrics enabled
+    WHEN a callback
+        1. returns a value
+        2. raises PreventUpdate
+        3. raises an exception
+    THEN /metrics reports its latency, response size and outcome counts
+    """
+    app = Dash(__name__)
+    app.layout = html.Div([dcc.Input(id="in"), html.Div(id="out")])
+
+    @app.callback(Output("out", "children"), Input("in", "value"))
+    def echo(value):
+        if value == "skip":
+            raise PreventUpdate
+        if value == "fail":
+            raise ValueError(value)
+        return value
+
+    enable_metrics(app)
+    reset_metrics()
+    client = app.server.test_client()
+
+    # Call the callback once for each outcome
+    for value in ("hello", "skip", "fail"):
+        client.post("/_dash-update-component", json={
+            "output": "out.children",
+            "outputs": {"id": "out", "property": "children"},
+            "inputs": [{"id": "in", "property": "value", "value": value}],
+            "changedPropIds": ["in.value"],
+        })
+
+    # Check every call was timed and each outcome counted once
+    response = client.get("/metrics")
+    assert response.mimetype == "text/plain"
+    lines = response.get_data(as_text=True).splitlines()
+    assert 'dash_callback_duration_seconds_count{callback="echo"} 3' in lines
+    assert 'dash_callback_response_bytes_count{callback="echo"} 1' in lines
+    assert 'dash_callback_prevented_total{callback="echo"} 1' in lines
+    assert 'dash_callback_exceptions_total{callback="echo"} 1' in lines
+    assert (
+        'dash_callback_duration_seconds_bucket{callback="echo",le="+Inf"} 3'
+    ) in lines
+    reset_metrics()
@@ -0,0 +1,50 @@
+from dash import Patch, no_update
+from src.callbacks import chart_update
+from dataset_registry import get_dataset_version
+
+
+def test_show_chart(run_clientside):
+    """
+    GIVEN a chart card with a placeholder image
+    WHEN the chart's filters are
+        1. partly selected
+        2. all selected
+    THEN the placeholder is shown until every filter is selected
+    AND the chart is shown once they are
+    """
+    hidden, shown = {"display": "none"}, {"display": "block"}
+    assert run_clientside("show_chart", "England", None) == [shown, hidden]
+    assert run_clientside("show_chart", None, 3) == [shown, hidden]
+    assert run_clientside("show_chart", "England", "2021") == [hidden, shown]
+
+
+def test_chart_update():
+    """
+    GIVEN a chart figure
+    WHEN it is sent to a browser that
+        1. does not hold the chart's layout
+        2. holds the layout of the current dataset
+    THEN the whole figure is sent with the dataset version the first time
+    AND only the traces and title are patched afterwards
+    """
+    figure = {
+        "data": [{"type": "bar", "x": ["1"], "y": [2.0]}],
+        "layout": {"title": {"text": "Wales in 2021"}, "template": {}},
+    }
+    version = get_dataset_version()
+
+    # Check the whole figure is sent when the browser has no layout
+    assert chart_update(figure, None) == (figure, version)
+
+    # Check only the traces and title are sent once it has the layout
+    update, layout_version = chart_update(figure, version)
+    assert isinstance(update, Patch)
+    assert layout_version is no_update
+    operations = update.to_plotly_json()["operations"]
+    assert [
+        (operation["location"], operation["params"]["value"])
+        for operation in operations
+    ] == [
+        (["data"], figure["data"]),
+        (["layout", "title", "text"], "Wales in 2021"),
+    ]
@@ -0,0 +1,87 @@
+import re
+import pytest
+from dash.exceptions import PreventUpdate
+from components import full_descriptions
+
+
+def test_toggle_data_attribution(run_clientside):
+    """
+    GIVEN the data attribution offcanvas
+    WHEN the Dataset button
+        1. has not been clicked
+        2. has been clicked
+    THEN the offcanvas keeps its state until the button is clicked
+    AND is toggled once it is
+    """
+    assert run_clientside("toggle_data_attribution", None, False) is False
+    assert run_clientside("toggle_data_attribution", 1, False) is True
+    assert run_clientside("toggle_data_attribution", 2, True) is False
+
+
+def test_ensure_session_id(run_clientside):
+    """
+    GIVEN the session id kept in the browser's local storage
+    WHEN the browser
+        1. has no session id
+        2. already has one
+    THEN it is assigned a new random 32 digit hexadecimal id
+    AND keeps the id it already has
+    """
+    session_id = run_clientside("ensure_session_id", None)
+    assert re.fullmatch(r"[0-9a-f]{32}", session_id)
+    assert run_clientside("ensure_session_id", None) != session_id
+
+    with pytest.raises(PreventUpdate):
+        run_clientside("ensure_session_id", session_id)
+
+
+def test_show_summary_button(run_clientside):
+    """
+    GIVEN the summary button
+    WHEN the region, year and occupation filters are
+        1. partly selected
+        2. all selected
+    THEN the button is hidden until every filter is selected
+    AND shown once they are
+    """
+    hidden = {"display": "none", "width": "100%"}
+    shown = {"display": "block", "width": "100%"}
+    assert run_clientside(
+        "show_summary_button", "England", None, 3
+    ) == hidden
+    assert run_clientside(
+        "show_summary_button", None, 2021, 3
+    ) == hidden
+    assert run_clientside(
+        "show_summary_button", "England", 2021, 3
+    ) == shown
+
+
+def test_update_selected_filters(run_clientside):
+    """
+    GIVEN the gender and occupation type statistics cards
+    WHEN the filters are
+        1. partly selected
+        2. all selected
+    THEN the labels of the cards are left alone until every filter they show
+         is selected
+    AND show the selected region, year and occupation description once they
+        are
+    """
+    with pytest.raises(PreventUpdate):
+        run_clientside(
+            "update_selected_filters_for_gender_stats", "England", None
+        )
+    assert run_clientside(
+        "update_selected_filters_for_gender_stats", "England", 2021
+    ) == ["England", 2021]
+
+    with pytest.raises(PreventUpdate):
+        run_clientside(
+            "update_selected_filters_for_occ_stats",
+            "England", 2021, None, full_descriptions
+        )
+    assert run_clientside(
+        "update_selected_filters_for_occ_stats",
+        "England", 2021, 2, full_descriptions
+    ) == ["England", 2021, full_descriptions[2]]
@@ -0,0 +1,48 @@
+import gzip
+import brotli
+from dash import Dash, html
+from compression import enable_compression
+
+
+def test_dash_responses_are_compressed():
+    """
+    GIVEN an app with compression enabled
+    WHEN its layout is requested
+        1. accepting brotli and gzip
+        2. accepting only gzip
+        3. without compression
+        4. from an app with a size threshold above the layout's size
+    THEN the layout is compressed with the best accepted encoding
+    AND it is sent unchanged when no encoding is accepted or it is small
+    """
+    app = Dash(__name__)
+    app.layout = html.Div([html.P(f"Row {i}") for i in range(200)])
+    enable_compression(app)
+    client = app.server.test_client()
+    original = client.get(
+        "/_dash-layout", headers={"Accept-Encoding": "identity"}
+    ).data
+
+    # Check brotli is preferred and gzip is used when it is the only option
+    response = client.get(
+        "/_dash-layout", headers={"Accept-Encoding": "gzip, deflate, br"}
+    )
+    assert response.headers["Content-Encoding"] == "br"
+    assert brotli.decompress(response.data) == original
+    assert response.headers["Content-Length"] == str(len(response.data))
+    response = client.get(
+        "/_dash-layout", headers={"Accept-Encoding": "gzip"}
+    )
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(response.data) == original
+    assert "Accept-Encoding" in response.headers["Vary"]
+
+    # Check responses below the threshold are left uncompressed
+    small_app = Dash(__name__)
+    small_app.layout = html.Div([html.P(f"Row {i}") for i in range(200)])
+    enable_compression(small_app, min_size=len(original) + 1)
+    response = small_app.server.test_client().get(
+        "/_dash-layout", headers={"Accept-Encoding": "gzip, br"}
+    )
+    assert "Content-Encoding" not in response.headers
+    assert response.data == original
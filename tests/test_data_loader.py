@@ -0,0 +1,56 @@
+import os
+import pandas as pd
+from src.data_loader import load_employment_data, MANIFEST_NAME
+
+
+def test_load_employment_data_uses_cache(tmp_path):
+    """
+    GIVEN a workbook and an empty cache directory
+    WHEN the workbook is loaded twice
+    THEN the first load writes a feather cache file and a manifest
+    AND the second load returns the same data from the cache
+    """
+    # Write a small workbook to a temporary directory
+    data_path = tmp_path / "employment.xlsx"
+    cache_dir = tmp_path / "cache"
+    pd.DataFrame(
+        {"Region": ["England", "Wales"], "Year": [2021, 2021]}
+    ).to_excel(data_path, index=False)
+
+    # Load the workbook and check the cache was written
+    first, first_digest = load_employment_data(data_path, cache_dir)
+    cache_files = list(cache_dir.glob("*.feather"))
+    assert len(cache_files) == 1
+    assert (cache_dir / MANIFEST_NAME).exists()
+
+    # Load again and check the cached data matches the workbook
+    second, second_digest = load_employment_data(data_path, cache_dir)
+    pd.testing.assert_frame_equal(first, second)
+    assert second_digest == first_digest
+
+
+def test_load_employment_data_invalidates_on_change(tmp_path):
+    """
+    GIVEN a workbook that has already been cached
+    WHEN the workbook is rewritten with different content
+    THEN the next load returns the new content
+    AND the stale cache file is removed
+    """
+    # Write and cache the original workbook
+    data_path = tmp_path / "employment.xlsx"
+    cache_dir = tmp_path / "cache"
+    pd.DataFrame({"Year": [2021]}).to_excel(data_path, index=False)
+    load_employment_data(data_path, cache_dir)
+    old_cache_files = set(cache_dir.glob("*.feather"))
+
+    # Rewrite the workbook and bump its modification time
+    pd.DataFrame({"Year": [2023]}).to_excel(data_path, index=False)
+    stat = data_path.stat()
+    os.utime(data_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    # Check the new content is loaded and only the new cache file remains
+    df, _ = load_employment_data(data_path, cache_dir)
+    assert df["Year"].tolist() == [2023]
+    new_cache_files = set(cache_dir.glob("*.feather"))
+    assert len(new_cache_files) == 1
+    assert new_cache_files.isdisjoint(old_cache_files)
@@ -0,0 +1,184 @@
+import threading
+import pytest
+from data_loader import load_employment_data
+# Import the registry the way the app does, so the test shares its dataset
+from dataset_registry import (
+    derived_view,
+    get_dataset,
+    get_dataset_digest,
+    get_dimension,
+    get_dataset_version,
+    memory_report,
+    set_dataset,
+    DERIVED_SCHEMA,
+    FACT_COLUMNS,
+    SCHEMA,
+)
+from filter_data_functions import filter_dataframe
+
+
+def test_dataset_is_shared_typed_and_read_only():
+    """
+    GIVEN the shared employment dataset
+    WHEN it is requested several times and filtered
+    THEN the same typed dataframe is returned every time
+    AND it cannot be modified in place
+    AND only one full copy of it is alive in the process
+    """
+    # Check the same dataframe is returned on every call
+    dataset = get_dataset()
+    assert get_dataset() is dataset
+
+    # Check every column has the type declared in the schema
+    assert {
+        column: str(dtype) for column, dtype in dataset.dtypes.items()
+    } == {column: SCHEMA[column] for column in FACT_COLUMNS}
+
+    # Check the labels are categoricals in a fixed order
+    assert list(dataset["Region"].cat.categories) == [
+        "England", "Northern Ireland", "Scotland", "Wales"
+    ]
+
+    # Check in-place writes to the shared dataframe are rejected
+    with pytest.raises(ValueError):
+        dataset.loc[dataset.index[0], "Year"] = 1999
+
+    # Check filtered results are independent, writable frames
+    filtered_df = filter_dataframe(region="Wales", year=2021)
+    filtered_df["Year"] = 1999
+    assert (get_dataset()["Year"] != 1999).all()
+
+    # Check the memory report counts a single full copy
+    del filtered_df
+    report = memory_report()
+    assert report["full_copies"] == 1
+    assert report["rows"] == len(dataset)
+
+
+def test_dimensions_hold_the_attributes_of_each_label():
+    """
+    GIVEN the employment workbook and the loaded dataset
+    WHEN the dimension tables are requested
+    THEN each has a row per category of its fact column, in category order
+    AND joining them onto the fact table restores the workbook's columns
+    AND the occupation codes are parsed from the occupation types
+    """
+    dataset = get_dataset()
+    workbook, _ = load_employment_data()
+    for key in ("Region", "Occupation Type", "Gender"):
+        dimension = get_dimension(key)
+        assert list(dimension.index) == list(dataset[key].cat.categories)
+        if len(dimension.columns):
+            joined = dataset.join(dimension, on=key)
+            for column in dimension.columns.intersection(workbook.columns):
+                assert (joined[column].astype(str)
+                        == workbook[column].astype(str)).all()
+
+    occupations = get_dimension("Occupation Type")
+    assert {
+        column: str(dtype) for column, dtype in occupations.dtypes.items()
+    } == DERIVED_SCHEMA
+    assert list(occupations["Occupation Code"]) == list(range(1, 10))
+    assert list(occupations["Short Occupation Type"].astype(str)) == [
+        occupation.split(":")[0] for occupation in occupations.index
+    ]
+
+
+def test_set_dataset_rejects_varying_region_attributes():
+    """
+    GIVEN the employment workbook with one row's coordinates moved
+    WHEN it is installed as the dataset
+    THEN it is rejected, since a region has a single location
+    """
+    workbook, _ = load_employment_data()
+    workbook.loc[0, "Latitude"] += 1
+    with pytest.raises(ValueError, match="Latitude"):
+        set_dataset(workbook)
+
+
+def test_derived_view_is_memoized():
+    """
+    GIVEN a view registered with derived_view
+    WHEN the view is requested twice
+    THEN it is built once for the current dataset version
+    """
+    calls = []
+
+    @derived_view("test-region-count")
+    def region_count(snapshot):
+        calls.append(snapshot.version)
+        return snapshot.dataset["Region"].nunique()
+
+    # Request the view twice and check it was only built once
+    assert region_count() == region_count() == 4
+    assert calls == [get_dataset_version()]
+    assert "test-region-count" in memory_report()["views"]
+
+
+def test_slow_view_does_not_block_other_views_or_a_swap():
+    """
+    GIVEN a view that is slow to build
+    WHEN another view is requested and the dataset is replaced while the
+         slow view is being built
+    THEN the other view and the new dataset are available at once
+    AND the slow view is not kept for the replaced dataset
+    """
+    started, release = threading.Event(), threading.Event()
+    released = []
+
+    @derived_view("test-slow-view")
+    def slow_view(snapshot):
+        started.set()
+        # Wait to be released, giving up rather than hanging the test
+        released.append(release.wait(timeout=10))
+        return snapshot.version
+
+    @derived_view("test-fast-view")
+    def fast_view(snapshot):
+        return snapshot.version
+
+    workbook, digest = load_employment_data()
+    version = get_dataset_version()
+    builder = threading.Thread(target=slow_view)
+    builder.start()
+    try:
+        assert started.wait(timeout=10)
+        # Build another view and replace the dataset while the slow view
+        # is still being built
+        assert fast_view() == version
+        new_version = set_dataset(workbook, digest=digest)
+    finally:
+        release.set()
+        builder.join(timeout=10)
+
+    assert not builder.is_alive()
+    # The slow view was released while it was built, not after timing out
+    assert released[0]
+    assert "test-slow-view" not in memory_report()["views"]
+    assert slow_view() == new_version
+
+
+def test_set_dataset_replaces_views():
+    """
+    GIVEN the shared employment dataset and a view built from it
+    WHEN the dataset is replaced by a subset of its rows
+    THEN the version and digest change
+    AND filters and views are answered from the new dataset
+    """
+    workbook, digest = load_employment_data()
+    version = get_dataset_version()
+    assert digest == get_dataset_digest()
+    assert len(filter_dataframe(region="Wales")) > 0
+
+    try:
+        # Keep only the rows of one region
+        new_version = set_dataset(workbook[workbook["Region"] != "Wales"])
+        assert new_version == get_dataset_version() != version
+        assert get_dataset_digest() != digest
+        assert len(filter_dataframe(region="Wales")) == 0
+        assert memory_report()["views"] == ["filter-index"]
+    finally:
+        # Restore the workbook's dataset for the other tests
+        set_dataset(workbook, digest=digest)
+
+    assert len(filter_dataframe(region="Wales")) > 0
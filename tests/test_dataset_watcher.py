@@ -0,0 +1,95 @@
+import time
+from data_loader import load_employment_data
+# Import the registry the way the app does, so the test shares its dataset
+from dataset_registry import (
+    dataset_snapshot,
+    get_dataset_version,
+    set_dataset,
+)
+from dataset_watcher import (
+    check_for_update,
+    start_dataset_watcher,
+    stop_dataset_watcher,
+)
+from figure_cache import cached_figure, clear_figure_cache, figure_cache_stats
+from filter_data_functions import (
+    filter_dataframe,
+    get_filter_index,
+    get_year_deltas,
+    slice_disparity_cube,
+)
+import plotly.graph_objects as go
+
+
+def test_check_for_update_swaps_in_a_changed_workbook(tmp_path):
+    """
+    GIVEN a loaded dataset with a cached figure
+    WHEN its workbook is replaced by one without Wales, then left as is,
+        then replaced by one missing a column
+    THEN the new workbook is swapped in under a new version
+    AND the cached figures of the old version are dropped
+    AND work holding the old snapshot still sees the old dataset
+    AND unchanged and invalid workbooks leave the dataset as it is
+    """
+    original = dataset_snapshot()
+    data_path = tmp_path / "employment.xlsx"
+    cache_dir = tmp_path / "cache"
+    clear_figure_cache()
+    cached_figure("test", ("a",), go.Figure)
+
+    try:
+        # Publish a workbook without Wales
+        dataset, _ = load_employment_data()
+        dataset[dataset["Region"] != "Wales"].to_excel(data_path, index=False)
+        version = check_for_update(data_path, cache_dir)
+        assert version == get_dataset_version() == original.version + 1
+        assert len(filter_dataframe(region="Wales")) == 0
+        assert figure_cache_stats()["invalidations"] == 1
+        assert figure_cache_stats()["size"] == 0
+
+        # Check the old snapshot's views are still built from it, including
+        # the views derived from other views
+        assert "Wales" in get_filter_index(original)["Region"]
+        assert "Wales" in set(get_year_deltas(original)["panel"]["Region"])
+        assert len(slice_disparity_cube(region="Wales",
+                                        snapshot=original)) > 0
+        assert len(slice_disparity_cube(region="Wales")) == 0
+
+        # Check an untouched workbook is not reloaded
+        assert check_for_update(data_path, cache_dir) is None
+
+        # Check a workbook missing a column is rejected
+        time.sleep(0.01)
+        dataset.drop(columns="Gender").to_excel(data_path, index=False)
+        assert check_for_update(data_path, cache_dir) is None
+        assert get_dataset_version() == version
+        assert len(filter_dataframe(region="Scotland")) > 0
+    finally:
+        # Restore the workbook's dataset for the other tests
+        set_dataset(*load_employment_data())
+        clear_figure_cache()
+
+
+def test_dataset_watcher_reloads_in_the_background(tmp_path):
+    """
+    GIVEN a dataset watcher started on a workbook
+    WHEN the workbook is replaced
+    THEN the watcher swaps the new dataset in without being asked
+    """
+    original = dataset_snapshot()
+    data_path = tmp_path / "employment.xlsx"
+    dataset, _ = load_employment_data()
+    dataset.to_excel(data_path, index=False)
+
+    start_dataset_watcher(0.01, data_path, tmp_path / "cache", warm=False)
+    try:
+        dataset[dataset["Year"] != 2023].to_excel(data_path, index=False)
+        # Wait for the watcher to notice the change
+        deadline = time.monotonic() + 10
+        while (get_dataset_version() == original.version
+               and time.monotonic() < deadline):
+            time.sleep(0.01)
+        assert len(filter_dataframe(year=2023)) == 0
+    finally:
+        stop_dataset_watcher()
+        set_dataset(*load_employment_data())
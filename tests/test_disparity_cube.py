@@ -0,0 +1,32 @@
+import itertools
+import pandas as pd
+from filter_data_functions import (
+    filter_dataframe,
+    prepare_disparity_df,
+    slice_disparity_cube,
+)
+
+
+def test_slice_disparity_cube_matches_pivot():
+    """
+    GIVEN the precomputed disparity table
+    WHEN it is sliced for every combination of region, year and occupation
+    THEN the slice matches pivoting the filtered dataframe directly
+    """
+    regions = [None, "England", "Wales", "Scotland", "Northern Ireland"]
+    years = [None, 2021, "2022", 2023]
+    prefixes = [None] + [f"{code}:" for code in range(1, 10)]
+
+    for region, year, prefix in itertools.product(regions, years, prefixes):
+        # Pivot the filtered dataframe the way the callbacks used to
+        expected = prepare_disparity_df(filter_dataframe(
+            region=region, year=year, occupation_prefix=prefix
+        ))
+
+        # Check the slice of the precomputed table is identical
+        pd.testing.assert_frame_equal(
+            slice_disparity_cube(
+                region=region, year=year, occupation_prefix=prefix
+            ),
+            expected
+        )
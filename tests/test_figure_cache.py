@@ -0,0 +1,55 @@
+import plotly.graph_objects as go
+# Import the cache the way the app does, so the test shares its state
+import figure_cache
+from figure_cache import cached_figure, clear_figure_cache, figure_cache_stats
+
+
+def test_cached_figure_counts_hits_and_evicts(monkeypatch):
+    """
+    GIVEN a figure cache holding two figures
+    WHEN figures are requested
+        1. for the first time
+        2. again with the same inputs
+        3. for a third set of inputs
+        4. after the time to live has passed
+    THEN the figure is built only on misses
+    AND the least recently used figure is evicted
+    AND expired figures are rebuilt
+    """
+    monkeypatch.setattr(figure_cache, "FIGURE_CACHE_SIZE", 2)
+    monkeypatch.setattr(figure_cache, "FIGURE_CACHE_TTL", 60)
+    now = [0.0]
+    monkeypatch.setattr(figure_cache, "_clock", lambda: now[0])
+    clear_figure_cache()
+    builds = []
+
+    def build(title):
+        def builder():
+            builds.append(title)
+            return go.Figure(layout={"title": {"text": title}})
+        return builder
+
+    # Check the first request builds the figure and later ones do not
+    first = cached_figure("test", ("a",), build("a"))
+    again = cached_figure("test", ("a",), build("a"))
+    assert first == again
+    assert again["layout"]["title"]["text"] == "a"
+    assert builds == ["a"]
+
+    # Check a third figure evicts the least recently used one
+    cached_figure("test", ("b",), build("b"))
+    cached_figure("test", ("a",), build("a"))
+    cached_figure("test", ("c",), build("c"))
+    cached_figure("test", ("b",), build("b"))
+    assert builds == ["a", "b", "c", "b"]
+
+    # Check a figure older than the time to live is rebuilt
+    now[0] = 61.0
+    cached_figure("test", ("b",), build("b"))
+    assert builds == ["a", "b", "c", "b", "b"]
+
+    assert figure_cache_stats() == {
+        "hits": 2, "misses": 5, "evictions": 2, "expirations": 1,
+        "invalidations": 0, "size": 2, "max_size": 2,
+    }
+    clear_figure_cache()
@@ -0,0 +1,71 @@
+import itertools
+import pandas as pd
+from filter_data_functions import filter_dataframe, slice_disparity_cube
+from dataset_registry import get_dataset
+
+
+def test_filter_dataframe_matches_boolean_masks():
+    """
+    GIVEN the indexed filter engine behind filter_dataframe
+    WHEN it is called with every combination of region, year, occupation
+         prefix and gender filters
+    THEN it returns the same rows as filtering with boolean masks
+    """
+    df = get_dataset()
+    regions = [None, "England", "Wales", "Scotland", "Northern Ireland"]
+    years = [None, 2021, "2022", 2023]
+    prefixes = [None, "1:", "9:", "1", "10:"]
+    genders = [None, "Male", "Female"]
+
+    for region, year, prefix, gender in itertools.product(
+        regions, years, prefixes, genders
+    ):
+        # Build the expected result with a boolean mask per filter
+        mask = pd.Series(True, index=df.index)
+        if region:
+            mask &= df["Region"] == region
+        if year:
+            mask &= df["Year"] == int(year)
+        if prefix:
+            mask &= df["Occupation Type"].str.startswith(prefix)
+        if gender:
+            mask &= df["Gender"] == gender
+
+        # Check the indexed filter returns the same rows in the same order
+        filtered_df = filter_dataframe(
+            region=region, year=year,
+            occupation_prefix=prefix, gender=gender
+        )
+        pd.testing.assert_frame_equal(filtered_df, df[mask])
+
+
+def test_filter_dataframe_returns_independent_copy():
+    """
+    GIVEN the shared employment dataset
+    WHEN a filtered dataframe is modified
+    THEN the shared dataset is unchanged
+    """
+    filtered_df = filter_dataframe(region="England", year=2021)
+    filtered_df["Occupation Label"] = "x"
+    filtered_df["Year"] = 1999
+    assert "Occupation Label" not in get_dataset().columns
+    assert (get_dataset()["Year"] != 1999).all()
+
+
+def test_filter_dataframe_by_occupation_code():
+    """
+    GIVEN the occupation codes derived when the dataset is loaded
+    WHEN the dataset and disparity table are filtered by an occupation code
+    THEN they return the same rows as filtering by its occupation prefix
+    AND an unknown code returns no rows
+    """
+    for code in range(1, 10):
+        pd.testing.assert_frame_equal(
+            filter_dataframe(year=2021, occupation_code=code),
+            filter_dataframe(year=2021, occupation_prefix=f"{code}:")
+        )
+        pd.testing.assert_frame_equal(
+            slice_disparity_cube(year=2021, occupation_code=code),
+            slice_disparity_cube(year=2021, occupation_prefix=f"{code}:")
+        )
+    assert filter_dataframe(occupation_code=10).empty
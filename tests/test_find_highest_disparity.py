@@ -0,0 +1,112 @@
+import pytest
+import filter_data_functions
+from filter_data_functions import (
+    find_highest_dis_by_gender,
+    find_overall_highest_disparity,
+    find_year_disparity_extremes,
+    prepare_disparity_df,
+    prepare_year_pivot_df,
+)
+from dataset_registry import get_dataset, PERCENTAGE_COLUMN
+
+
+def melt_highest_dis_by_gender(df, gender, region=None):
+    """
+    Find the highest year disparity for a gender by merging and melting,
+    as find_highest_dis_by_gender originally did.
+    """
+    if region:
+        df = df[df['Region'] == region]
+    prepared_df = prepare_disparity_df(df)
+    pivot_df = prepare_year_pivot_df(prepared_df)
+    keys = ['Region', 'Occupation Type']
+    merged_df = prepared_df.merge(
+        pivot_df[keys + ['Year Disparity']], on=keys, how='left'
+    )
+    melted_df = merged_df.melt(
+        id_vars=['Region', 'Year', 'Occupation Type', 'Total Employment',
+                 'Disparity', 'Year Disparity'],
+        value_vars=['Male', 'Female'],
+        var_name='Gender',
+        value_name=PERCENTAGE_COLUMN
+    )
+    gender_df = melted_df[melted_df["Gender"] == gender]
+    highest = gender_df['Year Disparity'].abs().max()
+    idx = gender_df['Year Disparity'].abs().idxmax()
+    sign = "-" if gender_df['Year Disparity'][idx] < 0 else ""
+    return (f"{sign}{highest:.2f}", gender_df['Occupation Type'][idx],
+            gender_df['Region'][idx])
+
+
+@pytest.mark.parametrize(
+    "region", [None, "England", "Wales", "Scotland", "Northern Ireland"]
+)
+def test_single_pass_matches_melt(region):
+    """
+    GIVEN the employment dataset, optionally limited to a region
+    WHEN the highest year disparities are found in a single pass
+    THEN each gender's result matches the original merge-and-melt search
+    AND the overall result picks between them by numeric value
+    """
+    df = get_dataset()
+    male = melt_highest_dis_by_gender(df, "Male", region)
+    female = melt_highest_dis_by_gender(df, "Female", region)
+
+    # Check the per-gender tuples are unchanged
+    assert find_highest_dis_by_gender(df, "Male", region) == male
+    assert find_highest_dis_by_gender(df, "Female", region) == female
+
+    # Check the overall result compares the genders as before
+    if float(male[0]) > float(female[0]):
+        expected_overall = male + ("Male",)
+    elif float(male[0]) == float(female[0]):
+        expected_overall = male + ("Equal",)
+    else:
+        expected_overall = female + ("Female",)
+    assert find_overall_highest_disparity(df, region) == expected_overall
+
+
+def test_extremes_include_numeric_values():
+    """
+    GIVEN the prepared disparity dataframe
+    WHEN the year disparity extremes are found
+    THEN each gender's extreme carries a numeric value matching its
+         formatted percentage
+    """
+    extremes = find_year_disparity_extremes(
+        prepare_disparity_df(get_dataset())
+    )
+    for extreme in extremes.values():
+        assert isinstance(extreme["value"], float)
+        assert f"{extreme['value']:.2f}" == extreme["percentage"]
+
+
+@pytest.mark.parametrize("region", [None, "Wales"])
+def test_registered_dataset_is_searched_in_the_cached_views(
+        region, monkeypatch):
+    """
+    GIVEN the registered dataset and an ad-hoc copy of it
+    WHEN the highest year disparities are found in each
+    THEN the registered dataset is searched without pivoting it again
+    AND both give the same results, also for a backwards pair of years
+    """
+    df = get_dataset()
+    ad_hoc = df.copy()
+    expected = {
+        (start, end): (
+            find_highest_dis_by_gender(ad_hoc, "Male", region, start, end),
+            find_overall_highest_disparity(ad_hoc, region, start, end),
+        )
+        for start, end in ((None, None), (2023, 2021))
+    }
+
+    def fail(*args, **kwargs):
+        raise AssertionError("the registered dataset was pivoted again")
+    monkeypatch.setattr(filter_data_functions, "prepare_disparity_df", fail)
+    monkeypatch.setattr(filter_data_functions, "prepare_year_pivot_df", fail)
+
+    for (start, end), (male, overall) in expected.items():
+        assert find_highest_dis_by_gender(df, "Male", region,
+                                          start, end) == male
+        assert find_overall_highest_disparity(df, region,
+                                              start, end) == overall
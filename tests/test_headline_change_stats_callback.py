@@ -0,0 +1,58 @@
+import pytest
+from dash.exceptions import PreventUpdate
+from src.callbacks import update_headline_change_stats
+from filter_data_functions import (
+    find_highest_dis_by_gender,
+    find_overall_highest_disparity,
+    get_year_deltas,
+)
+from dataset_registry import get_dataset
+
+
+def test_update_headline_change_stats():
+    """
+    GIVEN the greatest change in employment cards
+    WHEN the summary statistics are
+        1. closed
+        2. opened
+    THEN no update occurs while closed
+    AND the cards show the dataset-wide highest year disparities when opened
+    AND each card shows its series' relative change and recent average
+    """
+    # Check nothing is computed while the summary statistics are closed
+    with pytest.raises(PreventUpdate):
+        update_headline_change_stats(False)
+
+    # Compute the expected statistics directly from the dataset
+    male = find_highest_dis_by_gender(get_dataset(), "Male")
+    female = find_highest_dis_by_gender(get_dataset(), "Female")
+    overall = find_overall_highest_disparity(get_dataset())
+
+    # Open the summary statistics and check the card contents
+    output = update_headline_change_stats(True)
+    assert output[:3] == (overall[1], overall[3], overall[2])
+    assert output[4] == f"{overall[0]}%"
+    assert output[8:10] == (male[1], male[2])
+    assert output[11] == f"{male[0]}%"
+    assert output[15:17] == (female[1], female[2])
+    assert output[18] == f"{female[0]}%"
+
+    # Check the relative change and the two-year average of the overall
+    # series are read from the cached year deltas
+    panel = get_year_deltas()["panel"]
+    series = panel[(panel["Region"] == overall[2])
+                   & (panel["Occupation Type"] == overall[1])]
+    start, middle, end = (float(series[year].iloc[0])
+                          for year in (2021, 2022, 2023))
+    assert output[6] == f"{(end - start) * 100 / start:.2f}%"
+    assert output[7] == f"{(middle + end) / 2:.2f}% (2022-2023)"
+    assert output[13:15] == output[20:22] == output[6:8]
+
+    # Check the change is measured between the first and last years
+    assert output[22:] == (2021, 2023)
+
+    # Check the icon follows the sign of the change
+    if float(overall[0]) >= 0:
+        assert "bi-arrow-up" in output[3]
+    else:
+        assert "bi-arrow-down" in output[3]
@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+import pytest
+from filter_data_functions import filter_dataframe, prepare_disparity_df
+from dataset_registry import get_dataset, PERCENTAGE_COLUMN
+
+INDEX_COLUMNS = ['Region', 'Year', 'Occupation Type']
+
+
+def pivot_disparity_df(filtered_df):
+    """
+    Prepare the disparity dataframe with pivot_table, as
+    prepare_disparity_df originally did.
+    """
+    disparity_df = filtered_df.pivot_table(
+        index=INDEX_COLUMNS,
+        columns='Gender',
+        values=PERCENTAGE_COLUMN,
+        fill_value=0,
+        observed=True
+    ).reset_index()
+    disparity_df['Total Employment'] = (
+        disparity_df['Male'] + disparity_df['Female']
+    )
+    disparity_df['Disparity'] = (
+        disparity_df['Male'] - disparity_df['Female']
+    ).abs()
+    return disparity_df
+
+
+def irregular_dataset():
+    """
+    Build a copy of the dataset with duplicate rows, missing values and a
+    missing gender, to exercise pivot_table's averaging and filling.
+    """
+    df = get_dataset().copy()
+    # Duplicate some rows with different values so they are averaged
+    duplicates = df.iloc[:6].copy()
+    duplicates[PERCENTAGE_COLUMN] = 1.0
+    df = pd.concat([df, duplicates], ignore_index=True)
+    # Blank out a value and a region, and drop one gender's row
+    df.loc[10, PERCENTAGE_COLUMN] = np.nan
+    df.loc[30, 'Region'] = np.nan
+    return df.drop(index=20).reset_index(drop=True)
+
+
+@pytest.mark.parametrize(
+    "filtered_df",
+    [
+        # Test case 1: The whole dataset
+        get_dataset(),
+        # Test case 2: A region and year, as used by the pie chart
+        filter_dataframe(region="Wales", year=2022),
+        # Test case 3: A year and occupation, as used by the disparity map
+        filter_dataframe(year=2023, occupation_prefix="4:"),
+        # Test case 4: Duplicates, missing values and a missing gender
+        irregular_dataset(),
+    ],
+)
+def test_prepare_disparity_df_matches_pivot_table(filtered_df):
+    """
+    GIVEN a filtered employment dataframe
+    WHEN the disparity dataframe is prepared
+    THEN it is identical to the result of the original pivot_table version
+    """
+    pd.testing.assert_frame_equal(
+        prepare_disparity_df(filtered_df),
+        pivot_disparity_df(filtered_df)
+    )
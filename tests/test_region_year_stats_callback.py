@@ -0,0 +1,49 @@
+import pytest
+from dash.exceptions import PreventUpdate
+from src.callbacks import update_region_year_stats
+from filter_data_functions import filter_dataframe, prepare_disparity_df
+
+PERCENTAGE_COLUMN = (
+    'Percentage Employed (Relative to Total Employment in the Year)'
+)
+
+
+def highest(df, column):
+    """
+    Return the occupation with the highest value of a column and the value
+    formatted as a percentage.
+    """
+    row = df.loc[df[column].idxmax()]
+    return row['Occupation Type'], f"{row[column]:.2f}%"
+
+
+def test_update_region_year_stats():
+    """
+    GIVEN the occupation statistics of the summary statistics
+    WHEN the region and year are
+        1. not both selected
+        2. selected
+    THEN no update occurs without both selections
+    AND every statistic matches the one computed from the filtered rows
+    """
+    # Check nothing is computed until both dropdowns have a value
+    with pytest.raises(PreventUpdate):
+        update_region_year_stats(None, 2022)
+    with pytest.raises(PreventUpdate):
+        update_region_year_stats("Wales", None)
+
+    # Compute the expected statistics from the filtered rows
+    disparity_df = prepare_disparity_df(
+        filter_dataframe(region="Wales", year=2022)
+    )
+    male_df = filter_dataframe(region="Wales", year=2022, gender="Male")
+    female_df = filter_dataframe(region="Wales", year=2022, gender="Female")
+    expected = (
+        highest(disparity_df, 'Disparity')
+        + highest(disparity_df, 'Total Employment')
+        + highest(male_df, PERCENTAGE_COLUMN)
+        + highest(female_df, PERCENTAGE_COLUMN)
+    )
+
+    # Check the single callback returns all eight outputs
+    assert update_region_year_stats("Wales", 2022) == expected
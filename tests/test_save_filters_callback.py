@@ -1,101 +1,84 @@
 import pytest
-from dash import no_update
+from dash import Patch, no_update
 from dash.exceptions import PreventUpdate
 from contextvars import copy_context
 from dash._callback_context import context_value
 from dash._utils import AttributeDict
 from src.callbacks import save_filters
+from saved_analyses import init_saved_analyses, save_analysis
 import dash_bootstrap_components as dbc
 
 # References:
 # https://plotly.com/blog/building-unit-tests-for-dash-applications/
 
 
+@pytest.fixture(autouse=True)
+def saved_analyses_db():
+    """
+    Point the saved analyses repository at an empty in-memory database.
+    """
+    init_saved_analyses("sqlite://")
+
+
 @pytest.mark.parametrize(
-    "n_clicks, custom_analysis_name, region, year, occupation, current_data,"
-    "current_menu_items, expected_output",
+    "n_clicks, custom_analysis_name, region, year, occupation,"
+    "existing_names, expected_output",
     [
         # Test case 1: Save a new analysis with a custom name
         (
-            1, "Test Analysis", "Scotland", 2021, "1", [], [],
+            1, "Test Analysis", "Scotland", "2021", 1, [],
             (
                 [
                     dbc.DropdownMenuItem(
                         children='Test Analysis',
-                        id={'type': 'saved-analysis', 'index': 0},
+                        id={'type': 'saved-analysis', 'index': 1},
                         n_clicks=0
                     )
                 ],
-                [
-                    {
-                        "name": "Test Analysis",
-                        "region": "Scotland",
-                        "year": 2021,
-                        "occupation": "1"
-                    }
-                ],
                 False,
-                no_update
+                no_update,
+                1
             )
         ),
 
-        # Test case 2: Save a new analysis with the default name
-        (1, "", "England", 2023, "3", [], [], (
+        # Test case 2: Save a new analysis with the default name, numbered
+        # after the session's earlier analyses
+        (1, "", "England", "2023", 3, ["Earlier Analysis"], (
             [
                 dbc.DropdownMenuItem(
-                    children='Analysis 1: England, 2023',
-                    id={'type': 'saved-analysis', 'index': 0},
+                    children='Analysis 2: England, 2023',
+                    id={'type': 'saved-analysis', 'index': 2},
                     n_clicks=0
                 )
             ],
-            [
-                {
-                    "name": "Analysis 1: England, 2023",
-                    "region": "England",
-                    "year": 2023,
-                    "occupation": "3"
-                }
-            ],
             False,
-            no_update
+            no_update,
+            2
         )),
 
         # Test case 3: Prevent saving an analysis without selecting a
         # region and year
-        (1, "", "", 2021, "1", [], [], (
-            no_update,
+        (1, "", "", "2021", 1, [], (
             no_update,
             True,
-            "Please select a region and year before saving an analysis."
+            "Please select a region and year before saving an analysis.",
+            no_update
         )),
 
         # Test case 4: Prevent saving an analysis with a duplicate name
-        (1, "Test Analysis", "Scotland", 2021, "1", [
-            {
-                "name": "Test Analysis",
-                "region": "Scotland",
-                "year": 2021,
-                "occupation": "1"
-            }
-        ], [
-            {
-                "type": "saved-analysis",
-                "index": 0,
-                "children": "Test Analysis"
-            }
-        ], (
-            no_update,
+        (1, "Test Analysis", "Scotland", "2021", 1, ["Test Analysis"], (
             no_update,
             True,
             (
                 "An analysis named 'Test Analysis' already exists. "
                 "Please choose a different name."
-            )
+            ),
+            no_update
         )),
 
         # Test case 5: Prevent saving an analysis without clicking the
         # save button
-        (0, "", "", "", "", "", [], (
+        (0, "", "", "", "", [], (
             PreventUpdate,
             PreventUpdate,
             PreventUpdate,
@@ -109,12 +92,14 @@ def test_save_filters(
         region,
         year,
         occupation,
-        current_data,
-        current_menu_items,
+        existing_names,
         expected_output):
     """
     Test the save_filters callback function with various scenarios.
     """
+    # Save the session's earlier analyses
+    for name in existing_names:
+        save_analysis("test-session", name, "Wales", "2022", 2)
 
     def run_callback():
         """
@@ -131,7 +116,7 @@ def test_save_filters(
         )
         return save_filters(
             n_clicks, custom_analysis_name, region, year, occupation,
-            current_data, current_menu_items
+            "test-session", len(existing_names)
         )
 
     ctx = copy_context()
@@ -143,19 +128,48 @@ def test_save_filters(
     else:
         output = ctx.run(run_callback)
 
-        if isinstance(expected_output, tuple):
-            output = ctx.run(run_callback)
-            # Compare the properties of the DropdownMenuItem objects
-            output_menu_items = output[0]
-            expected_menu_items = expected_output[0]
-
-            if expected_menu_items == no_update:
-                assert output_menu_items == expected_menu_items
-            else:
-                for output_item, expected_item in zip(output_menu_items,
-                                                      expected_menu_items):
-                    assert output_item.children == expected_item.children
-                    assert output_item.id == expected_item.id
-                    assert output_item.n_clicks == expected_item.n_clicks
-
-            assert output[1:] == expected_output[1:]
+        # Compare the properties of the DropdownMenuItem objects appended
+        # by the patch
+        output_menu_items = output[0]
+        expected_menu_items = expected_output[0]
+
+        if expected_menu_items == no_update:
+            assert output_menu_items == expected_menu_items
+        else:
+            assert isinstance(output_menu_items, Patch)
+            operations = output_menu_items.to_plotly_json()["operations"]
+            assert [operation["operation"] for operation in operations] == (
+                ["Append"] * len(expected_menu_items)
+            )
+            for operation, expected_item in zip(operations,
+                                                expected_menu_items):
+                output_item = operation["params"]["value"]
+                assert output_item.children == expected_item.children
+                assert output_item.id == expected_item.id
+                assert output_item.n_clicks == expected_item.n_clicks
+
+        assert output[1:] == expected_output[1:]
+
+
+def test_save_filters_without_session_id():
+    """
+    GIVEN a browser that has not been assigned a session id yet
+    WHEN the save button is clicked
+    THEN the callback does not update
+    """
+    with pytest.raises(PreventUpdate):
+        save_filters(1, "Test Analysis", "Scotland", "2021", 1, None)
+
+
+def test_save_filters_leaves_the_analysis_for_the_last_page():
+    """
+    GIVEN a menu listing a first page of the session's analyses
+    WHEN another analysis is saved
+    THEN the menu is left alone until the last page is listed
+    """
+    for number in range(3):
+        save_analysis("test-session", f"Earlier {number}", "Wales", "2022", 2)
+
+    assert save_filters(
+        1, "Test Analysis", "Scotland", "2021", 1, "test-session", 2
+    ) == (no_update, False, no_update, no_update)
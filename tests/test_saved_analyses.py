@@ -0,0 +1,142 @@
+import pytest
+from dash.exceptions import PreventUpdate
+from saved_analyses import (
+    DuplicateAnalysisName,
+    count_analyses,
+    get_analysis,
+    init_saved_analyses,
+    list_analyses,
+    save_analysis,
+)
+import src.callbacks
+from src.callbacks import (
+    load_more_saved_analyses,
+    load_saved_analyses,
+    load_saved_analysis,
+)
+
+
+@pytest.fixture(autouse=True)
+def saved_analyses_db(tmp_path):
+    """
+    Point the saved analyses repository at an empty database file.
+    """
+    init_saved_analyses(f"sqlite:///{tmp_path / 'saved_analyses.db'}")
+
+
+def test_analyses_are_owned_by_their_session():
+    """
+    GIVEN analyses saved by two sessions
+    WHEN the analyses are counted, looked up and saved again
+    THEN each session sees only its own analyses
+    AND a name may be reused by another session but not the same one
+    """
+    first = save_analysis("session-a", "Wales 2021", "Wales", "2021", 1)
+    save_analysis("session-b", "Wales 2021", "Wales", "2022", 2)
+
+    # Check the analyses are counted per session
+    assert count_analyses("session-a") == 1
+    assert count_analyses("session-b") == 1
+    assert count_analyses("session-c") == 0
+
+    # Check a session cannot read another session's analysis
+    assert get_analysis("session-a", first["id"]) == {
+        "id": first["id"],
+        "name": "Wales 2021",
+        "region": "Wales",
+        "year": "2021",
+        "occupation": 1,
+    }
+    assert get_analysis("session-b", first["id"]) is None
+    assert get_analysis("session-a", 999) is None
+
+    # Check the unique index rejects a duplicate name within a session
+    with pytest.raises(DuplicateAnalysisName):
+        save_analysis("session-a", "Wales 2021", "Wales", "2023", 3)
+    assert count_analyses("session-a") == 1
+
+
+def test_list_analyses_pages_in_save_order():
+    """
+    GIVEN five analyses saved by a session
+    WHEN the analyses are listed a page at a time
+    THEN each page holds the next analyses in the order they were saved
+    """
+    for number in range(5):
+        save_analysis("session-a", f"Analysis {number}", "Wales", "2021", 1)
+
+    pages = [
+        [analysis["name"] for analysis in list_analyses("session-a", offset,
+                                                        limit=2)]
+        for offset in (0, 2, 4)
+    ]
+    assert pages == [
+        ["Analysis 0", "Analysis 1"],
+        ["Analysis 2", "Analysis 3"],
+        ["Analysis 4"],
+    ]
+
+
+def test_saved_analyses_menu_and_loading():
+    """
+    GIVEN an analysis saved by a session
+    WHEN the session's menu is filled and its menu item is clicked
+    THEN the menu holds an item identified by the analysis id
+    AND only a clicked item loads the analysis
+    """
+    saved = save_analysis("session-a", "Wales 2021", "Wales", "2021", 1)
+
+    # Check the menu item is identified by the database id
+    menu_items, listed = load_saved_analyses("session-a")
+    assert [item.id for item in menu_items] == [
+        {"type": "saved-analysis", "index": saved["id"]}
+    ]
+    assert listed == 1
+    assert load_saved_analyses("session-b") == ([], 0)
+
+    # Check filling the menu does not count as a click
+    assert load_saved_analysis("session-a", saved["id"], 0) is None
+    assert load_saved_analysis("session-a", saved["id"], 1)["region"] == (
+        "Wales"
+    )
+
+
+def test_saved_analyses_menu_pages(monkeypatch):
+    """
+    GIVEN five analyses saved by a session and a page size of two
+    WHEN the menu is filled and its "More..." item clicked
+    THEN each click replaces the "More..." item with the next page
+    AND the last page has no "More..." item
+    """
+    monkeypatch.setattr(src.callbacks, "SAVED_ANALYSES_PAGE_SIZE", 2)
+    for number in range(5):
+        save_analysis("session-a", f"Analysis {number}", "Wales", "2021", 1)
+    more_id = {"type": "more-saved-analyses", "index": 0}
+
+    # Check the first page ends with the "More..." item
+    menu_items, listed = load_saved_analyses("session-a")
+    assert [item.children for item in menu_items] == [
+        "Analysis 0", "Analysis 1", "More..."
+    ]
+    assert menu_items[-1].id == more_id
+    assert listed == 2
+
+    # Check a click deletes the "More..." item and appends the next page
+    for expected_names, expected_listed in (
+        (["Analysis 2", "Analysis 3", "More..."], 4),
+        (["Analysis 4"], 5),
+    ):
+        patch, listed_after = load_more_saved_analyses([1], "session-a",
+                                                       listed)
+        operations = patch.to_plotly_json()["operations"]
+        assert operations[0]["operation"] == "Delete"
+        assert operations[0]["location"] == [listed]
+        assert [
+            item.children for item in operations[1]["params"]["value"]
+        ] == expected_names
+        listed = listed_after
+        assert listed == expected_listed
+
+    # Check adding the "More..." item to the menu is not a click
+    with pytest.raises(PreventUpdate):
+        load_more_saved_analyses([0], "session-a", 2)
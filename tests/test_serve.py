@@ -0,0 +1,28 @@
+from serve import parse_args
+from config import SERVER_PORT, SERVER_THREADS
+
+
+def test_parse_args():
+    """
+    GIVEN the production server launcher
+    WHEN it is started
+        1. without options
+        2. with waitress options
+    THEN the settings from config.py are used by default
+    AND the options override them
+    """
+    # Check the defaults come from the configuration
+    args = parse_args([])
+    assert (args.port, args.threads) == (SERVER_PORT, SERVER_THREADS)
+
+    # Check each option is passed through
+    args = parse_args([
+        "--port", "9000", "--threads", "16", "--connection-limit", "500",
+        "--channel-timeout", "30", "--backlog", "2048", "--no-warm",
+    ])
+    assert args.port == 9000
+    assert args.threads == 16
+    assert args.connection_limit == 500
+    assert args.channel_timeout == 30
+    assert args.backlog == 2048
+    assert args.warm is False
@@ -0,0 +1,81 @@
+import gzip
+import brotli
+from dash import Dash, html
+from vendor_assets import (
+    EXTERNAL_SCRIPTS,
+    EXTERNAL_STYLESHEETS,
+    IMMUTABLE_CACHE_CONTROL,
+    fetch_vendor_assets,
+    page_assets,
+    serve_vendored_files,
+)
+
+
+def fake_download(url):
+    """
+    Return made-up content for a URL instead of downloading it.
+    """
+    if url.endswith("bootstrap-icons.css"):
+        return b'@font-face{src:url("./fonts/icons.woff2?abc")}'
+    return f"/* {url} */".encode("utf-8") * 20
+
+
+def test_vendored_assets_are_hashed_and_served(tmp_path):
+    """
+    GIVEN the external stylesheets and scripts vendored into a directory
+    WHEN the page's assets are requested
+        1. with brotli accepted
+        2. with only gzip accepted
+        3. without compression
+    THEN the page loads every asset from its hashed local copy
+    AND each response is the matching variant with immutable caching
+    """
+    manifest = fetch_vendor_assets(tmp_path, download=fake_download)
+
+    # Check every source has a hashed copy with compressed variants
+    sources = EXTERNAL_STYLESHEETS + [s["src"] for s in EXTERNAL_SCRIPTS]
+    assert list(manifest) == sources
+    for name in manifest.values():
+        assert (tmp_path / name).exists()
+        assert (tmp_path / f"{name}.gz").exists()
+        assert (tmp_path / f"{name}.br").exists()
+
+    # Check the page loads the local copies in the original order
+    stylesheets, scripts = page_assets("vendored", tmp_path)
+    assert stylesheets == [
+        f"assets/vendor/{manifest[url]}" for url in EXTERNAL_STYLESHEETS
+    ]
+    assert scripts == [
+        {"src": f"assets/vendor/{manifest[s['src']]}"}
+        for s in EXTERNAL_SCRIPTS
+    ]
+
+    # Check the icon font is vendored and the stylesheet points at it
+    icons_name = manifest[EXTERNAL_STYLESHEETS[1]]
+    icons_css = (tmp_path / icons_name).read_text()
+    font_name = icons_css.split('url("')[1].split('")')[0]
+    assert font_name.startswith("icons.") and font_name.endswith(".woff2")
+    assert (tmp_path / font_name).exists()
+
+    app = Dash(__name__)
+    app.layout = html.Div()
+    serve_vendored_files(app, tmp_path)
+    client = app.server.test_client()
+    url = f"/assets/vendor/{manifest[EXTERNAL_STYLESHEETS[0]]}"
+    original = (tmp_path / manifest[EXTERNAL_STYLESHEETS[0]]).read_bytes()
+
+    # Check each accepted encoding gets its precompressed variant
+    response = client.get(url, headers={"Accept-Encoding": "gzip, br"})
+    assert response.headers["Content-Encoding"] == "br"
+    assert brotli.decompress(response.data) == original
+    response = client.get(url, headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(response.data) == original
+    response = client.get(url)
+    assert "Content-Encoding" not in response.headers
+    assert response.data == original
+    assert response.headers["Cache-Control"] == IMMUTABLE_CACHE_CONTROL
+    assert response.mimetype == "text/css"
+
+    # Check unknown files are still answered by Dash
+    assert client.get("/assets/vendor/missing.css").status_code == 404
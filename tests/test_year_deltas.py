@@ -0,0 +1,105 @@
+import numpy as np
+import pandas as pd
+import pytest
+from filter_data_functions import (
+    get_disparity_cube,
+    get_year_deltas,
+    prepare_year_pivot_df,
+    year_disparity_table,
+)
+from year_deltas import compute_year_deltas, rolling_year_mean, year_panel
+
+
+def test_prepare_year_pivot_df_matches_pivot_table():
+    """
+    GIVEN the prepared disparity dataframe
+    WHEN the year pivot table is prepared with the default years
+    THEN it matches the original pivot_table of 2023 minus 2021
+    AND the cached whole-dataset table is the same
+    """
+    cube, _ = get_disparity_cube()
+    expected = cube.pivot_table(
+        index=['Region', 'Occupation Type'],
+        columns='Year',
+        values='Total Employment',
+        fill_value=0,
+        observed=True
+    ).reset_index()
+    expected['Year Disparity'] = expected[2023] - expected[2021]
+
+    pd.testing.assert_frame_equal(prepare_year_pivot_df(cube), expected)
+    pd.testing.assert_frame_equal(year_disparity_table(), expected)
+
+
+def test_compute_year_deltas_for_every_pair():
+    """
+    GIVEN a panel of values for three years
+    WHEN the year deltas are computed
+    THEN every pair of years has its change and percentage change
+    AND a zero start value gives a NaN percentage change
+    """
+    panel = year_panel(pd.DataFrame({
+        'Region': ['Wales'] * 3,
+        'Year': [2021, 2022, 2023],
+        'Occupation Type': ['1: managers'] * 3,
+        'Total Employment': [0.0, 10.0, 15.0],
+    }))
+    deltas = compute_year_deltas(panel)
+
+    # Check each pair of years and its change
+    assert list(zip(deltas['Start Year'], deltas['End Year'])) == [
+        (2021, 2022), (2021, 2023), (2022, 2023)
+    ]
+    assert deltas['Change'].tolist() == [10.0, 15.0, 5.0]
+    assert np.isnan(deltas['Percentage Change'][0])
+    assert deltas['Percentage Change'][2] == 50.0
+
+    # Check the rolling mean over two years
+    rolling = rolling_year_mean(panel, 2)
+    assert rolling[2022].tolist() == [5.0]
+    assert rolling[2023].tolist() == [12.5]
+
+
+def test_year_disparity_table_reads_the_cached_deltas():
+    """
+    GIVEN the cached year deltas of the whole dataset
+    WHEN the year disparity table is requested for a pair of years
+    THEN its year disparity is the pair's change in the deltas
+    AND equals the difference of the two years' employment
+    """
+    deltas = get_year_deltas()["deltas"]
+    table = year_disparity_table(2021, 2022)
+    pair = deltas[
+        (deltas['Start Year'] == 2021) & (deltas['End Year'] == 2022)
+    ]
+    np.testing.assert_array_equal(
+        table['Year Disparity'].to_numpy(), pair['Change'].to_numpy()
+    )
+    np.testing.assert_allclose(
+        table['Year Disparity'].to_numpy(),
+        (table[2022] - table[2021]).to_numpy()
+    )
+
+
+def test_year_disparity_table_for_any_pair_of_years():
+    """
+    GIVEN the cached year deltas of the whole dataset
+    WHEN the year disparity table is requested
+        1. from a later year back to an earlier one
+        2. for a year the dataset does not have
+    THEN the backwards change matches the year pivot table
+    AND a missing year is rejected with a ValueError naming it
+    """
+    cube, _ = get_disparity_cube()
+    pd.testing.assert_frame_equal(
+        year_disparity_table(2023, 2021),
+        prepare_year_pivot_df(cube, 2023, 2021)
+    )
+    pd.testing.assert_series_equal(
+        year_disparity_table(2023, 2021)['Year Disparity'],
+        -year_disparity_table(2021, 2023)['Year Disparity']
+    )
+
+    for start_year, end_year in ((2021, 2024), (2019, 2023)):
+        with pytest.raises(ValueError, match=r"Year 20(24|19) is not in"):
+            year_disparity_table(start_year, end_year)